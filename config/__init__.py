@@ -0,0 +1,4 @@
+# Make sure the Celery app is loaded when Django starts, so `shared_task`s use it
+from .celery import celery as celery_app
+
+__all__ = ('celery_app', )
@@ -3,6 +3,11 @@ from celery import Celery
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.django.local')
 
-celery = Celery('config')
-celery.config_from_object('django.conf:django', namespace='CELERY')
+# `config.tasks` isn't in an installed app, `autodiscover_tasks` doesn't find it
+celery = Celery(
+    'config',
+    include=['config.tasks'],
+    task_cls='orgniaztional_ticking_api.common.celery_metrics:InstrumentedTask',
+)
+celery.config_from_object('django.conf:settings', namespace='CELERY')
 celery.autodiscover_tasks()
\ No newline at end of file
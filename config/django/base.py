@@ -45,6 +45,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'orgniaztional_ticking_api.api.middleware.MetricsMiddleware',
+    'orgniaztional_ticking_api.api.middleware.QueryBudgetMiddleware',
+    'orgniaztional_ticking_api.api.middleware.DatabaseStickinessMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -96,22 +99,50 @@ if os.environ.get('GITHUB_WORKFLOW'):
         }
     }
 
+# Read replicas, see `orgniaztional_ticking_api.common.routers.PrimaryReplicaRouter`.
+# To try it locally, point a replica at the same database, e.g. DATABASE_REPLICA_URLS=sqlite:////abs/path/db.sqlite3
+DATABASE_REPLICAS = []
+
+for index, url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[])):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **env.db_url_config(url),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+# Persistent connections, in seconds (0 closes the connection after every request / task, None never does).
+# Set it per process type, see `Procfile`. Every gunicorn worker thread and Celery worker process keeps
+# one connection per alias, keep `workers * threads` under the database's (or pgbouncer's) connection limit.
+DATABASE_CONN_MAX_AGE = env(
+    'DATABASE_CONN_MAX_AGE',
+    cast=lambda value: None if value == 'None' else int(value),
+    default=0,
+)
+# Checks that a reused connection is still alive before a request / task uses it, if it was idle
+# for that many seconds, see `common.db.close_unusable_connections`
+DATABASE_CONN_HEALTH_CHECKS = env.bool('DATABASE_CONN_HEALTH_CHECKS', default=True)
+DATABASE_CONN_HEALTH_CHECK_IDLE_SECONDS = env.int('DATABASE_CONN_HEALTH_CHECK_IDLE_SECONDS', default=30)
+
+for database in DATABASES.values():
+    database['CONN_MAX_AGE'] = DATABASE_CONN_MAX_AGE
+
+DATABASE_ROUTERS = ['orgniaztional_ticking_api.common.routers.PrimaryReplicaRouter']
+# After a write, the user's reads stay on the primary for this many seconds, so they see their own writes
+DATABASE_STICKY_SECONDS = env.int('DATABASE_STICKY_SECONDS', default=5)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
+# One single pass validator for the whole policy, see `orgniaztional_ticking_api.users.validators.PasswordPolicy`.
+# It covers what Django's similarity, minimum length, common and numeric validators checked.
 AUTH_PASSWORD_VALIDATORS = [
     {
-        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+        'NAME': 'orgniaztional_ticking_api.users.validators.PasswordPolicy',
+        'OPTIONS': {
+            'min_length': 10,
+        },
     },
 ]
 AUTH_USER_MODEL = 'users.BaseUser'
@@ -158,6 +189,20 @@ CACHES = {
 # Cache time to live is 15 minutes.
 CACHE_TTL = 60 * 15
 
+# Buffer `Profile` counter increments in Redis, they are written to Postgres by the `profile_counters_flush` task
+PROFILE_COUNTERS_BUFFERED = env.bool("PROFILE_COUNTERS_BUFFERED", default=True)
+# Seconds a flush may hold its lock, longer than a flush takes
+PROFILE_COUNTERS_FLUSH_LOCK_TIMEOUT = env.int("PROFILE_COUNTERS_FLUSH_LOCK_TIMEOUT", default=60)
+# `Profile` counter field -> dotted path to a callable returning `(user_id, count)` pairs with the true values.
+# Used by the `profile_counters_reconcile` task, counters without a source are left as they are.
+PROFILE_COUNTER_SOURCES = {}
+
+# Bloom filter of registered emails in Redis, so registration only looks up emails that may be taken.
+# The capacity sizes the filter, it's rebuilt daily by the `email_bloom_rebuild` task.
+USERS_EMAIL_BLOOM_ENABLED = env.bool("USERS_EMAIL_BLOOM_ENABLED", default=True)
+USERS_EMAIL_BLOOM_CAPACITY = env.int("USERS_EMAIL_BLOOM_CAPACITY", default=1_000_000)
+USERS_EMAIL_BLOOM_ERROR_RATE = env.float("USERS_EMAIL_BLOOM_ERROR_RATE", default=0.001)
+
 
 APP_DOMAIN = env("APP_DOMAIN", default="http://localhost:8000")
 
@@ -168,5 +213,8 @@ from config.settings.jwt import *  # noqa
 from config.settings.sessions import *  # noqa
 from config.settings.celery import *  # noqa
 from config.settings.swagger import *  # noqa
+from config.settings.hashing import *  # noqa
+from config.settings.query_budget import *  # noqa
+from config.settings.metrics import *  # noqa
 #from config.settings.sentry import *  # noqa
 #from config.settings.email_sending import *  # noqa
\ No newline at end of file
@@ -4,10 +4,19 @@ from .base import *  # noqa
 
 DEBUG = False
 PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+PASSWORD_HASHING_BACKEND = 'orgniaztional_ticking_api.users.hashing.InlineHashingExecutor'
 
 CELERY_BROKER_BACKEND = "memory"
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_RESULT_BACKEND = "cache+memory://"
+
+PROFILE_COUNTERS_BUFFERED = False
+# Need Redis
+JWT_DENYLIST_ENABLED = False
+USERS_EMAIL_BLOOM_ENABLED = False
+
+QUERY_BUDGET_RAISE = True
 
 CACHES = {
     "default": {
@@ -16,8 +25,15 @@ CACHES = {
 }
 
 DATABASES = {
-        "default": {
+    "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": "db.sqlite3",
-        }
-    }
+        # As in base, query counts include the request's transaction
+        "ATOMIC_REQUESTS": True,
+    },
+    # Second database for `common.tests.test_routers`, only a replica where a test adds it to `DATABASE_REPLICAS`
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": "replica.sqlite3",
+    },
+}
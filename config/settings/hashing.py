@@ -0,0 +1,54 @@
+from config.env import env
+
+# Where password hashing runs, see `orgniaztional_ticking_api.users.hashing`:
+#   - ...ThreadPoolHashingExecutor: threads in each web process
+#   - ...ProcessPoolHashingExecutor: processes owned by each web process
+#   - ...CeleryHashingExecutor: Celery workers consuming PASSWORD_HASHING_CELERY_QUEUE
+PASSWORD_HASHING_BACKEND = env(
+    "PASSWORD_HASHING_BACKEND",
+    default="orgniaztional_ticking_api.users.hashing.ThreadPoolHashingExecutor"
+)
+
+# Hashing calls running at the same time, per process.
+# PBKDF2 releases the GIL, so this bounds how many CPU cores password hashing can take.
+PASSWORD_HASHING_MAX_WORKERS = env.int("PASSWORD_HASHING_MAX_WORKERS", default=4)
+# Hashing calls allowed to wait for a worker, per process. Anything beyond gets a 503.
+PASSWORD_HASHING_MAX_PENDING = env.int("PASSWORD_HASHING_MAX_PENDING", default=16)
+# Seconds a hashing call may take, queueing included, before it gets a 503.
+PASSWORD_HASHING_TIMEOUT = env.float("PASSWORD_HASHING_TIMEOUT", default=5.0)
+
+PASSWORD_HASHING_CELERY_QUEUE = env("PASSWORD_HASHING_CELERY_QUEUE", default="hashing")
+
+# Hasher profiles, pick one with PASSWORD_HASHER_PROFILE.
+# Run `python manage.py benchmark_hashers` to find parameters that fit a latency budget on your machines.
+# Hashes made with another profile or other parameters are re-hashed on the next successful login.
+PASSWORD_HASHER_PROFILE = env("PASSWORD_HASHER_PROFILE", default="pbkdf2")
+PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": {
+        "HASHER": "orgniaztional_ticking_api.users.hashers.TunedPBKDF2PasswordHasher",
+        "PARAMS": {
+            "iterations": env.int("PASSWORD_PBKDF2_ITERATIONS", default=320_000),
+        },
+    },
+    "argon2": {
+        "HASHER": "orgniaztional_ticking_api.users.hashers.TunedArgon2PasswordHasher",
+        "PARAMS": {
+            "time_cost": env.int("PASSWORD_ARGON2_TIME_COST", default=2),
+            "memory_cost": env.int("PASSWORD_ARGON2_MEMORY_COST", default=102_400),  # KiB
+            "parallelism": env.int("PASSWORD_ARGON2_PARALLELISM", default=8),
+        },
+    },
+}
+
+# The preferred hasher first, the rest are only there to verify (and then upgrade) existing hashes
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]["HASHER"],
+    *[
+        profile["HASHER"]
+        for name, profile in PASSWORD_HASHER_PROFILES.items()
+        if name != PASSWORD_HASHER_PROFILE
+    ],
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
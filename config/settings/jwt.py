@@ -1,4 +1,5 @@
 import datetime
+from pathlib import Path
 
 from config.env import env
 
@@ -24,3 +25,47 @@ JWT_AUTH = {
 
     "JWT_AUTH_HEADER_PREFIX": JWT_AUTH_HEADER_PREFIX
 }
+
+
+# djangorestframework-simplejwt
+# https://django-rest-framework-simplejwt.readthedocs.io/en/latest/settings.html
+SIMPLE_JWT = {
+    "TOKEN_OBTAIN_SERIALIZER": "orgniaztional_ticking_api.authentication.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "orgniaztional_ticking_api.authentication.serializers.TokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "orgniaztional_ticking_api.authentication.serializers.TokenVerifySerializer",
+    # Used refresh tokens are revoked in the denylist below
+    "ROTATE_REFRESH_TOKENS": True,
+    "AUTH_TOKEN_CLASSES": ("orgniaztional_ticking_api.authentication.tokens.AccessToken",),
+}
+
+# HS256 signs with SECRET_KEY. With an asymmetric algorithm (RS256, ES256...) tokens are signed with the private key,
+# and the public key is published at `jwt/jwks/` so other services can verify tokens without calling the API.
+JWT_ALGORITHM = env("JWT_ALGORITHM", default="HS256")
+JWT_SIGNING_KEY_ID = env("JWT_SIGNING_KEY_ID", default="default")
+JWT_JWKS_MAX_AGE = env.int("JWT_JWKS_MAX_AGE", default=60 * 5)
+
+if not JWT_ALGORITHM.startswith("HS"):
+    SIMPLE_JWT.update({
+        "ALGORITHM": JWT_ALGORITHM,
+        "SIGNING_KEY": Path(env("JWT_PRIVATE_KEY_PATH")).read_text(),
+        "VERIFYING_KEY": Path(env("JWT_PUBLIC_KEY_PATH")).read_text(),
+    })
+
+# Verified tokens cached in-process by `authentication.signing.CachedTokenBackend`, never past their `exp`.
+# The TTL caps how long one entry is kept, 0 disables the cache.
+JWT_VERIFY_CACHE_SIZE = env.int("JWT_VERIFY_CACHE_SIZE", default=10_000)
+JWT_VERIFY_CACHE_TTL = env.int("JWT_VERIFY_CACHE_TTL", default=60 * 5)
+
+# How long `JWTTokenUserAuthentication` caches a user's `is_active` flag, in seconds: how long a deactivated
+# user keeps access with tokens issued before. 0 disables the check, the token's claims are trusted until it expires.
+JWT_TOKEN_USER_REVOCATION_CHECK_TTL = env.int("JWT_TOKEN_USER_REVOCATION_CHECK_TTL", default=30)
+
+# Revoked tokens, see `authentication.denylist`
+JWT_DENYLIST_ENABLED = env.bool("JWT_DENYLIST_ENABLED", default=True)
+JWT_DENYLIST_CACHE_ALIAS = env("JWT_DENYLIST_CACHE_ALIAS", default="default")
+# How often each process pulls the revocations made by the others, in seconds
+JWT_DENYLIST_SYNC_INTERVAL = env.float("JWT_DENYLIST_SYNC_INTERVAL", default=1.0)
+# How often each process rebuilds its Bloom filter without the expired revocations, in seconds
+JWT_DENYLIST_REBUILD_INTERVAL = env.int("JWT_DENYLIST_REBUILD_INTERVAL", default=60 * 60)
+JWT_DENYLIST_BLOOM_CAPACITY = env.int("JWT_DENYLIST_BLOOM_CAPACITY", default=100_000)
+JWT_DENYLIST_BLOOM_ERROR_RATE = env.float("JWT_DENYLIST_BLOOM_ERROR_RATE", default=0.001)
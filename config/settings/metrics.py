@@ -0,0 +1,7 @@
+from config.env import env
+
+# See `orgniaztional_ticking_api.api.metrics.metrics_view`.
+# Under gunicorn `PROMETHEUS_MULTIPROC_DIR` is set by `gunicorn.conf.py`, so /metrics adds up all the workers.
+
+# When set, /metrics requires an `Authorization: Bearer <METRICS_TOKEN>` header
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
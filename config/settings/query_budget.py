@@ -0,0 +1,12 @@
+from config.env import env
+
+# See `orgniaztional_ticking_api.api.middleware.QueryBudgetMiddleware`
+
+# Budget for views that don't set their own, None means no budget
+QUERY_BUDGET_DEFAULT = env.int("QUERY_BUDGET_DEFAULT", default=None)
+# Raise `QueryBudgetExceeded` when a view goes over its budget, instead of logging a warning
+QUERY_BUDGET_RAISE = env.bool("QUERY_BUDGET_RAISE", default=False)
+# Log query shapes repeated this many times in a single request
+QUERY_N_PLUS_ONE_THRESHOLD = env.int("QUERY_N_PLUS_ONE_THRESHOLD", default=5)
+
+SERVER_TIMING_HEADER = env.bool("SERVER_TIMING_HEADER", default=True)
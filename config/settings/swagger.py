@@ -2,5 +2,7 @@ SPECTACULAR_SETTINGS = {
     'TITLE': 'orgniaztional_ticking_api API',
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
+    # Base classes whose docstrings aren't used as descriptions of the serializers extending them
+    'GET_LIB_DOC_EXCLUDES': 'orgniaztional_ticking_api.api.serializers.get_lib_doc_excludes',
 }
 
@@ -1,8 +1,29 @@
-from time import sleep
+import logging
+
 from celery import shared_task
 
+from orgniaztional_ticking_api.common.fanout import FanOut
+from orgniaztional_ticking_api.users.models import BaseUser
+
+logger = logging.getLogger(__name__)
+
+
+class NotifyCustomers(FanOut):
+    chunk_size = 500
+    parallelism = 8
+
+    def get_queryset(self, *, message):
+        return BaseUser.objects.filter(is_active=True)
+
+    def process_chunk(self, pks, *, message):
+        emails = BaseUser.objects.filter(pk__in=pks).values_list("email", flat=True)
+
+        for email in emails:
+            logger.info("Notifying %s: %s", email, message)
+
+        return len(emails)
+
 
 @shared_task
 def notify_customers(message):
-    print(message)
-    sleep(10)
\ No newline at end of file
+    NotifyCustomers().start(message=message)
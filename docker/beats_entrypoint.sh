@@ -4,5 +4,5 @@ echo "--> Waiting for db to be ready"
 ./wait-for-it.sh db:5432
 
 echo "--> Starting beats process"
-celery -A orgniaztional_ticking_api.tasks beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler
+celery -A config beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler
 
@@ -0,0 +1,20 @@
+# Loaded by gunicorn from the working directory, for every `gunicorn` command in this project.
+import os
+import shutil
+
+
+def on_starting(server):
+    # Every worker writes its Prometheus metrics here and /metrics adds them up. One directory per master,
+    # so gunicorns running side by side (scripts/compare_*.sh) don't mix, and a restart starts from zero.
+    path = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", f"/tmp/prometheus-gunicorn-{os.getpid()}")
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # Not imported at the top, `prometheus_client` picks its storage on import, it must see the directory
+    from prometheus_client import multiprocess
+
+    # Drops the dead worker's live gauges (requests in flight, open database connections)
+    multiprocess.mark_process_dead(worker.pid)
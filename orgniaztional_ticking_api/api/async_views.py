@@ -0,0 +1,79 @@
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse
+
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions, status
+
+from orgniaztional_ticking_api.authentication.backends import JWTTokenUserAuthentication
+from orgniaztional_ticking_api.common.db import read_only as read_only_context
+from orgniaztional_ticking_api.core.exceptions import ServiceUnavailableError
+
+
+def async_api_view(*, methods, read_only=False):
+    """
+    Turns an `async def view(request, data)` into a Django view that can be served natively under ASGI.
+
+    DRF 3.13 views are sync only, so this covers the bits of `APIView` the async endpoints need:
+    method check, JSON object body parsing and rendering `APIException`s. The view is exempt from CSRF
+    (authentication is token based) and from `ATOMIC_REQUESTS`, which Django doesn't support for async views.
+    `read_only` views run in `common.db.read_only`, like `read_only_api` views.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                return JsonResponse(
+                    {"detail": f'Method "{request.method}" not allowed.'},
+                    status=status.HTTP_405_METHOD_NOT_ALLOWED
+                )
+
+            try:
+                data = json.loads(request.body or b"{}")
+            except ValueError:
+                return JsonResponse({"detail": "JSON parse error"}, status=status.HTTP_400_BAD_REQUEST)
+
+            if not isinstance(data, dict):
+                return JsonResponse({"detail": "JSON body must be an object"}, status=status.HTTP_400_BAD_REQUEST)
+
+            try:
+                if read_only:
+                    with read_only_context():
+                        return await view(request, data, *args, **kwargs)
+
+                return await view(request, data, *args, **kwargs)
+            except exceptions.APIException as exc:
+                detail = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+                return JsonResponse(detail, status=exc.status_code, safe=False)
+            except ServiceUnavailableError as exc:
+                return JsonResponse({"detail": exc.message}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        # `csrf_exempt` in Django 4.0 hides that the view is a coroutine, so set the flag directly
+        wrapper.csrf_exempt = True
+
+        return transaction.non_atomic_requests(wrapper)
+
+    return decorator
+
+
+async def authenticate(request):
+    """
+    Async counterpart of `ApiTokenUserAuthMixin`, raises `NotAuthenticated` for anonymous requests.
+    """
+    authentication = JWTTokenUserAuthentication()
+
+    if settings.JWT_TOKEN_USER_REVOCATION_CHECK_TTL:
+        # The revocation check may query the database
+        result = await sync_to_async(authentication.authenticate)(request)
+    else:
+        result = authentication.authenticate(request)
+
+    if result is None:
+        raise exceptions.NotAuthenticated()
+
+    user, _ = result
+
+    return user
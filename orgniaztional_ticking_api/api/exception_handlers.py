@@ -6,7 +6,19 @@ from rest_framework import exceptions
 from rest_framework.serializers import as_serializer_error
 from rest_framework.response import Response
 
-from orgniaztional_ticking_api.core.exceptions import ApplicationError
+from orgniaztional_ticking_api.core.exceptions import ApplicationError, ConflictError, ServiceUnavailableError
+
+
+class ServiceUnavailable(exceptions.APIException):
+    status_code = 503
+    default_detail = 'Service temporarily unavailable, try again later.'
+    default_code = 'service_unavailable'
+
+
+class Conflict(exceptions.APIException):
+    status_code = 409
+    default_detail = 'The request conflicts with the current state of the resource.'
+    default_code = 'conflict'
 
 
 def drf_default_with_modifications_exception_handler(exc, ctx):
@@ -19,6 +31,12 @@ def drf_default_with_modifications_exception_handler(exc, ctx):
     if isinstance(exc, PermissionDenied):
         exc = exceptions.PermissionDenied()
 
+    if isinstance(exc, ServiceUnavailableError):
+        exc = ServiceUnavailable(exc.message)
+
+    if isinstance(exc, ConflictError):
+        exc = Conflict(exc.message)
+
     response = exception_handler(exc, ctx)
 
     # If unexpected error occurs (server error, etc.)
@@ -49,6 +67,12 @@ def hacksoft_proposed_exception_handler(exc, ctx):
     if isinstance(exc, PermissionDenied):
         exc = exceptions.PermissionDenied()
 
+    if isinstance(exc, ServiceUnavailableError):
+        exc = ServiceUnavailable(exc.message)
+
+    if isinstance(exc, ConflictError):
+        exc = Conflict(exc.message)
+
     response = exception_handler(exc, ctx)
 
     # If unexpected error occurs (server error, etc.)
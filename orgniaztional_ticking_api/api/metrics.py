@@ -0,0 +1,34 @@
+import os
+from secrets import compare_digest
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+from orgniaztional_ticking_api.api.mixins import read_only_api
+
+
+def get_registry():
+    """
+    With `PROMETHEUS_MULTIPROC_DIR` every process writes its metrics to files there, and they are
+    added up at scrape time. Otherwise only the metrics of the process answering are available.
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return registry
+
+
+@read_only_api
+def metrics_view(request):
+    if settings.METRICS_TOKEN:
+        authorization = request.headers.get("Authorization", "")
+
+        if not compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+            return HttpResponse(status=401)
+
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
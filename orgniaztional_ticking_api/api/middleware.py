@@ -0,0 +1,281 @@
+import asyncio
+import logging
+from collections import Counter
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+
+from asgiref.sync import sync_to_async
+from prometheus_client import Counter as PrometheusCounter
+from prometheus_client import Gauge, Histogram
+
+from orgniaztional_ticking_api.common.db import request_state
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUESTS = PrometheusCounter(
+    "http_requests_total",
+    "Requests, by method, route and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Request latency, by method and route.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per request, by method and route.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being handled.",
+    multiprocess_mode="livesum",
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(limit):
+    """
+    Sets the maximum number of queries a function based view may run, see `QueryBudgetMiddleware`.
+    Class based views set a `query_budget` attribute instead.
+    """
+    def decorator(view):
+        view.query_budget = limit
+        return view
+
+    return decorator
+
+
+class QueryStats:
+    """
+    `execute_wrapper` that records the queries run through it.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - start
+            self.count += 1
+            # Parameters are passed separately, so `sql` is the query shape
+            self.shapes[sql] += 1
+
+    def repeated(self, threshold):
+        return [(sql, count) for sql, count in self.shapes.most_common() if count >= threshold]
+
+
+class BaseMiddleware:
+    """
+    Middleware that runs in both WSGI and ASGI stacks without Django adapting it, like `MiddlewareMixin`.
+
+    Subclasses implement `__call__` for sync and `__acall__` for async `get_response`.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+
+        if self.is_async:
+            # As `MiddlewareMixin` does on Django 4.0 (`markcoroutinefunction` later), so the handler awaits `__call__`
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+class MetricsMiddleware(BaseMiddleware):
+    """
+    Prometheus metrics for every request, served by `api.metrics.metrics_view`.
+
+    Routes are labelled with their URL pattern (`api/users/profile/`), not the path, to keep the number
+    of series bounded. Must come before `QueryBudgetMiddleware`, it reads `request.query_stats`.
+    """
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+
+        try:
+            response = self.get_response(request)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+        self.observe(request, response, perf_counter() - start)
+
+        return response
+
+    async def __acall__(self, request):
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+        self.observe(request, response, perf_counter() - start)
+
+        return response
+
+    def observe(self, request, response, duration):
+        method = request.method
+        route = self.get_route(request)
+
+        HTTP_REQUESTS.labels(method, route, response.status_code).inc()
+        HTTP_REQUEST_DURATION.labels(method, route).observe(duration)
+
+        stats = getattr(request, "query_stats", None)
+
+        if stats is not None:
+            HTTP_REQUEST_QUERIES.labels(method, route).observe(stats.count)
+
+    def get_route(self, request):
+        resolver_match = getattr(request, "resolver_match", None)
+
+        if resolver_match is None:
+            return UNMATCHED_ROUTE
+
+        return resolver_match.route
+
+
+class QueryBudgetMiddleware(BaseMiddleware):
+    """
+    Counts the queries and the time spent in the database for every request.
+
+    - Adds a `Server-Timing` header (`db` and `total` durations), with `SERVER_TIMING_HEADER`.
+    - Logs query shapes repeated `QUERY_N_PLUS_ONE_THRESHOLD` times or more, the usual sign of an N+1.
+    - Enforces the view's query budget: a `query_budget` attribute on the view class (or the `query_budget`
+      decorator on function views), falling back to `QUERY_BUDGET_DEFAULT`.
+      Going over the budget raises `QueryBudgetExceeded` with `QUERY_BUDGET_RAISE` (tests), or logs otherwise.
+    """
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        stats = QueryStats()
+        request.query_stats = stats
+
+        start = perf_counter()
+
+        with self.wrap_connections(stats):
+            response = self.get_response(request)
+
+        return self.process_stats(request, response, stats, perf_counter() - start)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        request.query_stats = stats
+
+        start = perf_counter()
+
+        # Connections are per thread, wrap the ones of the thread `sync_to_async` runs the request's queries in
+        stack = await sync_to_async(self.wrap_connections)(stats)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+
+        return self.process_stats(request, response, stats, perf_counter() - start)
+
+    def wrap_connections(self, stats):
+        stack = ExitStack()
+
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+
+        return stack
+
+    def process_stats(self, request, response, stats, total):
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = (
+                f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                f'total;dur={total * 1000:.2f}'
+            )
+
+        self.check_repeated(request, stats)
+        self.check_budget(request, stats)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = self.get_budget(view_func)
+
+    def get_budget(self, view_func):
+        # DRF's `as_view` sets `cls`, Django's sets `view_class`
+        for view in (view_func, getattr(view_func, "cls", None), getattr(view_func, "view_class", None)):
+            budget = getattr(view, "query_budget", None)
+
+            if budget is not None:
+                return budget
+
+        return settings.QUERY_BUDGET_DEFAULT
+
+    def check_repeated(self, request, stats):
+        for sql, count in stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD):
+            logger.warning("Possible N+1 on %s %s, query run %s times: %s", request.method, request.path, count, sql)
+
+    def check_budget(self, request, stats):
+        budget = getattr(request, "query_budget", None)
+
+        if budget is None or stats.count <= budget:
+            return
+
+        message = f"{request.method} {request.path} ran {stats.count} queries, the budget is {budget}"
+
+        if settings.QUERY_BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+
+        logger.warning(message)
+
+
+class DatabaseStickinessMiddleware(BaseMiddleware):
+    """
+    Tracks the request for `common.routers.PrimaryReplicaRouter`: after a request that wrote,
+    the user's reads stay on the primary for `DATABASE_STICKY_SECONDS`.
+    """
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        with request_state(request) as state:
+            response = self.get_response(request)
+            state.save()
+
+        return response
+
+    async def __acall__(self, request):
+        with request_state(request) as state:
+            response = await self.get_response(request)
+            # Reads `request.user` and writes to the cache
+            await sync_to_async(state.save)()
+
+        return response
@@ -1,3 +1,4 @@
+from functools import wraps
 from typing import Sequence, Type, TYPE_CHECKING
 
 from importlib import import_module
@@ -5,11 +6,13 @@ from importlib import import_module
 from django.conf import settings
 
 from django.contrib import auth
+from django.db import transaction
 
 from rest_framework.permissions import IsAuthenticated, BasePermission
 from rest_framework.authentication import BaseAuthentication
 
-from rest_framework_simplejwt.authentication import JWTAuthentication 
+from orgniaztional_ticking_api.authentication.backends import JWTAuthentication, JWTTokenUserAuthentication
+from orgniaztional_ticking_api.common.db import read_only
 
 
 def get_auth_header(headers):
@@ -33,8 +36,45 @@ else:
     PermissionClassesType = Sequence[Type[BasePermission]]
 
 
+def read_only_api(view):
+    """
+    Opts a view out of `ATOMIC_REQUESTS`, so GETs don't hold a connection in a transaction for the
+    whole view, and marks its queries as read only (see `common.db.read_only`).
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with read_only():
+            return view(*args, **kwargs)
+
+    for alias in settings.DATABASES:
+        wrapper = transaction.non_atomic_requests(using=alias)(wrapper)
+
+    return wrapper
+
+
 class ApiAuthMixin:
     authentication_classes: Sequence[Type[BaseAuthentication]] = [
             JWTAuthentication,
     ]
     permission_classes: PermissionClassesType = (IsAuthenticated, )
+    # Read only views skip `ATOMIC_REQUESTS`, see `read_only_api`
+    read_only: bool = False
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        if cls.read_only:
+            view = read_only_api(view)
+
+        return view
+
+
+class ApiTokenUserAuthMixin(ApiAuthMixin):
+    """
+    `request.user` is a `TokenUser` built from the token claims, no user query per request.
+    Use `request.user.user` (loaded lazily) when the view needs the actual `BaseUser`.
+    """
+    authentication_classes: Sequence[Type[BaseAuthentication]] = [
+            JWTTokenUserAuthentication,
+    ]
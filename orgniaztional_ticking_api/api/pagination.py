@@ -1,11 +1,32 @@
 from collections import OrderedDict
 
-from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
+from django.core import signing
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination as _LimitOffsetPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def prepare_queryset(*, paginator, serializer_class, queryset):
+    """
+    `.values()` rows instead of model instances for serializers that read those, see
+    `api.serializers.ReadOnlyModelSerializer`. The paginator may need more columns for its links.
+    """
+    if not getattr(serializer_class, 'use_values', False):
+        return queryset
+
+    extra_fields = paginator.get_values_fields() if hasattr(paginator, 'get_values_fields') else ()
+
+    return serializer_class.prepare_queryset(queryset, extra_fields=extra_fields)
 
 
 def get_paginated_response(*, pagination_class, serializer_class, queryset, request, view):
     paginator = pagination_class()
+    queryset = prepare_queryset(paginator=paginator, serializer_class=serializer_class, queryset=queryset)
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
@@ -17,8 +38,10 @@ def get_paginated_response(*, pagination_class, serializer_class, queryset, requ
 
     return Response(data=serializer.data)
 
+
 def get_paginated_response_context(*, pagination_class, serializer_class, queryset, request, view):
     paginator = pagination_class()
+    queryset = prepare_queryset(paginator=paginator, serializer_class=serializer_class, queryset=queryset)
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
@@ -58,3 +81,198 @@ class LimitOffsetPagination(_LimitOffsetPagination):
             ('previous', self.get_previous_link()),
             ('results', data)
         ]))
+
+
+def estimate_count(queryset):
+    """
+    Cheap row count for a queryset.
+
+    For unfiltered querysets on Postgres we read the planner estimate (`pg_class.reltuples`),
+    which is kept fresh by autovacuum / ANALYZE and costs nothing compared to `COUNT(*)`.
+    Everything else falls back to an exact count.
+    """
+    connection = connections[queryset.db]
+
+    if connection.vendor == "postgresql" and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+
+        # `reltuples` is -1 for tables that were never vacuumed / analyzed
+        if row is not None and row[0] >= 0:
+            return row[0]
+
+    return queryset.count()
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over `BaseModel.created_at` with the primary key as a tiebreaker.
+
+    Pages are fetched with `WHERE (created_at, id) < (%s, %s) ORDER BY created_at DESC, id DESC LIMIT n`,
+    which is served straight from the `created_at` index, so page 100000 costs the same as page 1.
+    Cursors are signed, so clients can't forge positions.
+
+    `count_mode` controls the `count` key of the response:
+        - None: no count at all (default, the cheapest)
+        - "estimate": see `estimate_count`
+        - "exact": plain `COUNT(*)`
+
+    It is a drop-in for `LimitOffsetPagination` in `get_paginated_response` / `get_paginated_response_context`:
+
+        return get_paginated_response(
+            pagination_class=KeysetPagination,
+            ...
+        )
+    """
+    default_limit = 10
+    max_limit = 50
+    limit_query_param = 'limit'
+    cursor_query_param = 'cursor'
+    count_mode = None
+    ordering_field = 'created_at'
+    signing_salt = 'orgniaztional_ticking_api.api.pagination.KeysetPagination'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count = self.get_count(queryset)
+
+        position, reverse = self.decode_cursor(request)
+        field = self.ordering_field
+
+        if reverse:
+            queryset = queryset.order_by(field, 'pk')
+        else:
+            queryset = queryset.order_by(f'-{field}', '-pk')
+
+        if position is not None:
+            value, pk = position
+            lookup = 'gt' if reverse else 'lt'
+            # The inclusive bound lets the planner use a range scan on the index,
+            # the OR only breaks ties between rows that share a timestamp.
+            queryset = queryset.filter(**{f'{field}__{lookup}e': value}).filter(
+                Q(**{f'{field}__{lookup}': value}) | Q(**{f'pk__{lookup}': pk})
+            )
+
+        # Fetch one extra row, so we know if there is another page in that direction
+        results = list(queryset[:self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[:self.limit]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+
+        return results
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+
+        if limit <= 0:
+            return self.default_limit
+
+        return min(limit, self.max_limit)
+
+    def get_count(self, queryset):
+        if self.count_mode == 'exact':
+            return queryset.count()
+
+        if self.count_mode == 'estimate':
+            return estimate_count(queryset)
+
+        return None
+
+    def get_values_fields(self):
+        # What `get_position` reads from `.values()` rows
+        return (self.ordering_field, 'pk')
+
+    def get_position(self, item):
+        if isinstance(item, dict):
+            return item[self.ordering_field], item['pk'] if 'pk' in item else item['id']
+
+        return getattr(item, self.ordering_field), item.pk
+
+    def get_cursor(self, item, reverse):
+        value, pk = self.get_position(item)
+        return signing.dumps([value.isoformat(), pk, reverse], salt=self.signing_salt, compress=True)
+
+    def encode_cursor(self, item, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.get_cursor(item, reverse))
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+
+        if not token:
+            return None, False
+
+        try:
+            value, pk, reverse = signing.loads(token, salt=self.signing_salt)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        value = parse_datetime(value) if isinstance(value, str) else None
+
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return (value, pk), bool(reverse)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data):
+        return OrderedDict([
+            ('limit', self.limit),
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ])
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.limit_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+        ]
@@ -0,0 +1,192 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from drf_spectacular.plumbing import get_lib_doc_excludes as _get_lib_doc_excludes
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+# Fields whose `to_representation` returns database values as they are
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.ReadOnlyField,
+)
+
+
+class _DateTime:
+    """
+    `DateTimeField.to_representation` for ISO 8601 output, with the current timezone looked up once
+    per `.data` instead of once per value. Anything else (naive datetimes...) goes to the field.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    @classmethod
+    def supports(cls, field):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+
+        # `timezone` is only set on fields with an explicit `default_timezone`
+        return output_format is not None and output_format.lower() == ISO_8601 and "timezone" not in vars(field)
+
+    def bind(self, tz):
+        field_to_representation = self.field.to_representation
+
+        def to_representation(value):
+            if tz is None or value.tzinfo is None:
+                return field_to_representation(value)
+
+            value = value.astimezone(tz).isoformat()
+
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+
+            return value
+
+        return to_representation
+
+
+def _attribute_getter(attrs):
+    if len(attrs) == 1:
+        attr = attrs[0]
+        return lambda instance: getattr(instance, attr)
+
+    def get(instance):
+        for attr in attrs:
+            if instance is None:
+                return None
+
+            instance = getattr(instance, attr)
+
+        return instance
+
+    return get
+
+
+class ReadOnlyModelSerializer(serializers.ModelSerializer):
+    """
+    `ModelSerializer` for output only, for hot GET endpoints.
+
+    The fields are bound once per class and compiled into a flat plan of (name, getter, `.values()` key,
+    converter), `.data` runs the plan and returns plain dicts. `many=True` doesn't build a `ListSerializer`.
+    Only fields of the model itself, followed foreign keys (`source="user.email"`) and primary keys of
+    relations are supported, nested serializers and `SerializerMethodField` aren't.
+
+    Items can also be `.values()` rows, see `prepare_queryset`. `get_paginated_response` does that
+    for serializers with `use_values`, so list endpoints don't build model instances at all.
+
+    The schema (drf-spectacular) is the one of the `ModelSerializer`.
+    """
+    use_values = True
+
+    def __new__(cls, *args, **kwargs):
+        # Skips `BaseSerializer.__new__`, which turns `many=True` into a `ListSerializer`
+        return serializers.Field.__new__(cls, *args, **kwargs)
+
+    def __init__(self, instance=None, many=False, **kwargs):
+        super().__init__(instance, **kwargs)
+
+        self.many = many
+
+    @classmethod
+    def get_plan(cls):
+        """
+        The compiled plan, bound to the current timezone.
+        """
+        # Per class, not inherited by subclasses
+        plans = cls.__dict__.get("_plans")
+
+        if plans is None:
+            plans = cls._plans = {}
+
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        plan = plans.get(tz)
+
+        if plan is None:
+            plan = plans[tz] = tuple(
+                (name, getter, values_key, converter.bind(tz) if isinstance(converter, _DateTime) else converter)
+                for name, getter, values_key, converter in cls.compile_plan()
+            )
+
+        return plan
+
+    @classmethod
+    def compile_plan(cls):
+        model = cls.Meta.model
+        plan = []
+
+        for name, field in cls().fields.items():
+            if field.write_only:
+                continue
+
+            if isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField, ManyRelatedField)) \
+                    or field.source == "*":
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}.{name}: {type(field).__name__} isn't supported by ReadOnlyModelSerializer"
+                )
+
+            attrs = list(field.source_attrs)
+
+            if isinstance(field, PrimaryKeyRelatedField):
+                if len(attrs) > 1:
+                    raise ImproperlyConfigured(
+                        f"{cls.__name__}.{name}: only relations of {model.__name__} are supported"
+                    )
+
+                # `user_id` rather than `user.pk`, which would load the related object
+                attrs = [model._meta.get_field(attrs[0]).attname]
+                converter = None
+            elif isinstance(field, IDENTITY_FIELDS):
+                converter = None
+            elif isinstance(field, serializers.DateTimeField) and _DateTime.supports(field):
+                converter = _DateTime(field)
+            else:
+                converter = field.to_representation
+
+            plan.append((name, _attribute_getter(attrs), "__".join(field.source_attrs), converter))
+
+        return tuple(plan)
+
+    @classmethod
+    def get_values_fields(cls):
+        return [values_key for _, _, values_key, _ in cls.get_plan()]
+
+    @classmethod
+    def prepare_queryset(cls, queryset, extra_fields=()):
+        """
+        `queryset` as `.values()` rows with what the serializer reads, plus `extra_fields`.
+        """
+        return queryset.values(*dict.fromkeys([*cls.get_values_fields(), *extra_fields]))
+
+    def to_representation(self, instance, plan=None):
+        data = {}
+
+        if isinstance(instance, dict):
+            for name, _, values_key, converter in plan or self.get_plan():
+                value = instance[values_key]
+                data[name] = value if converter is None or value is None else converter(value)
+        else:
+            for name, getter, _, converter in plan or self.get_plan():
+                value = getter(instance)
+                data[name] = value if converter is None or value is None else converter(value)
+
+        return data
+
+    @property
+    def data(self):
+        plan = self.get_plan()
+
+        if self.many:
+            return [self.to_representation(item, plan) for item in self.instance]
+
+        return self.to_representation(self.instance, plan)
+
+
+def get_lib_doc_excludes():
+    # The docstring above isn't the description of every endpoint using it
+    return [*_get_lib_doc_excludes(), ReadOnlyModelSerializer]
@@ -0,0 +1,84 @@
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+from django.test import TestCase
+from django.utils import timezone
+
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from orgniaztional_ticking_api.api.pagination import KeysetPagination
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.utils.tests.factories import BaseUserFactory
+
+
+class KeysetPaginationTests(TestCase):
+    """
+    Pages of 3 over 10 users, with runs of users sharing a `created_at` across page boundaries.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # 4 at the same time, then 1, 3, 2
+        offsets = [0, 0, 0, 0, 1, 2, 2, 2, 3, 3]
+
+        for offset in offsets:
+            BaseUserFactory(created_at=now - timedelta(seconds=offset))
+
+        cls.expected = list(BaseUser.objects.order_by("-created_at", "-pk").values_list("pk", flat=True))
+
+    def paginate(self, **params):
+        paginator = KeysetPagination()
+        request = Request(APIRequestFactory().get("/users/", {"limit": 3, **params}))
+        page = paginator.paginate_queryset(BaseUser.objects.all(), request)
+
+        return [user.pk for user in page], paginator
+
+    def follow(self, link):
+        # The factory replaces the query string with `data`, so pass the link's params through
+        return self.paginate(**dict(parse_qsl(urlsplit(link).query)))
+
+    def test_forward_pages_cover_every_row_once(self):
+        pks, paginator = self.paginate()
+        seen = list(pks)
+        pages = 1
+
+        self.assertIsNone(paginator.get_previous_link())
+
+        while paginator.get_next_link():
+            pks, paginator = self.follow(paginator.get_next_link())
+            seen.extend(pks)
+            pages += 1
+
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(pages, 4)
+
+    def test_backward_pages_cover_every_row_once(self):
+        pks, paginator = self.paginate()
+
+        while paginator.get_next_link():
+            pks, paginator = self.follow(paginator.get_next_link())
+
+        seen = list(pks)
+
+        while paginator.get_previous_link():
+            pks, paginator = self.follow(paginator.get_previous_link())
+            seen = pks + seen
+
+        self.assertEqual(seen, self.expected)
+        # Back on the first page, in the same order
+        self.assertEqual(pks, self.expected[:3])
+
+    def test_next_then_previous_returns_the_same_page(self):
+        first, paginator = self.paginate()
+        second, paginator = self.follow(paginator.get_next_link())
+        back, _ = self.follow(paginator.get_previous_link())
+
+        self.assertEqual(second, self.expected[3:6])
+        self.assertEqual(back, first)
+
+    def test_forged_cursor_is_rejected(self):
+        with self.assertRaises(NotFound):
+            self.paginate(cursor="not-a-signed-cursor")
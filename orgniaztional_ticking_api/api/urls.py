@@ -2,4 +2,6 @@ from django.urls import path, include
 
 urlpatterns = [
     # path('blog/', include(  ('orgniaztional_ticking_api.blog.urls', 'blog')))
+    path('users/', include(('orgniaztional_ticking_api.users.urls', 'users'))),
+    path('auth/', include(('orgniaztional_ticking_api.authentication.urls', 'authentication'))),
 ]
@@ -1,8 +1,4 @@
-from rest_framework import serializers
-
-
-def create_serializer_class(name, fields):
-    return type(name, (serializers.Serializer, ), fields)
+from orgniaztional_ticking_api.common.utils import create_serializer_class
 
 
 def inline_serializer(*, fields, data=None, **kwargs):
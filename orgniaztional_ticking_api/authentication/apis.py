@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.utils.translation import gettext_lazy as _
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import serializers, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from orgniaztional_ticking_api.api.mixins import ApiTokenUserAuthMixin
+
+from .services import token_revoke, user_tokens_revoke
+from .signing import token_backend
+from .tokens import RefreshToken
+
+
+class LogoutApi(ApiTokenUserAuthMixin, APIView):
+    """
+    Revokes the given refresh token and the access token the request was authenticated with.
+    """
+
+    class InputSerializer(serializers.Serializer):
+        refresh = serializers.CharField()
+
+    @extend_schema(request=InputSerializer, responses={204: None})
+    def post(self, request):
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            refresh = RefreshToken(serializer.validated_data["refresh"])
+        except TokenError as exc:
+            raise InvalidToken(exc.args[0])
+
+        if refresh.get(api_settings.USER_ID_CLAIM) != request.user.pk:
+            raise InvalidToken(_("Token belongs to another user"))
+
+        token_revoke(token=refresh)
+        token_revoke(token=request.auth)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class LogoutAllApi(ApiTokenUserAuthMixin, APIView):
+    """
+    Revokes every token issued to the user so far, on every device.
+    """
+
+    @extend_schema(request=None, responses={204: None})
+    def post(self, request):
+        user_tokens_revoke(user=request.user)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class JwksApi(APIView):
+    """
+    The public keys tokens are signed with, as a JWK Set, for services that verify tokens themselves
+    (e.g. with `jwt.PyJWKClient`) instead of calling `jwt/verify/`. Empty unless `JWT_ALGORITHM` is asymmetric.
+    """
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        response = Response(token_backend.get_jwks())
+        patch_cache_control(response, public=True, max_age=settings.JWT_JWKS_MAX_AGE)
+
+        return response
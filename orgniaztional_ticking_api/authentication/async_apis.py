@@ -0,0 +1,68 @@
+from django.http import JsonResponse
+from django.utils.translation import gettext_lazy as _
+
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from orgniaztional_ticking_api.api.async_views import async_api_view
+from orgniaztional_ticking_api.users.hashing import ahash_password, averify_password, password_needs_rehash
+from orgniaztional_ticking_api.users.selectors import get_user_by_email
+
+from .denylist import token_denylist
+from .tokens import RefreshToken, UntypedToken
+
+
+@async_api_view(methods=["POST"])
+async def login_api(request, data):
+    """
+    Async `TokenObtainPairView`, the password is checked through the hashing executor.
+    """
+    email = data.get("email")
+    password = data.get("password")
+
+    errors = {
+        field: [_("This field is required.")]
+        for field, value in (("email", email), ("password", password))
+        if not isinstance(value, str)
+    }
+
+    if errors:
+        raise exceptions.ValidationError(errors)
+
+    user = await sync_to_async(get_user_by_email)(email=email)
+
+    if user is None:
+        # Hash anyway, so response times don't tell which emails are registered
+        await ahash_password(password)
+    elif await averify_password(password, user.password) and user.is_active:
+        if password_needs_rehash(user.password):
+            # Same upgrade `BaseUser.check_password` does for the sync login
+            user.password = await ahash_password(password)
+            await sync_to_async(user.save)(update_fields=["password"])
+
+        refresh = RefreshToken.for_user(user)
+        return JsonResponse({"refresh": str(refresh), "access": str(refresh.access_token)})
+
+    raise exceptions.AuthenticationFailed(_("No active account found with the given credentials"), "no_active_account")
+
+
+@async_api_view(methods=["POST"], read_only=True)
+async def verify_api(request, data):
+    """
+    Async `TokenVerifyView`.
+    """
+    token = data.get("token")
+
+    if not isinstance(token, str):
+        raise exceptions.ValidationError({"token": [_("This field is required.")]})
+
+    try:
+        token = UntypedToken(token)
+    except TokenError as exc:
+        raise InvalidToken(exc.args[0])
+
+    if await sync_to_async(token_denylist.is_revoked)(token):
+        raise InvalidToken(_("Token is revoked"))
+
+    return JsonResponse({})
@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import JWTAuthentication as _JWTAuthentication
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser as _TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from orgniaztional_ticking_api.common.cache import LocalTTLCache
+from orgniaztional_ticking_api.users.models import BaseUser
+
+from .denylist import token_denylist
+
+# user id -> is_active, see `JWTTokenUserAuthentication.check_revoked`
+_user_active_cache = LocalTTLCache(maxsize=10_000, ttl=settings.JWT_TOKEN_USER_REVOCATION_CHECK_TTL)
+
+
+class TokenUser(_TokenUser):
+    """
+    `request.user` built from the claims added by `authentication.tokens.UserClaimsMixin`.
+
+    Claims missing from the token (tokens issued before the claims existed) and any attribute
+    that only the model has are read from `BaseUser`, which is loaded on first access.
+    """
+
+    def claim(self, name):
+        if name in self.token:
+            return self.token[name]
+
+        return getattr(self.user, name)
+
+    @cached_property
+    def user(self) -> BaseUser:
+        try:
+            return BaseUser.objects.get(pk=self.id)
+        except BaseUser.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    @cached_property
+    def email(self):
+        return self.claim("email")
+
+    @cached_property
+    def is_active(self):
+        return self.claim("is_active")
+
+    @cached_property
+    def is_admin(self):
+        return self.claim("is_admin")
+
+    @cached_property
+    def is_staff(self):
+        return self.is_admin
+
+    def __str__(self):
+        return self.email
+
+    def __getattr__(self, attr):
+        # Only called for attributes not found the regular way
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+
+        if attr in self.token:
+            return self.token[attr]
+
+        return getattr(self.user, attr)
+
+
+class TokenDenylistMixin:
+    """
+    Rejects tokens in the denylist, see `authentication.denylist`.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+
+        if token_denylist.is_revoked(validated_token):
+            raise InvalidToken(_("Token is revoked"))
+
+        return validated_token
+
+
+class JWTAuthentication(TokenDenylistMixin, _JWTAuthentication):
+    pass
+
+
+class JWTTokenUserAuthentication(TokenDenylistMixin, JWTStatelessUserAuthentication):
+    """
+    Authenticates from the token alone, without the `SELECT` on `BaseUser` that `JWTAuthentication` runs.
+
+    With `JWT_TOKEN_USER_REVOCATION_CHECK_TTL` > 0, the user's `is_active` flag is also checked,
+    cached in-process for that many seconds, so deactivated users lose access within that window
+    instead of when their token expires.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = TokenUser(validated_token)
+
+        if not user.is_active or self.check_revoked(user):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+    def check_revoked(self, user):
+        if not settings.JWT_TOKEN_USER_REVOCATION_CHECK_TTL:
+            return False
+
+        is_active = _user_active_cache.get(user.id)
+
+        if is_active is None:
+            is_active = BaseUser.objects.filter(pk=user.id).values_list("is_active", flat=True).first()
+            _user_active_cache.set(user.id, bool(is_active))
+
+        return not is_active
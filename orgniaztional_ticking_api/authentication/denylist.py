@@ -0,0 +1,176 @@
+import logging
+import time
+from threading import Lock
+
+from django.conf import settings
+
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.settings import api_settings
+
+from orgniaztional_ticking_api.common.bloom import BloomFilter
+from orgniaztional_ticking_api.core.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+JTI_KEY = "jwt:denylist:jti:{}"
+USER_KEY = "jwt:denylist:user:{}"
+# Every revocation, scored by when it happened, so processes can catch up on the ones they missed
+LOG_KEY = "jwt:denylist:log"
+
+# Clocks of the processes writing the log can be this far apart, in seconds
+CLOCK_SKEW = 5
+
+
+class TokenDenylist:
+    """
+    Revoked JWTs, in Redis.
+
+    - `revoke` denylists one token by its `jti` until the token expires anyway.
+    - `revoke_user` denylists every token of a user issued until now ("log out all sessions").
+
+    Checks are local in the common case: every process keeps a Bloom filter of the revocations,
+    brought up to date from `LOG_KEY` at most every `JWT_DENYLIST_SYNC_INTERVAL` seconds. A token that
+    isn't in it isn't revoked, only Bloom filter hits (revoked tokens and false positives) ask Redis.
+    Revocations made by other processes are seen within that interval.
+
+    If Redis is down, checks let tokens through (logged), revoking raises `ServiceUnavailableError`.
+    """
+
+    def __init__(self):
+        self._bloom = None
+        self._synced_at = 0.0
+        self._next_sync = 0.0
+        self._rebuild_at = 0.0
+        self._lock = Lock()
+
+    @property
+    def enabled(self):
+        return settings.JWT_DENYLIST_ENABLED
+
+    def get_redis(self):
+        from django_redis import get_redis_connection
+
+        return get_redis_connection(settings.JWT_DENYLIST_CACHE_ALIAS)
+
+    def get_max_lifetime(self):
+        return max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME).total_seconds()
+
+    def revoke(self, token) -> bool:
+        """
+        Returns False if the token was already revoked, e.g. by a concurrent refresh with the same token.
+        """
+        if not self.enabled:
+            return True
+
+        jti = token[api_settings.JTI_CLAIM]
+        ttl = int(token["exp"] - time.time()) + 1
+
+        if ttl <= 0:
+            return True
+
+        try:
+            pipeline = self.get_redis().pipeline()
+            pipeline.set(JTI_KEY.format(jti), 1, ex=ttl, nx=True)
+            pipeline.zadd(LOG_KEY, {f"jti:{jti}": time.time()})
+            created, _ = pipeline.execute()
+        except RedisError as exc:
+            raise ServiceUnavailableError("Can't revoke the token") from exc
+
+        self.add_local(f"jti:{jti}")
+
+        return bool(created)
+
+    def revoke_user(self, user_id):
+        if not self.enabled:
+            return
+
+        now = time.time()
+
+        try:
+            pipeline = self.get_redis().pipeline()
+            pipeline.set(USER_KEY.format(user_id), int(now), ex=int(self.get_max_lifetime()) + 1)
+            pipeline.zadd(LOG_KEY, {f"user:{user_id}": now})
+            pipeline.execute()
+        except RedisError as exc:
+            raise ServiceUnavailableError("Can't revoke the user's tokens") from exc
+
+        self.add_local(f"user:{user_id}")
+
+    def add_local(self, member):
+        """
+        Makes a revocation visible to this process right away, without waiting for the next sync.
+        """
+        # Under the lock, so a rebuild that read the log before the revocation can't replace the filter after.
+        # Without a filter there is nothing to do, the first sync builds it from the log, revocation included.
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(member)
+
+    def is_revoked(self, token) -> bool:
+        if not self.enabled:
+            return False
+
+        jti = token.get(api_settings.JTI_CLAIM)
+        user_id = token.get(api_settings.USER_ID_CLAIM)
+
+        try:
+            self.sync()
+
+            check_jti = f"jti:{jti}" in self._bloom
+            check_user = user_id is not None and f"user:{user_id}" in self._bloom
+
+            if not check_jti and not check_user:
+                return False
+
+            pipeline = self.get_redis().pipeline()
+            pipeline.exists(JTI_KEY.format(jti))
+            pipeline.get(USER_KEY.format(user_id))
+            jti_revoked, revoked_before = pipeline.execute()
+        except RedisError:
+            logger.warning("Can't check the token denylist", exc_info=True)
+            return False
+
+        if check_jti and jti_revoked:
+            return True
+
+        # Tokens issued in the same second as the revocation are revoked too
+        return bool(check_user and revoked_before is not None and token.get("iat", 0) <= int(revoked_before))
+
+    def sync(self, force=False):
+        """
+        Adds the revocations logged since the last sync to the local Bloom filter. Every
+        `JWT_DENYLIST_REBUILD_INTERVAL` the filter is rebuilt instead, to drop expired revocations.
+        """
+        now = time.time()
+
+        if self._bloom is not None and not force and now < self._next_sync:
+            return
+
+        with self._lock:
+            if self._bloom is not None and not force and now < self._next_sync:
+                return
+
+            redis = self.get_redis()
+            rebuild = self._bloom is None or now >= self._rebuild_at
+
+            if rebuild:
+                redis.zremrangebyscore(LOG_KEY, "-inf", now - self.get_max_lifetime())
+                members = redis.zrangebyscore(LOG_KEY, "-inf", "+inf")
+                bloom = BloomFilter(
+                    capacity=max(settings.JWT_DENYLIST_BLOOM_CAPACITY, 2 * len(members)),
+                    error_rate=settings.JWT_DENYLIST_BLOOM_ERROR_RATE,
+                )
+                self._rebuild_at = now + settings.JWT_DENYLIST_REBUILD_INTERVAL
+            else:
+                members = redis.zrangebyscore(LOG_KEY, self._synced_at - CLOCK_SKEW, "+inf")
+                bloom = self._bloom
+
+            for member in members:
+                bloom.add(member.decode() if isinstance(member, bytes) else member)
+
+            self._bloom = bloom
+            self._synced_at = now
+            self._next_sync = now + settings.JWT_DENYLIST_SYNC_INTERVAL
+
+
+token_denylist = TokenDenylist()
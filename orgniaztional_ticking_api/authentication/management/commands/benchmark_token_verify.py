@@ -0,0 +1,69 @@
+from timeit import Timer
+
+from django.core.management.base import BaseCommand
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from orgniaztional_ticking_api.authentication.signing import CachedTokenBackend
+from orgniaztional_ticking_api.authentication.tokens import AccessToken
+from orgniaztional_ticking_api.users.models import BaseUser
+
+
+def get_key_pair(private_key):
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+    return private_pem, public_pem
+
+
+class Command(BaseCommand):
+    help = (
+        "Verify tokens the way `jwt/verify/` and the JWT authentication classes do, with simplejwt's TokenBackend "
+        "and with CachedTokenBackend, for HS256, RS256 and ES256. Tokens are drawn from a small pool, like the "
+        "internal services presenting the same tokens over and over."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=20_000)
+        parser.add_argument("--tokens", type=int, default=100, help="Distinct tokens verified in turn")
+
+    def handle(self, *args, number, tokens, **options):
+        keys = {
+            "HS256": ("benchmark-secret-" * 4, ""),
+            "RS256": get_key_pair(rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+            "ES256": get_key_pair(ec.generate_private_key(ec.SECP256R1())),
+        }
+        users = [BaseUser(id=index, email=f"user-{index}@example.com", is_active=True) for index in range(tokens)]
+
+        for algorithm, (signing_key, verifying_key) in keys.items():
+            plain = TokenBackend(algorithm, signing_key, verifying_key)
+            cached = CachedTokenBackend(algorithm, signing_key, verifying_key, cache_size=tokens)
+
+            rates = {}
+
+            for label, backend in (("plain", plain), ("cached", cached)):
+                token_class = type("BenchmarkToken", (UntypedToken,), {"get_token_backend": lambda self: backend})
+                pool = [backend.encode(AccessToken.for_user(user).payload) for user in users]
+
+                def verify():
+                    for token in pool:
+                        token_class(token)
+
+                rounds = max(1, number // tokens)
+                verify()
+                rates[label] = rounds * tokens / Timer(verify).timeit(rounds)
+
+            self.stdout.write(
+                f"{algorithm}: plain {rates['plain']:9,.0f}/s, cached {rates['cached']:9,.0f}/s, "
+                f"{rates['cached'] / rates['plain']:.1f}x"
+            )
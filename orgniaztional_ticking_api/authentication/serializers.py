@@ -0,0 +1,69 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer as _TokenObtainPairSerializer,
+    TokenRefreshSerializer as _TokenRefreshSerializer,
+    TokenVerifySerializer as _TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from orgniaztional_ticking_api.users.models import BaseUser
+
+from .denylist import token_denylist
+from .tokens import RefreshToken, UntypedToken
+
+
+class TokenObtainPairSerializer(_TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+
+class TokenRefreshSerializer(_TokenRefreshSerializer):
+    """
+    With `ROTATE_REFRESH_TOKENS`, the refresh token is revoked once used. Reusing it, or racing
+    another refresh with the same token, fails: only one of them gets the rotated token.
+
+    The user is loaded again and the claims `TokenUser` is built from are re-issued instead of copied
+    from the old token, so inactive users can't refresh and demoted admins lose `is_admin`.
+    """
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+
+        if token_denylist.is_revoked(refresh):
+            raise InvalidToken(_("Token is revoked"))
+
+        refresh.set_user_claims(self.get_user(refresh))
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # Before the `jti` changes
+            if not token_denylist.revoke(refresh):
+                raise InvalidToken(_("Token is revoked"))
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data["refresh"] = str(refresh)
+
+        return data
+
+    def get_user(self, refresh) -> BaseUser:
+        user = BaseUser.objects.filter(**{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)}).first()
+
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(_("No active account found with the given credentials"), "no_active_account")
+
+        return user
+
+
+class TokenVerifySerializer(_TokenVerifySerializer):
+
+    def validate(self, attrs):
+        if token_denylist.is_revoked(UntypedToken(attrs["token"])):
+            raise InvalidToken(_("Token is revoked"))
+
+        return {}
@@ -0,0 +1,19 @@
+from rest_framework_simplejwt.tokens import Token
+
+from orgniaztional_ticking_api.users.models import BaseUser
+
+from .denylist import token_denylist
+
+
+def token_revoke(*, token:Token) -> bool:
+    """
+    Returns False if the token was already revoked.
+    """
+    return token_denylist.revoke(token)
+
+
+def user_tokens_revoke(*, user:BaseUser) -> None:
+    """
+    Logs the user out of every session: all the tokens issued to them so far stop working.
+    """
+    token_denylist.revoke_user(user.pk)
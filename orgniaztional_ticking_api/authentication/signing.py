@@ -0,0 +1,108 @@
+import hashlib
+import time
+
+from django.conf import settings
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.settings import api_settings
+
+from orgniaztional_ticking_api.common.cache import LocalTTLCache
+
+
+class CachedTokenBackend(TokenBackend):
+    """
+    `TokenBackend` that remembers the tokens it verified, so a token presented again skips
+    decoding and the signature check.
+
+    Entries are keyed by a digest of the token and never outlive its `exp`, the expiry is also
+    checked again by `Token.verify` on every use. The cache is per process.
+
+    With an asymmetric `ALGORITHM` (RS256, ES256...) tokens carry a `kid` header, and the public
+    keys are published by `JwksApi`, so other services can verify tokens themselves.
+    """
+
+    def __init__(self, *args, key_id=None, cache_size=10_000, cache_ttl=300, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.key_id = key_id
+        self.cache_ttl = cache_ttl
+        self.cache = LocalTTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_size and cache_ttl else None
+
+    @property
+    def is_asymmetric(self):
+        return not self.algorithm.startswith("HS")
+
+    def get_cache_key(self, token):
+        if isinstance(token, str):
+            token = token.encode()
+
+        return hashlib.blake2b(token, digest_size=16).digest()
+
+    def encode(self, payload):
+        if not self.is_asymmetric or not self.key_id:
+            return super().encode(payload)
+
+        jwt_payload = payload.copy()
+
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        return jwt.encode(
+            jwt_payload,
+            self.signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_id},
+            json_encoder=self.json_encoder,
+        )
+
+    def decode(self, token, verify=True):
+        if self.cache is None or not verify:
+            return super().decode(token, verify=verify)
+
+        key = self.get_cache_key(token)
+        payload = self.cache.get(key)
+
+        if payload is None:
+            payload = super().decode(token, verify=verify)
+            ttl = min(payload.get("exp", 0) - time.time(), self.cache_ttl)
+
+            if ttl > 0:
+                self.cache.set(key, payload, ttl=ttl)
+
+        # Tokens change their payload (see `TokenRefreshSerializer`), the cached one must stay as verified
+        return payload.copy()
+
+    def get_jwks(self):
+        """
+        The public key as a JWK Set, empty for HMAC algorithms.
+        """
+        if not self.is_asymmetric:
+            return {"keys": []}
+
+        algorithm = get_default_algorithms()[self.algorithm]
+        jwk = algorithm.to_jwk(algorithm.prepare_key(self.verifying_key), as_dict=True)
+        jwk.update({"use": "sig", "alg": self.algorithm})
+
+        if self.key_id:
+            jwk["kid"] = self.key_id
+
+        return {"keys": [jwk]}
+
+
+token_backend = CachedTokenBackend(
+    api_settings.ALGORITHM,
+    api_settings.SIGNING_KEY,
+    api_settings.VERIFYING_KEY,
+    api_settings.AUDIENCE,
+    api_settings.ISSUER,
+    api_settings.JWK_URL,
+    api_settings.LEEWAY,
+    api_settings.JSON_ENCODER,
+    key_id=settings.JWT_SIGNING_KEY_ID,
+    cache_size=settings.JWT_VERIFY_CACHE_SIZE,
+    cache_ttl=settings.JWT_VERIFY_CACHE_TTL,
+)
@@ -0,0 +1,125 @@
+import time
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from orgniaztional_ticking_api.authentication.backends import _user_active_cache
+from orgniaztional_ticking_api.authentication.denylist import LOG_KEY, TokenDenylist, token_denylist
+from orgniaztional_ticking_api.authentication.tokens import RefreshToken
+from orgniaztional_ticking_api.utils.tests.factories import DEFAULT_PASSWORD, BaseUserFactory, ProfileFactory
+from orgniaztional_ticking_api.utils.tests.redis import FakeRedisMixin
+
+
+@override_settings(JWT_DENYLIST_ENABLED=True, JWT_DENYLIST_SYNC_INTERVAL=0)
+class TokenDenylistTests(FakeRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.denylist = TokenDenylist()
+        self.user = BaseUserFactory()
+        self.refresh = RefreshToken.for_user(self.user)
+
+    def test_revoke(self):
+        other = RefreshToken.for_user(self.user)
+
+        self.assertFalse(self.denylist.is_revoked(self.refresh))
+
+        self.assertTrue(self.denylist.revoke(self.refresh))
+        # Already revoked, e.g. a concurrent refresh with the same token
+        self.assertFalse(self.denylist.revoke(self.refresh))
+
+        self.assertTrue(self.denylist.is_revoked(self.refresh))
+        self.assertFalse(self.denylist.is_revoked(other))
+
+    def test_revocations_of_other_processes_are_synced(self):
+        # Builds the local Bloom filter before the revocation
+        self.assertFalse(self.denylist.is_revoked(self.refresh))
+
+        TokenDenylist().revoke(self.refresh)
+
+        self.assertTrue(self.denylist.is_revoked(self.refresh))
+        self.assertEqual(self.redis.zcard(LOG_KEY), 1)
+
+    def test_revoke_user(self):
+        access = self.refresh.access_token
+        later = RefreshToken.for_user(self.user)
+        later["iat"] = int(time.time()) + 1
+
+        self.denylist.revoke_user(self.user.pk)
+
+        self.assertTrue(self.denylist.is_revoked(self.refresh))
+        self.assertTrue(self.denylist.is_revoked(access))
+        # Issued after the revocation
+        self.assertFalse(self.denylist.is_revoked(later))
+        self.assertFalse(self.denylist.is_revoked(RefreshToken.for_user(BaseUserFactory())))
+
+    def test_expired_token_is_not_stored(self):
+        self.refresh["exp"] = int(time.time()) - 10
+
+        self.assertTrue(self.denylist.revoke(self.refresh))
+        self.assertEqual(self.redis.dbsize(), 0)
+
+    @override_settings(JWT_DENYLIST_ENABLED=False)
+    def test_disabled(self):
+        self.denylist.revoke(self.refresh)
+
+        self.assertFalse(self.denylist.is_revoked(self.refresh))
+        self.assertEqual(self.redis.dbsize(), 0)
+
+
+@override_settings(JWT_DENYLIST_ENABLED=True, JWT_DENYLIST_SYNC_INTERVAL=0)
+class TokenRevocationApiTests(FakeRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        _user_active_cache.clear()
+
+        self.client = APIClient()
+        self.user = ProfileFactory().user
+
+    def login(self):
+        response = self.client.post(
+            reverse("api:authentication:login"),
+            {"email": self.user.email, "password": DEFAULT_PASSWORD},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        return response.data
+
+    def refresh(self, refresh):
+        return self.client.post(reverse("api:authentication:refresh"), {"refresh": refresh})
+
+    def test_refresh_token_can_only_be_used_once(self):
+        tokens = self.login()
+
+        response = self.refresh(tokens["refresh"])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data["refresh"], tokens["refresh"])
+
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+        # The rotated one still works
+        self.assertEqual(self.refresh(response.data["refresh"]).status_code, 200)
+
+    def test_logout_revokes_both_tokens(self):
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get(reverse("api:users:profile")).status_code, 200)
+
+        response = self.client.post(reverse("api:authentication:logout"), {"refresh": tokens["refresh"]})
+        self.assertEqual(response.status_code, 204)
+
+        self.assertEqual(self.client.get(reverse("api:users:profile")).status_code, 401)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+    def test_revoked_token_is_rejected_by_every_process(self):
+        tokens = self.login()
+
+        # The local filter is up to date, the revocation comes from another process
+        self.assertFalse(token_denylist.is_revoked(RefreshToken(tokens["refresh"])))
+        TokenDenylist().revoke(RefreshToken(tokens["refresh"]))
+
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
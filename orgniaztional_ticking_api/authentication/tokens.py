@@ -0,0 +1,49 @@
+from rest_framework_simplejwt.tokens import (
+    AccessToken as _AccessToken,
+    RefreshToken as _RefreshToken,
+    UntypedToken as _UntypedToken,
+)
+
+from orgniaztional_ticking_api.users.models import BaseUser
+
+from .signing import token_backend
+
+
+class CachedTokenBackendMixin:
+    """
+    Signs and verifies with `signing.token_backend`, which caches verified tokens.
+    """
+
+    def get_token_backend(self):
+        return token_backend
+
+
+class UserClaimsMixin:
+    """
+    Adds the claims `TokenUser` is built from, so authenticated requests don't need to load the user.
+    """
+    user_claims = ("email", "is_active", "is_admin")
+
+    @classmethod
+    def for_user(cls, user: BaseUser):
+        token = super().for_user(user)
+        token.set_user_claims(user)
+
+        return token
+
+    def set_user_claims(self, user: BaseUser):
+        for claim in self.user_claims:
+            self[claim] = getattr(user, claim)
+
+
+class AccessToken(CachedTokenBackendMixin, UserClaimsMixin, _AccessToken):
+    pass
+
+
+class RefreshToken(CachedTokenBackendMixin, UserClaimsMixin, _RefreshToken):
+    # Claims are copied from the refresh token to the access tokens it creates
+    access_token_class = AccessToken
+
+
+class UntypedToken(CachedTokenBackendMixin, _UntypedToken):
+    pass
@@ -1,10 +1,20 @@
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
 
+from orgniaztional_ticking_api.api.mixins import read_only_api
+
+from .apis import JwksApi, LogoutAllApi, LogoutApi
+from .async_apis import login_api, verify_api
+
 urlpatterns = [
         path('jwt/', include(([
             path('login/', TokenObtainPairView.as_view(),name="login"),
             path('refresh/', TokenRefreshView.as_view(),name="refresh"),
-            path('verify/', TokenVerifyView.as_view(),name="verify"),
+            path('verify/', read_only_api(TokenVerifyView.as_view()),name="verify"),
+            path('logout/', LogoutApi.as_view(),name="logout"),
+            path('logout-all/', LogoutAllApi.as_view(),name="logout-all"),
+            path('jwks/', JwksApi.as_view(),name="jwks"),
+            path('async/login/', login_api,name="login-async"),
+            path('async/verify/', verify_api,name="verify-async"),
             ])), name="jwt"),
 ]
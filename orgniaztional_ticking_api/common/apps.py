@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'orgniaztional_ticking_api.common'
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,123 @@
+import hashlib
+import math
+from threading import Lock
+
+
+class BaseBloomFilter:
+    """
+    Bloom filter of strings: `in` can return false positives (about `error_rate` of them once
+    `capacity` items were added), never false negatives. Items can't be removed, build a new one.
+
+    Subclasses store the bits.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(capacity, 1)
+
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+
+    def get_positions(self, item):
+        # Double hashing, `hash_count` positions out of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+
+class BloomFilter(BaseBloomFilter):
+    """
+    In-process Bloom filter. Adds are serialized, lookups don't take the lock.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        super().__init__(capacity, error_rate)
+
+        self.bits = bytearray(math.ceil(self.size / 8))
+        self.count = 0
+        self._lock = Lock()
+
+    def add(self, item):
+        positions = self.get_positions(item)
+
+        with self._lock:
+            for position in positions:
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+            self.count += 1
+
+    def __contains__(self, item):
+        bits = self.bits
+
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.get_positions(item))
+
+
+class RedisBloomFilter(BaseBloomFilter):
+    """
+    Bloom filter in a Redis string, shared by every process. Each add or lookup is one pipelined round trip.
+
+    A missing key is an empty filter. `rebuild` fills a new key and swaps it in atomically.
+    """
+
+    def __init__(self, key, capacity, error_rate=0.001, alias="default"):
+        super().__init__(capacity, error_rate)
+
+        self.key = key
+        self.alias = alias
+
+    def get_redis(self):
+        from django_redis import get_redis_connection
+
+        return get_redis_connection(self.alias)
+
+    def add(self, item):
+        self.add_many([item])
+
+    def add_many(self, items, key=None):
+        pipeline = self.get_redis().pipeline(transaction=False)
+
+        for item in items:
+            for position in self.get_positions(item):
+                pipeline.setbit(key or self.key, position, 1)
+
+        pipeline.execute()
+
+    def __contains__(self, item):
+        pipeline = self.get_redis().pipeline(transaction=False)
+
+        for position in self.get_positions(item):
+            pipeline.getbit(self.key, position)
+
+        return all(pipeline.execute())
+
+    def rebuild(self, items, batch_size=1000):
+        """
+        Replaces the filter with one of `items` (any iterable), e.g. to drop removed items.
+        Returns the number of items added.
+        """
+        redis = self.get_redis()
+        building_key = f"{self.key}:building"
+        batch = []
+        count = 0
+
+        redis.delete(building_key)
+
+        for item in items:
+            batch.append(item)
+
+            if len(batch) >= batch_size:
+                self.add_many(batch, key=building_key)
+                count += len(batch)
+                batch = []
+
+        if batch:
+            self.add_many(batch, key=building_key)
+            count += len(batch)
+
+        if count:
+            redis.rename(building_key, self.key)
+        else:
+            redis.delete(self.key)
+
+        return count
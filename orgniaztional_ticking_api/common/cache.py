@@ -0,0 +1,185 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import caches
+
+from prometheus_client import REGISTRY, Counter
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Read-through cache lookups, by cache namespace and result.",
+    ["cache", "result"],
+)
+
+_MISSING = object()
+
+
+class ReadThroughCache:
+    """
+    Versioned read-through cache on top of a Django cache alias.
+
+    Every key has a generation counter stored next to it. `invalidate` bumps the generation
+    instead of deleting the value, so a reader that loaded stale data right before the bump
+    can only write it back under the old (now unreachable) generation.
+
+    Generations never expire, but the cache can still evict them. A missing generation starts
+    from the current time in nanoseconds, past any generation it had before, so values cached
+    under an evicted generation can't be served again.
+
+    On a miss only one caller per key runs the loader, the others wait for the value to show up.
+    If it doesn't show up within `lock_timeout` they give up waiting and load it themselves.
+
+    Bump `version` whenever the shape of the cached value changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace,
+        version=1,
+        timeout=None,
+        lock_timeout=5,
+        poll_interval=0.05,
+        alias="default"
+    ):
+        self.namespace = namespace
+        self.version = version
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_timeout(self):
+        if self.timeout is not None:
+            return self.timeout
+
+        return settings.CACHE_TTL
+
+    def make_key(self, key, *parts):
+        return ":".join([self.namespace, str(self.version), str(key), *map(str, parts)])
+
+    def get_generation(self, key):
+        generation_key = self.make_key(key, "gen")
+        generation = self.cache.get(generation_key)
+
+        if generation is None:
+            # `add` is a no-op if the key exists, the generation another caller just set wins
+            generation = time.time_ns()
+            self.cache.add(generation_key, generation, timeout=None)
+            generation = self.cache.get(generation_key, generation)
+
+        return generation
+
+    def get(self, key, loader):
+        generation = self.get_generation(key)
+        value_key = self.make_key(key, generation)
+
+        value = self.cache.get(value_key, _MISSING)
+
+        if value is not _MISSING:
+            CACHE_REQUESTS.labels(self.namespace, "hit").inc()
+            return value
+
+        lock_key = self.make_key(key, generation, "lock")
+
+        if not self.cache.add(lock_key, 1, timeout=self.lock_timeout):
+            value = self.wait(value_key)
+
+            if value is not _MISSING:
+                CACHE_REQUESTS.labels(self.namespace, "hit").inc()
+                return value
+
+        CACHE_REQUESTS.labels(self.namespace, "miss").inc()
+
+        try:
+            value = loader()
+            self.cache.set(value_key, value, timeout=self.get_timeout())
+        finally:
+            self.cache.delete(lock_key)
+
+        return value
+
+    def wait(self, value_key):
+        deadline = time.monotonic() + self.lock_timeout
+
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+
+            value = self.cache.get(value_key, _MISSING)
+
+            if value is not _MISSING:
+                return value
+
+        return _MISSING
+
+    def invalidate(self, key):
+        generation_key = self.make_key(key, "gen")
+
+        # `add` is a no-op if the key exists, so concurrent invalidations can't reset each other
+        self.cache.add(generation_key, time.time_ns(), timeout=None)
+        self.cache.incr(generation_key)
+
+    def stats(self):
+        hits = REGISTRY.get_sample_value("cache_requests_total", {"cache": self.namespace, "result": "hit"})
+        misses = REGISTRY.get_sample_value("cache_requests_total", {"cache": self.namespace, "result": "miss"})
+
+        return {
+            "hits": int(hits or 0),
+            "misses": int(misses or 0),
+        }
+
+
+class LocalTTLCache:
+    """
+    Small bounded in-process LRU cache with per-entry expiry.
+
+    Meant for values that are fine to be slightly stale and are read on every request,
+    where even a Redis round trip is too much. Not shared between processes.
+    """
+
+    def __init__(self, *, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
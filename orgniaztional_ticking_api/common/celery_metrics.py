@@ -0,0 +1,194 @@
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+
+from django.conf import settings
+
+from celery import Task
+from celery.worker.request import Request
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time from publishing (or the ETA) to the start of the task, by task.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+TASK_RUNTIME = Histogram(
+    "celery_task_runtime_seconds",
+    "Task run time, by task and final state.",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60),
+)
+TASK_RETRIES = Counter(
+    "celery_task_retries_total",
+    "Task retries, by task.",
+    ["task"],
+)
+TASK_TIME_LIMIT_HITS = Counter(
+    "celery_task_time_limit_hits_total",
+    "Tasks that hit their soft or hard time limit, by task and limit.",
+    ["task", "limit"],
+)
+TASK_SOFT_LIMIT_NEAR = Counter(
+    "celery_task_soft_limit_near_total",
+    "Tasks that finished within `CELERY_TASK_SOFT_LIMIT_WARNING_RATIO` of their soft time limit, by task.",
+    ["task"],
+)
+
+PUBLISHED_AT_HEADER = "published_at"
+
+# task id -> monotonic start time, for tasks running in this process
+_started = {}
+
+
+def get_soft_time_limit(task):
+    return (
+        task.request.timelimit and task.request.timelimit[1]
+        or task.soft_time_limit
+        or task.app.conf.task_soft_time_limit
+    )
+
+
+def task_published(headers):
+    # Overwritten on retries, their wait starts when they are sent again
+    headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+def task_started(task):
+    _started[task.request.id] = time.monotonic()
+
+    published_at = getattr(task.request, PUBLISHED_AT_HEADER, None)
+
+    if published_at is None or task.request.is_eager:
+        return
+
+    eta = task.request.eta
+
+    if eta is not None:
+        eta = eta if isinstance(eta, datetime) else datetime.fromisoformat(eta)
+        published_at = max(published_at, eta.timestamp())
+
+    TASK_QUEUE_WAIT.labels(task.name).observe(max(time.time() - published_at, 0))
+
+
+def task_finished(task, task_id, state):
+    started = _started.pop(task_id, None)
+
+    if started is None:
+        return
+
+    runtime = time.monotonic() - started
+    TASK_RUNTIME.labels(task.name, state or "UNKNOWN").observe(runtime)
+
+    soft_time_limit = get_soft_time_limit(task)
+
+    if soft_time_limit and runtime >= soft_time_limit * settings.CELERY_TASK_SOFT_LIMIT_WARNING_RATIO:
+        TASK_SOFT_LIMIT_NEAR.labels(task.name).inc()
+        logger.warning(
+            "Task %s[%s] ran %.1fs, close to its soft time limit of %ss",
+            task.name,
+            task_id,
+            runtime,
+            soft_time_limit,
+        )
+
+
+def task_retried(task):
+    TASK_RETRIES.labels(task.name).inc()
+
+
+class InstrumentedRequest(Request):
+    """
+    Counts time limit hits. They are handled in the worker's main process, there's no signal for them
+    and a hard limit kills the process running the task.
+    """
+
+    def on_timeout(self, soft, timeout):
+        super().on_timeout(soft, timeout)
+        TASK_TIME_LIMIT_HITS.labels(self.task.name, "soft" if soft else "hard").inc()
+
+
+class InstrumentedTask(Task):
+    Request = InstrumentedRequest
+
+
+class QueueLengthCollector:
+    """
+    Messages waiting in the broker, read when the metrics are scraped.
+    """
+
+    def __init__(self, app, queues):
+        self.app = app
+        self.queues = queues
+
+    def collect(self):
+        family = GaugeMetricFamily("celery_queue_length", "Messages waiting in the broker, by queue.", labels=["queue"])
+
+        with self.app.connection_for_read() as connection:
+            for queue in self.queues:
+                # A failed passive declare closes the channel, one per queue
+                channel = connection.channel()
+
+                try:
+                    _, length, _ = channel.queue_declare(queue=queue, passive=True)
+                except Exception:
+                    logger.debug("Can't read the length of queue %s", queue, exc_info=True)
+                    continue
+                finally:
+                    channel.close()
+
+                family.add_metric([queue], length)
+
+        yield family
+
+
+def multiprocess_dir():
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+def clear_multiprocess_dir():
+    """
+    Metrics of a previous run of the worker would be added to this one's, call before the pool starts.
+    """
+    path = multiprocess_dir()
+
+    if path is None:
+        return
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def start_worker_metrics_server(app):
+    """
+    Serves the worker's metrics on `CELERY_WORKER_METRICS_PORT`.
+
+    With the prefork pool tasks run in child processes, their metrics are only collected
+    when `PROMETHEUS_MULTIPROC_DIR` is set.
+    """
+    port = settings.CELERY_WORKER_METRICS_PORT
+
+    if not port:
+        return
+
+    if multiprocess_dir() is None:
+        registry = REGISTRY
+    else:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    registry.register(QueueLengthCollector(app, settings.CELERY_METRICS_QUEUES))
+
+    start_http_server(port, registry=registry)
+    logger.info("Serving worker metrics on :%s", port)
+
+
+def process_exited(pid):
+    if multiprocess_dir() is not None:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,174 @@
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from prometheus_client import Counter, Gauge
+
+DB_CONNECTIONS_OPEN = Gauge(
+    "db_connections_open",
+    "Open database connections, by alias.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+DB_CONNECTIONS_CREATED = Counter(
+    "db_connections_created_total",
+    "New database connections, by alias.",
+    ["alias"],
+)
+DB_CONNECTION_HEALTH_CHECKS = Counter(
+    "db_connection_health_checks_total",
+    "Health checks of reused database connections, by alias and result.",
+    ["alias", "result"],
+)
+
+# Every connection wrapper that ever connected in this process, one per alias and thread
+_wrappers = weakref.WeakSet()
+# Connection wrapper -> monotonic time its last request / task finished, see `close_unusable_connections`
+_idle_since = weakref.WeakKeyDictionary()
+
+_read_only = ContextVar("read_only", default=False)
+_request_state = ContextVar("request_state", default=None)
+
+
+@contextmanager
+def read_only():
+    """
+    Marks the code in the block as read only, so database routers may send its queries to a replica.
+    """
+    token = _read_only.set(True)
+
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def is_read_only() -> bool:
+    return _read_only.get()
+
+
+def replica(func):
+    """
+    Runs a selector in `read_only`, see `common.routers.PrimaryReplicaRouter`.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_only():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class RequestState:
+    """
+    What the database router needs to know about the current request, set by `DatabaseStickinessMiddleware`.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.wrote = False
+        self._sticky = None
+
+    def get_sticky_key(self):
+        user = getattr(self.request, "user", None)
+
+        if user is None or not user.is_authenticated:
+            return None
+
+        return f"db:sticky:{user.pk}"
+
+    def is_sticky(self) -> bool:
+        """
+        Whether the user wrote something in the last `DATABASE_STICKY_SECONDS`.
+        """
+        if self.wrote:
+            return True
+
+        if self._sticky is None:
+            key = self.get_sticky_key()
+            # Can't be cached before authentication, `request.user` is set by DRF in the view
+            if key is None:
+                return False
+
+            self._sticky = bool(cache.get(key))
+
+        return self._sticky
+
+    def save(self):
+        key = self.get_sticky_key()
+
+        if self.wrote and key is not None:
+            cache.set(key, 1, timeout=settings.DATABASE_STICKY_SECONDS)
+
+
+@contextmanager
+def request_state(request):
+    state = RequestState(request)
+    token = _request_state.set(state)
+
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+def get_request_state() -> RequestState | None:
+    return _request_state.get()
+
+
+def track_connection(connection):
+    _wrappers.add(connection)
+    DB_CONNECTIONS_CREATED.labels(connection.alias).inc()
+
+
+def update_connection_metrics():
+    open_connections = {alias: 0 for alias in settings.DATABASES}
+
+    for wrapper in list(_wrappers):
+        if wrapper.connection is not None:
+            open_connections[wrapper.alias] = open_connections.get(wrapper.alias, 0) + 1
+
+    for alias, count in open_connections.items():
+        DB_CONNECTIONS_OPEN.labels(alias).set(count)
+
+
+def mark_connections_idle():
+    now = time.monotonic()
+
+    for connection in connections.all():
+        if connection.connection is not None:
+            _idle_since[connection] = now
+
+
+def close_unusable_connections():
+    """
+    Closes persistent connections that died while idle (database restart, idle timeout
+    in a proxy), so the next query reconnects instead of failing.
+
+    Only connections idle for `DATABASE_CONN_HEALTH_CHECK_IDLE_SECONDS` or more are checked, so busy
+    workers don't pay a `SELECT 1` per request. Django >= 4.1 does this itself with `CONN_HEALTH_CHECKS`.
+    """
+    if not settings.DATABASE_CONN_HEALTH_CHECKS:
+        return
+
+    checked_before = time.monotonic() - settings.DATABASE_CONN_HEALTH_CHECK_IDLE_SECONDS
+
+    for connection in connections.all():
+        if connection.connection is None or connection.in_atomic_block:
+            continue
+
+        if _idle_since.get(connection, 0) > checked_before:
+            continue
+
+        if connection.is_usable():
+            DB_CONNECTION_HEALTH_CHECKS.labels(connection.alias, "ok").inc()
+            continue
+
+        DB_CONNECTION_HEALTH_CHECKS.labels(connection.alias, "failed").inc()
+        connection.close()
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from typing import Any, List
+
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+
+from orgniaztional_ticking_api.common.models import FanOutRun
+
+
+class FanOut:
+    """
+    Runs `process_chunk` over every item of `get_queryset`, as Celery tasks.
+
+    The queryset is walked in primary key order, one wave of at most `parallelism` chunks of
+    `chunk_size` primary keys at a time. A wave is a chord, when all of its chunks are done the
+    cursor and the progress are saved on the `FanOutRun` and the next wave starts. Only one wave
+    of primary keys is ever loaded, so a run over millions of rows is as cheap to start as one over ten.
+
+    Chunks are acked late, a chunk that was running when its worker died is delivered again, and
+    `common.tasks.fanout_resume` restarts runs that made no progress for `stale_after` from their
+    last saved cursor. Either way some items can be processed twice, `process_chunk` must be idempotent.
+
+    class NotifyCustomers(FanOut):
+        def get_queryset(self, *, message):
+            return BaseUser.objects.filter(is_active=True)
+
+        def process_chunk(self, pks, *, message):
+            ...
+
+    NotifyCustomers().start(message="Hello")
+
+    `params` are stored as JSON, and passed to both methods as keyword arguments.
+    """
+
+    chunk_size = 500
+    parallelism = 4
+    stale_after = timedelta(minutes=10)
+
+    @classmethod
+    def get_path(cls) -> str:
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    def get_queryset(self, **params) -> QuerySet:
+        raise NotImplementedError
+
+    def process_chunk(self, pks: List[Any], **params) -> int | None:
+        """
+        Returns how many items were processed, `len(pks)` if it returns None.
+        """
+        raise NotImplementedError
+
+    def get_wave(self, run: FanOutRun) -> List[Any]:
+        queryset = self.get_queryset(**run.params)
+
+        if run.cursor is not None:
+            queryset = queryset.filter(pk__gt=run.cursor)
+
+        limit = self.chunk_size * self.parallelism
+
+        return list(queryset.order_by("pk").values_list("pk", flat=True)[:limit])
+
+    def get_chunks(self, pks: List[Any]) -> List[List[Any]]:
+        return [pks[index:index + self.chunk_size] for index in range(0, len(pks), self.chunk_size)]
+
+    @transaction.atomic
+    def start(self, **params) -> FanOutRun:
+        """
+        Starts a run once the current transaction commits.
+        There's only one run of a fan-out at a time, if one is already running it is returned instead.
+        """
+        from orgniaztional_ticking_api.common.tasks import fanout_wave
+
+        path = self.get_path()
+        running = FanOutRun.objects.filter(fanout=path, status=FanOutRun.Status.RUNNING)
+        run = running.first()
+
+        if run is not None:
+            return run
+
+        try:
+            # The savepoint keeps the outer transaction usable if the insert fails
+            with transaction.atomic():
+                run = FanOutRun.objects.create(
+                    fanout=path,
+                    params=params,
+                    total=self.get_queryset(**params).count(),
+                )
+        except IntegrityError:
+            # A concurrent `start` created one, `fanoutrun_one_running_per_fanout` rejected this one
+            return running.get()
+
+        transaction.on_commit(lambda: fanout_wave.delay(run.pk))
+
+        return run
@@ -0,0 +1,98 @@
+from functools import wraps
+from statistics import median
+from time import perf_counter
+
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+
+from orgniaztional_ticking_api.authentication.tokens import RefreshToken
+from orgniaztional_ticking_api.users.apis import ProfileApi
+from orgniaztional_ticking_api.users.caches import profile_cache
+from orgniaztional_ticking_api.users.models import Profile
+
+
+class HoldTimer:
+    """
+    Measures how long the default connection is busy for a request:
+    inside `ATOMIC_REQUESTS` from the first query until the commit, in autocommit the queries themselves.
+    """
+
+    def __init__(self):
+        self.first_query_at = None
+        self.queries = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+
+        if self.first_query_at is None:
+            self.first_query_at = start
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = "Compare connection hold time of ProfileApi with ATOMIC_REQUESTS and as a read only view."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, repeat, **options):
+        profile = Profile.objects.select_related("user").first()
+
+        if profile is None:
+            raise CommandError("Need at least one user with a profile.")
+
+        token = RefreshToken.for_user(profile.user).access_token
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        atomic_view = type("AtomicProfileApi", (ProfileApi, ), {"read_only": False}).as_view()
+        read_only_view = type("ReadOnlyProfileApi", (ProfileApi, ), {"read_only": True}).as_view()
+
+        for name, view in (("atomic", atomic_view), ("read only", read_only_view)):
+            holds, totals = zip(*[self.measure(view, request, profile.user_id) for _ in range(repeat)])
+
+            self.stdout.write(
+                f"{name:<10} connection hold median={median(holds):.3f}ms max={max(holds):.3f}ms "
+                f"request median={median(totals):.3f}ms"
+            )
+
+    def measure(self, view, request, user_id):
+        # Every request should reach the database
+        profile_cache.invalidate(user_id)
+
+        timer = HoldTimer()
+        committed_at = []
+
+        @wraps(view)
+        def probe(request):
+            response = view(request)
+
+            if connection.in_atomic_block:
+                # Runs right after the COMMIT of the request transaction
+                transaction.on_commit(lambda: committed_at.append(perf_counter()))
+
+            return response
+
+        start = perf_counter()
+
+        with connection.execute_wrapper(timer):
+            # The same wrapping Django's request handler applies
+            response = BaseHandler().make_view_atomic(probe)(request)
+
+        total = (perf_counter() - start) * 1000
+
+        if response.status_code != 200:
+            raise CommandError(f"ProfileApi answered {response.status_code}")
+
+        if timer.first_query_at is None:
+            return 0.0, total
+
+        if committed_at:
+            return (committed_at[0] - timer.first_query_at) * 1000, total
+
+        return timer.queries * 1000, total
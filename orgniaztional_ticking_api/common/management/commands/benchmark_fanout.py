@@ -0,0 +1,105 @@
+from time import perf_counter
+
+from celery import group
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from config.celery import celery
+from orgniaztional_ticking_api.common.fanout import FanOut
+from orgniaztional_ticking_api.common.models import FanOutRun
+from orgniaztional_ticking_api.common.tasks import fanout_chunk
+from orgniaztional_ticking_api.users.models import BaseUser
+
+EMAIL_DOMAIN = "fanout-benchmark.invalid"
+
+
+class BenchmarkFanOut(FanOut):
+    """
+    Same work as `config.tasks.NotifyCustomers`, over the benchmark users only.
+    """
+
+    def get_queryset(self):
+        return BaseUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}")
+
+    def process_chunk(self, pks):
+        return len(BaseUser.objects.filter(pk__in=pks).values_list("email", flat=True))
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class TaskCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, **kwargs):
+        self.count += 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare one task per recipient with chunked fan-out waves, in Celery eager mode. "
+        "Creates the recipients and deletes them at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=20000)
+        parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[100, 500, 2000])
+        parser.add_argument("--parallelism", type=int, default=4)
+
+    def handle(self, *args, users, chunk_sizes, parallelism, **options):
+        from celery.signals import task_prerun
+
+        celery.conf.task_always_eager = True
+
+        BaseUser.objects.bulk_create(
+            [BaseUser(email=f"user-{index}@{EMAIL_DOMAIN}", password="!") for index in range(users)],
+            batch_size=1000,
+        )
+
+        tasks = TaskCounter()
+        task_prerun.connect(tasks)
+
+        try:
+            pks = list(BenchmarkFanOut().get_queryset().order_by("pk").values_list("pk", flat=True))
+
+            self.measure("one task per user", tasks, lambda: group(
+                fanout_chunk.s(BenchmarkFanOut.get_path(), {}, [pk]) for pk in pks
+            ).apply_async())
+
+            for chunk_size in chunk_sizes:
+                # Runs load the fan-out by path, so the settings go on the class
+                BenchmarkFanOut.chunk_size = chunk_size
+                BenchmarkFanOut.parallelism = parallelism
+
+                self.measure(f"chunks of {chunk_size} x {parallelism}", tasks, lambda: self.run_fanout(users))
+        finally:
+            task_prerun.disconnect(tasks)
+            BaseUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").delete()
+
+    def run_fanout(self, users):
+        # Eager, the whole run is done when `start` returns
+        run = BenchmarkFanOut().start()
+
+        run.refresh_from_db()
+        assert run.status == FanOutRun.Status.COMPLETED and run.processed == users, run
+        run.delete()
+
+    def measure(self, label, tasks, func):
+        queries = QueryCounter()
+        tasks.count = 0
+
+        start = perf_counter()
+
+        with connection.execute_wrapper(queries):
+            func()
+
+        elapsed = perf_counter() - start
+
+        self.stdout.write(f"{label:>24}: {elapsed:8.3f}s, {tasks.count:6} tasks, {queries.count:6} queries")
@@ -0,0 +1,98 @@
+from timeit import Timer
+
+from django.core.management.base import BaseCommand
+
+from rest_framework import serializers
+
+from orgniaztional_ticking_api.common.utils import create_serializer_class, inline_serializer, make_mock_object
+
+
+def uncached_create_serializer_class(name, fields):
+    # `create_serializer_class` before classes were cached: a new class on every call
+    return type(name, (serializers.Serializer, ), fields)
+
+
+def uncached_inline_serializer(*, fields, data=None, **kwargs):
+    serializer_class = uncached_create_serializer_class(name='', fields=fields)
+
+    if data is not None:
+        return serializer_class(data=data, **kwargs)
+
+    return serializer_class(**kwargs)
+
+
+def get_fields(helper):
+    return {
+        "id": serializers.IntegerField(),
+        "email": serializers.EmailField(),
+        "is_active": serializers.BooleanField(),
+        "created_at": serializers.DateTimeField(),
+        "tags": serializers.ListField(child=serializers.CharField(max_length=32)),
+        "profile": helper(fields={
+            "bio": serializers.CharField(allow_null=True),
+            "posts_count": serializers.IntegerField(),
+        }),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Per call cost of inline_serializer building a new Serializer class every time versus reusing cached "
+        "classes. `class` only creates the class, the other timings include building the fields."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=5_000)
+
+    def handle(self, *args, number, **options):
+        instance = make_mock_object(
+            id=1,
+            email="jane.doe@example.com",
+            is_active=True,
+            created_at=None,
+            tags=["a", "b"],
+            profile=make_mock_object(bio="Hi", posts_count=3),
+        )
+        data = {
+            "id": "1",
+            "email": "jane.doe@example.com",
+            "is_active": "true",
+            "created_at": "2022-10-01T10:00:00Z",
+            "tags": ["a", "b"],
+            "profile": {"bio": "Hi", "posts_count": "3"},
+        }
+
+        helpers = (
+            ("uncached", uncached_create_serializer_class, uncached_inline_serializer),
+            ("cached", create_serializer_class, inline_serializer),
+        )
+
+        for label, create, helper in helpers:
+            fields = get_fields(helper)
+
+            def create_class():
+                create(name='', fields=fields)
+
+            def build():
+                helper(fields=get_fields(helper))
+
+            def output():
+                return helper(instance=instance, fields=get_fields(helper)).data
+
+            def validate():
+                serializer = helper(data=data, fields=get_fields(helper))
+                serializer.is_valid(raise_exception=True)
+
+            timings = {
+                name: Timer(function).timeit(number) / number
+                for name, function in (
+                    ("class", create_class),
+                    ("build", build),
+                    ("output", output),
+                    ("validate", validate),
+                )
+            }
+
+            self.stdout.write(
+                f"{label:>8}: " + ", ".join(f"{name} {timing * 1e6:7.2f}us" for name, timing in timings.items())
+            )
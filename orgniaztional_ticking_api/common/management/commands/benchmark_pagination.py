@@ -0,0 +1,71 @@
+from statistics import median
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from rest_framework.request import Request
+
+from orgniaztional_ticking_api.api.pagination import KeysetPagination, LimitOffsetPagination
+from orgniaztional_ticking_api.users.models import BaseUser
+
+
+class Command(BaseCommand):
+    help = "Compare LimitOffsetPagination and KeysetPagination page latency at a shallow and a deep offset."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offset", type=int, default=1_000_000)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, offset, limit, repeat, **options):
+        queryset = BaseUser.objects.all()
+
+        if not queryset.order_by("pk")[offset:offset + 1].exists():
+            raise CommandError(
+                f"Need more than {offset} users to benchmark that offset, seed the database first."
+            )
+
+        factory = RequestFactory()
+
+        for depth in (0, offset):
+            limit_offset = self.measure(
+                LimitOffsetPagination,
+                queryset,
+                factory.get("/", {"limit": limit, "offset": depth}),
+                repeat,
+            )
+            keyset = self.measure(
+                KeysetPagination,
+                queryset,
+                factory.get("/", self.keyset_params(queryset, depth, limit)),
+                repeat,
+            )
+
+            self.stdout.write(
+                f"offset={depth:>9} limit_offset={limit_offset:8.2f}ms keyset={keyset:8.2f}ms"
+            )
+
+    def keyset_params(self, queryset, depth, limit):
+        params = {"limit": limit}
+
+        if depth == 0:
+            return params
+
+        # The cursor a client would have received after walking to `depth`
+        paginator = KeysetPagination()
+        item = queryset.order_by("-created_at", "-pk")[depth - 1]
+        params[paginator.cursor_query_param] = paginator.get_cursor(item, reverse=False)
+
+        return params
+
+    def measure(self, pagination_class, queryset, request, repeat):
+        timings = []
+
+        for _ in range(repeat):
+            paginator = pagination_class()
+            start = perf_counter()
+            paginator.paginate_queryset(queryset, Request(request))
+            timings.append((perf_counter() - start) * 1000)
+
+        return median(timings)
@@ -0,0 +1,99 @@
+from datetime import timedelta
+from timeit import Timer
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from rest_framework import serializers
+
+from orgniaztional_ticking_api.api.serializers import ReadOnlyModelSerializer
+from orgniaztional_ticking_api.users.models import BaseUser, Profile
+
+USER_FIELDS = ("id", "email", "is_active", "is_admin", "created_at", "updated_at")
+PROFILE_FIELDS = ("id", "user", "bio", "posts_count", "subscriber_count", "subscription_count")
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BaseUser
+        fields = USER_FIELDS
+
+
+class UserReadSerializer(ReadOnlyModelSerializer):
+    class Meta:
+        model = BaseUser
+        fields = USER_FIELDS
+
+
+class ProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Profile
+        fields = PROFILE_FIELDS
+
+
+class ProfileReadSerializer(ReadOnlyModelSerializer):
+    class Meta:
+        model = Profile
+        fields = PROFILE_FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Serialization CPU of a large list response: ModelSerializer(many=True) over model instances versus "
+        "ReadOnlyModelSerializer over model instances and over `.values()` rows. Rows are built in memory, "
+        "the database isn't involved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--number", type=int, default=20)
+
+    def handle(self, *args, rows, number, **options):
+        now = timezone.now()
+
+        users = [
+            BaseUser(
+                id=index,
+                email=f"user-{index}@example.com",
+                is_active=True,
+                is_admin=False,
+                created_at=now - timedelta(minutes=index),
+                updated_at=now,
+            )
+            for index in range(rows)
+        ]
+        profiles = [
+            Profile(id=index, user_id=index, bio="Hi", posts_count=index, subscriber_count=1, subscription_count=2)
+            for index in range(rows)
+        ]
+
+        cases = (
+            ("BaseUser", UserSerializer, UserReadSerializer, users),
+            ("Profile", ProfileSerializer, ProfileReadSerializer, profiles),
+        )
+
+        for label, serializer_class, read_serializer_class, instances in cases:
+            # What `.values()` would return for the instances
+            values = [
+                {values_key: getter(instance) for _, getter, values_key, _ in read_serializer_class.get_plan()}
+                for instance in instances
+            ]
+
+            assert serializer_class(instances, many=True).data == read_serializer_class(instances, many=True).data
+            assert read_serializer_class(values, many=True).data == read_serializer_class(instances, many=True).data
+
+            timings = {
+                name: Timer(lambda: serializer(items, many=True).data).timeit(number) / number
+                for name, serializer, items in (
+                    ("ModelSerializer", serializer_class, instances),
+                    ("read, instances", read_serializer_class, instances),
+                    ("read, values", read_serializer_class, values),
+                )
+            }
+            baseline = timings["ModelSerializer"]
+
+            self.stdout.write(
+                f"{label} x {rows}: " + ", ".join(
+                    f"{name} {timing * 1000:.2f}ms ({baseline / timing:.1f}x)" for name, timing in timings.items()
+                )
+            )
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.7 on 2026-10-17 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_fanoutrun'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='fanoutrun',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'running')), fields=('fanout',), name='fanoutrun_one_running_per_fanout'),
+        ),
+    ]
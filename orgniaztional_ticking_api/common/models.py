@@ -26,3 +26,47 @@ class RandomModel(BaseModel):
                 check=Q(start_date__lt=F("end_date"))
             )
         ]
+
+
+class FanOutRun(BaseModel):
+    """
+    Progress of a `common.fanout.FanOut`, so it can resume where it stopped.
+    """
+
+    class Status(models.TextChoices):
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+
+    # Dotted path of the `FanOut` subclass
+    fanout = models.CharField(max_length=255, db_index=True)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.RUNNING)
+
+    # Primary key of the last item of the last finished wave
+    cursor = models.JSONField(null=True, blank=True)
+    wave = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # One run of a fan-out at a time, see `FanOut.start`
+            models.UniqueConstraint(
+                name="fanoutrun_one_running_per_fanout",
+                fields=["fanout"],
+                condition=Q(status="running"),
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.fanout} #{self.pk} ({self.status}, {self.processed}/{self.total})"
+
+    @property
+    def progress(self) -> float:
+        if not self.total:
+            return 1.0 if self.status == self.Status.COMPLETED else 0.0
+
+        return min(self.processed / self.total, 1.0)
@@ -0,0 +1,56 @@
+import random
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from orgniaztional_ticking_api.common.db import get_request_state, is_read_only
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads marked with `common.db.read_only` (read only views, `replica` selectors) to a random
+    replica from `DATABASE_REPLICAS`, everything else to the primary (`default`).
+
+    Reads stay on the primary:
+        - inside a transaction on the primary, so they see its uncommitted writes
+        - when the request already wrote, or the user wrote in the last `DATABASE_STICKY_SECONDS`
+    """
+
+    def get_replicas(self):
+        return settings.DATABASE_REPLICAS
+
+    def db_for_read(self, model, **hints):
+        replicas = self.get_replicas()
+
+        if not replicas or not is_read_only():
+            return DEFAULT_DB_ALIAS
+
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        state = get_request_state()
+
+        if state is not None and state.is_sticky():
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = get_request_state()
+
+        if state is not None:
+            state.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *self.get_replicas()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication
+        return db == DEFAULT_DB_ALIAS
@@ -1,7 +1,16 @@
-from typing import List, Dict, Any, Tuple
+from collections import defaultdict
+from typing import List, Dict, Any, Sequence, Tuple
+
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
 
 from orgniaztional_ticking_api.common.types import DjangoModelType
 
+# `bulk_update` doesn't send `post_save`, `model_bulk_update` sends this instead,
+# with `sender` the model and `instances` the updated instances
+post_bulk_update = Signal()
+
 
 def model_update(
     *,
@@ -46,3 +55,72 @@ def model_update(
         instance.save(update_fields=fields)
 
     return instance, has_updated
+
+
+def model_bulk_update(
+    *,
+    instances: Sequence[DjangoModelType],
+    fields: List[str],
+    data: Sequence[Dict[str, Any]],
+    validate: bool = True,
+    batch_size: int = 1000
+) -> List[DjangoModelType]:
+    """
+    Bulk version of `model_update`, `data[i]` holds the new values for `instances[i]`.
+
+    For example:
+
+    def user_bulk_update(*, users: List[User], data: List[Dict]) -> List[User]:
+        fields = ['first_name', 'last_name']
+        return model_bulk_update(instances=users, fields=fields, data=data)
+
+    Only the columns that actually changed are written. Instances are grouped by their set of
+    changed fields and every group is saved with `bulk_update`, so N rows cost a handful of queries.
+
+    With `validate`, only the changed fields go through `clean_fields`. Uniqueness and the model
+    constraints are left to the database, instead of one `SELECT` per row from `full_clean`.
+
+    `auto_now` fields (`updated_at`) of changed instances are set, as `save` would. Receivers of
+    `post_bulk_update` take care of what `post_save` receivers would do, like cache invalidation.
+
+    Return value: The instances that were changed.
+    """
+    if len(instances) != len(data):
+        raise ValueError("instances and data must have the same length")
+
+    changed_by_fields = defaultdict(list)
+    now = timezone.now()
+
+    for instance, instance_data in zip(instances, data):
+        changed_fields = []
+
+        for field in fields:
+            # Skip if a field is not present in the actual data
+            if field not in instance_data:
+                continue
+
+            if getattr(instance, field) != instance_data[field]:
+                changed_fields.append(field)
+                setattr(instance, field, instance_data[field])
+
+        if not changed_fields:
+            continue
+
+        if validate:
+            all_fields = [model_field.name for model_field in instance._meta.fields]
+            instance.clean_fields(exclude=[field for field in all_fields if field not in changed_fields])
+
+        for model_field in instance._meta.concrete_fields:
+            if getattr(model_field, "auto_now", False) and model_field.name not in changed_fields:
+                setattr(instance, model_field.attname, now)
+                changed_fields.append(model_field.name)
+
+        changed_by_fields[tuple(changed_fields)].append(instance)
+
+    with transaction.atomic():
+        for changed_fields, changed_instances in changed_by_fields.items():
+            model = type(changed_instances[0])
+            model._default_manager.bulk_update(changed_instances, fields=changed_fields, batch_size=batch_size)
+            post_bulk_update.send(sender=model, instances=changed_instances)
+
+    return [instance for changed_instances in changed_by_fields.values() for instance in changed_instances]
@@ -0,0 +1,71 @@
+from django.core.signals import request_finished, request_started
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    worker_init,
+    worker_process_shutdown,
+    worker_ready,
+)
+
+from . import celery_metrics
+from .db import close_unusable_connections, mark_connections_idle, track_connection, update_connection_metrics
+
+
+@receiver(connection_created)
+def connection_created_handler(sender, connection, **kwargs):
+    track_connection(connection)
+
+
+# Django closes connections older than `CONN_MAX_AGE` around every request, the Celery Django fixup
+# around every task. These handle connections that are young enough but dead.
+@receiver(request_started)
+@receiver(task_prerun)
+def health_check_handler(**kwargs):
+    close_unusable_connections()
+
+
+@receiver(request_finished)
+@receiver(task_postrun)
+def connection_metrics_handler(**kwargs):
+    mark_connections_idle()
+    update_connection_metrics()
+
+
+@receiver(before_task_publish)
+def task_published_handler(headers, **kwargs):
+    celery_metrics.task_published(headers)
+
+
+@receiver(task_prerun)
+def task_started_handler(task, **kwargs):
+    celery_metrics.task_started(task)
+
+
+@receiver(task_postrun)
+def task_finished_handler(task, task_id, state=None, **kwargs):
+    celery_metrics.task_finished(task, task_id, state)
+
+
+@receiver(task_retry)
+def task_retried_handler(sender, **kwargs):
+    celery_metrics.task_retried(sender)
+
+
+@receiver(worker_init)
+def worker_init_handler(**kwargs):
+    celery_metrics.clear_multiprocess_dir()
+
+
+@receiver(worker_ready)
+def worker_ready_handler(sender, **kwargs):
+    celery_metrics.start_worker_metrics_server(sender.app)
+
+
+@receiver(worker_process_shutdown)
+def worker_process_shutdown_handler(pid, **kwargs):
+    celery_metrics.process_exited(pid)
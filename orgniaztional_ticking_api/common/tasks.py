@@ -0,0 +1,155 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+from celery import chord, shared_task
+from django_celery_results.backends import DatabaseBackend
+from django_celery_results.models import GroupResult, TaskResult
+
+from orgniaztional_ticking_api.common.celery_metrics import InstrumentedTask
+from orgniaztional_ticking_api.common.models import FanOutRun
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseResultTask(InstrumentedTask):
+    """
+    Base for tasks whose results must outlive `CELERY_RESULT_EXPIRES`, they are stored in the database
+    and pruned after `CELERY_DATABASE_RESULT_EXPIRES`.
+
+    @shared_task(base=DatabaseResultTask, ignore_result=False)
+    def export_report(...):
+        ...
+
+    Read results with `export_report.AsyncResult(task_id)`, `AsyncResult` of the app looks in Redis.
+    """
+
+    @cached_property
+    def backend(self):
+        return DatabaseBackend(app=self.app)
+
+
+def get_fanout(path):
+    return import_string(path)()
+
+
+@shared_task
+def fanout_wave(run_id):
+    """
+    Sends the next wave of a `common.fanout.FanOut` run, or completes the run when there's nothing left.
+    """
+    run = FanOutRun.objects.filter(pk=run_id, status=FanOutRun.Status.RUNNING).first()
+
+    if run is None:
+        return
+
+    fanout = get_fanout(run.fanout)
+    pks = fanout.get_wave(run)
+
+    if not pks:
+        FanOutRun.objects.filter(pk=run.pk, wave=run.wave).update(
+            status=FanOutRun.Status.COMPLETED,
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        logger.info("Fan-out %s #%s completed, %s items", run.fanout, run.pk, run.processed)
+        return
+
+    # Heartbeat for `fanout_resume`
+    FanOutRun.objects.filter(pk=run.pk).update(updated_at=timezone.now())
+
+    header = [fanout_chunk.s(run.fanout, run.params, chunk) for chunk in fanout.get_chunks(pks)]
+    callback = fanout_wave_done.s(run.pk, run.wave, pks[-1]).on_error(fanout_failed.si(run.pk))
+
+    chord(header)(callback)
+
+
+# Chords need the results of their header
+@shared_task(
+    ignore_result=False,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def fanout_chunk(path, params, pks):
+    processed = get_fanout(path).process_chunk(pks, **params)
+
+    return len(pks) if processed is None else processed
+
+
+@shared_task
+def fanout_wave_done(results, run_id, wave, cursor):
+    # Conditional on `wave`, a wave that was sent twice (see `fanout_resume`) only advances the run once
+    advanced = FanOutRun.objects.filter(pk=run_id, wave=wave, status=FanOutRun.Status.RUNNING).update(
+        cursor=cursor,
+        wave=F("wave") + 1,
+        processed=F("processed") + sum(results),
+        updated_at=timezone.now(),
+    )
+
+    if advanced:
+        fanout_wave.delay(run_id)
+
+
+@shared_task
+def fanout_failed(run_id):
+    FanOutRun.objects.filter(pk=run_id, status=FanOutRun.Status.RUNNING).update(
+        status=FanOutRun.Status.FAILED,
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+    logger.error("Fan-out run #%s failed", run_id)
+
+
+@shared_task
+def fanout_resume():
+    """
+    Restarts runs that made no progress for their fan-out's `stale_after`, e.g. because the worker
+    running the chord callback was killed. They continue from the last finished wave.
+    """
+    now = timezone.now()
+
+    for run in FanOutRun.objects.filter(status=FanOutRun.Status.RUNNING):
+        if run.updated_at > now - get_fanout(run.fanout).stale_after:
+            continue
+
+        logger.warning("Resuming fan-out %s #%s from %s", run.fanout, run.pk, run.cursor)
+        fanout_wave.delay(run.pk)
+
+
+@shared_task(
+    soft_time_limit=settings.CELERY_MAINTENANCE_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.CELERY_MAINTENANCE_TASK_TIME_LIMIT,
+)
+def celery_results_prune():
+    """
+    Deletes `DatabaseResultTask` results older than `CELERY_DATABASE_RESULT_EXPIRES`, in batches
+    so a large backlog doesn't hold locks on the result tables for long.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.CELERY_DATABASE_RESULT_EXPIRES)
+    batch_size = settings.CELERY_DATABASE_RESULT_PRUNE_BATCH_SIZE
+    deleted = 0
+
+    for queryset in [
+        TaskResult.objects.filter(date_done__lt=cutoff),
+        GroupResult.objects.filter(date_done__lt=cutoff),
+    ]:
+        while True:
+            pks = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+
+            if not pks:
+                break
+
+            # No signals or relations, a single `DELETE ... WHERE id IN (...)`
+            deleted += queryset.model.objects.filter(pk__in=pks).delete()[0]
+
+    logger.info("Pruned %s task results older than %s", deleted, cutoff)
+
+    return deleted
@@ -0,0 +1,66 @@
+from django.test import SimpleTestCase
+
+from orgniaztional_ticking_api.common.bloom import BloomFilter, RedisBloomFilter
+from orgniaztional_ticking_api.utils.tests.redis import FakeRedisMixin
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"item-{index}" for index in range(1000)]
+
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+        for index in range(1000):
+            bloom.add(f"item-{index}")
+
+        false_positives = sum(f"other-{index}" in bloom for index in range(10_000))
+
+        # 1% expected, with room for the hashes of this particular set
+        self.assertLess(false_positives, 300)
+
+    def test_empty(self):
+        self.assertNotIn("item", BloomFilter(capacity=0))
+
+
+class RedisBloomFilterTests(FakeRedisMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.bloom = RedisBloomFilter("tests:bloom", capacity=100)
+
+    def test_add_and_contains(self):
+        self.assertNotIn("a@example.com", self.bloom)
+
+        self.bloom.add("a@example.com")
+        self.bloom.add_many(["b@example.com", "c@example.com"])
+
+        for item in ["a@example.com", "b@example.com", "c@example.com"]:
+            self.assertIn(item, self.bloom)
+
+        self.assertNotIn("d@example.com", self.bloom)
+
+    def test_rebuild_drops_removed_items(self):
+        self.bloom.add_many(["a@example.com", "b@example.com"])
+
+        self.assertEqual(self.bloom.rebuild(iter(["b@example.com", "c@example.com"]), batch_size=1), 2)
+
+        self.assertNotIn("a@example.com", self.bloom)
+        self.assertIn("b@example.com", self.bloom)
+        self.assertIn("c@example.com", self.bloom)
+        self.assertFalse(self.redis.exists("tests:bloom:building"))
+
+    def test_rebuild_with_nothing_empties_the_filter(self):
+        self.bloom.add("a@example.com")
+
+        self.assertEqual(self.bloom.rebuild([]), 0)
+
+        self.assertNotIn("a@example.com", self.bloom)
+        self.assertFalse(self.redis.exists("tests:bloom"))
@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from orgniaztional_ticking_api.common.cache import ReadThroughCache
+
+
+class ReadThroughCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.read_through = ReadThroughCache(namespace="tests", timeout=60)
+        self.loader = mock.Mock(side_effect=["first", "second"])
+
+    def test_loads_once_then_hits(self):
+        self.assertEqual(self.read_through.get(1, self.loader), "first")
+        self.assertEqual(self.read_through.get(1, self.loader), "first")
+
+        self.assertEqual(self.loader.call_count, 1)
+
+    def test_invalidate_reloads(self):
+        self.read_through.get(1, self.loader)
+        self.read_through.invalidate(1)
+
+        self.assertEqual(self.read_through.get(1, self.loader), "second")
+
+    def test_invalidate_before_first_read(self):
+        self.read_through.invalidate(1)
+
+        self.assertEqual(self.read_through.get(1, self.loader), "first")
+        self.assertEqual(self.read_through.get(1, self.loader), "first")
+
+    def test_evicted_generation_does_not_serve_old_values(self):
+        generation_key = self.read_through.make_key(1, "gen")
+
+        self.read_through.get(1, self.loader)
+        self.read_through.invalidate(1)
+        old_generation = cache.get(generation_key)
+        self.read_through.get(1, self.loader)
+
+        # Evict the generation, but keep the values cached under the older ones
+        cache.delete(generation_key)
+
+        self.assertEqual(self.read_through.get(1, mock.Mock(return_value="third")), "third")
+        self.assertGreater(cache.get(generation_key), old_generation)
+
+    def test_keys_are_independent(self):
+        self.read_through.get(1, self.loader)
+        self.read_through.invalidate(2)
+
+        self.assertEqual(self.read_through.get(1, self.loader), "first")
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from orgniaztional_ticking_api.common.fanout import FanOut
+from orgniaztional_ticking_api.common.models import FanOutRun
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.utils.tests.factories import BaseUserFactory
+
+
+class DeactivateUsers(FanOut):
+    chunk_size = 2
+    parallelism = 2
+
+    def get_queryset(self, *, domain):
+        return BaseUser.objects.filter(email__endswith=domain)
+
+    def process_chunk(self, pks, *, domain):
+        return BaseUser.objects.filter(pk__in=pks, is_active=True).update(is_active=False)
+
+
+class FanOutTests(TestCase):
+    """
+    Celery runs eagerly in tests, the whole run happens when `start`'s transaction commits.
+    """
+
+    def setUp(self):
+        self.users = [BaseUserFactory(email=f"user-{index}@example.com") for index in range(9)]
+        self.other = BaseUserFactory(email="other@example.org")
+
+    def test_run_processes_every_item_and_completes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            run = DeactivateUsers().start(domain="@example.com")
+
+        run.refresh_from_db()
+
+        self.assertEqual(run.status, FanOutRun.Status.COMPLETED)
+        self.assertIsNotNone(run.finished_at)
+        self.assertEqual((run.total, run.processed), (9, 9))
+        # 2 waves of 4 and 1 of 1
+        self.assertEqual(run.wave, 3)
+        self.assertEqual(run.cursor, self.users[-1].pk)
+
+        self.assertFalse(BaseUser.objects.filter(email__endswith="@example.com", is_active=True).exists())
+        self.other.refresh_from_db()
+        self.assertTrue(self.other.is_active)
+
+    def test_start_returns_the_running_run(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            run = DeactivateUsers().start(domain="@example.com")
+            again = DeactivateUsers().start(domain="@example.org")
+
+        self.assertEqual(again, run)
+        self.assertEqual(again.params, {"domain": "@example.com"})
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(FanOutRun.objects.count(), 1)
+
+    def test_one_running_run_per_fanout_is_enforced(self):
+        path = DeactivateUsers.get_path()
+
+        FanOutRun.objects.create(fanout=path, status=FanOutRun.Status.COMPLETED)
+        FanOutRun.objects.create(fanout=path)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            FanOutRun.objects.create(fanout=path)
+
+    def test_concurrent_start_returns_the_other_run(self):
+        with self.captureOnCommitCallbacks():
+            run = DeactivateUsers().start(domain="@example.com")
+
+        # As if a concurrent `start` created its run after this one checked
+        with self.captureOnCommitCallbacks() as callbacks, mock.patch.object(QuerySet, "first", return_value=None):
+            again = DeactivateUsers().start(domain="@example.com")
+
+        self.assertEqual(again, run)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(FanOutRun.objects.count(), 1)
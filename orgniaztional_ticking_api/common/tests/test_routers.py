@@ -0,0 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.test import RequestFactory, TransactionTestCase, override_settings
+
+from orgniaztional_ticking_api.common.db import get_request_state, read_only, request_state
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.utils.tests.factories import BaseUserFactory
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], DATABASE_STICKY_SECONDS=5)
+class PrimaryReplicaRouterTests(TransactionTestCase):
+    """
+    Two SQLite databases, the primary (`default`) and a replica. Rows are created on each separately,
+    so the result of a read tells which database it went to.
+
+    Not a `TestCase`, reads in its transaction would all stay on the primary.
+    """
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpClass(cls):
+        # The router only migrates `default`, replicas get the schema through replication
+        with connections["replica"].schema_editor() as schema_editor:
+            schema_editor.create_model(BaseUser)
+
+        # Created once, flushing between tests skips the tables the router doesn't migrate
+        BaseUser.objects.using("replica").create(email="replica@example.com", password="")
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+
+        with connections["replica"].schema_editor() as schema_editor:
+            schema_editor.delete_model(BaseUser)
+
+    def setUp(self):
+        cache.clear()
+
+        self.user = BaseUserFactory(email="primary@example.com")
+
+    def read_email(self):
+        return BaseUser.objects.order_by("pk").values_list("email", flat=True).first()
+
+    def make_request(self, user=None):
+        request = RequestFactory().get("/")
+        request.user = user
+
+        return request
+
+    def test_reads_go_to_the_primary_by_default(self):
+        self.assertEqual(self.read_email(), "primary@example.com")
+
+    def test_read_only_reads_go_to_the_replica(self):
+        with read_only():
+            self.assertEqual(self.read_email(), "replica@example.com")
+
+        self.assertEqual(self.read_email(), "primary@example.com")
+
+    def test_writes_go_to_the_primary(self):
+        with read_only():
+            BaseUserFactory(email="new@example.com")
+
+        self.assertTrue(BaseUser.objects.using("default").filter(email="new@example.com").exists())
+        self.assertFalse(BaseUser.objects.using("replica").filter(email="new@example.com").exists())
+
+    def test_reads_in_a_transaction_stay_on_the_primary(self):
+        with transaction.atomic(), read_only():
+            self.assertEqual(self.read_email(), "primary@example.com")
+
+    def test_request_that_wrote_reads_from_the_primary(self):
+        with request_state(self.make_request()), read_only():
+            self.assertEqual(self.read_email(), "replica@example.com")
+
+            BaseUserFactory(email="new@example.com")
+
+            self.assertEqual(self.read_email(), "primary@example.com")
+
+    def test_user_that_wrote_sticks_to_the_primary_in_the_next_requests(self):
+        other_user = BaseUserFactory(email="other@example.com")
+
+        with request_state(self.make_request(self.user)) as state:
+            BaseUserFactory(email="new@example.com")
+            state.save()
+
+        with request_state(self.make_request(self.user)), read_only():
+            self.assertEqual(self.read_email(), "primary@example.com")
+
+        with request_state(self.make_request(other_user)), read_only():
+            self.assertEqual(self.read_email(), "replica@example.com")
+
+        cache.clear()
+
+        with request_state(self.make_request(self.user)), read_only():
+            self.assertEqual(self.read_email(), "replica@example.com")
+
+    def test_request_state_is_pinned_to_its_context(self):
+        with request_state(self.make_request()) as state:
+            state.wrote = True
+
+            # Another thread (another request) doesn't see this request's state
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertIsNone(executor.submit(get_request_state).result())
+
+            self.assertIs(get_request_state(), state)
+
+        self.assertIsNone(get_request_state())
@@ -1,3 +1,6 @@
+import types
+from functools import lru_cache
+
 from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.http import Http404
@@ -21,8 +24,72 @@ def get_object(model_or_queryset, **kwargs):
         return None
 
 
+# Generated serializer classes kept by `create_serializer_class`
+SERIALIZER_CLASS_CACHE_SIZE = 512
+
+# Field arguments that are the same object on every call, so they can be part of a fingerprint
+_STABLE_TYPES = (str, bytes, int, float, bool, type(None), type, types.FunctionType, types.BuiltinFunctionType)
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _fingerprint(value):
+    if isinstance(value, serializers.Field):
+        # `Field.__new__` keeps the arguments every field (and nested serializer) was created with
+        return (type(value), _fingerprint(value._args), _fingerprint(value._kwargs))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_fingerprint(item) for item in value))
+
+    if isinstance(value, dict):
+        # In order, the order of the fields is the order of the output
+        return (dict, tuple((key, _fingerprint(item)) for key, item in value.items()))
+
+    if isinstance(value, _STABLE_TYPES):
+        # `1 == 1.0 == True`, but `max_value=1.0` isn't the same field as `max_value=True`
+        return (type(value), value)
+
+    # Querysets, validator instances, ... are built on every call, a fingerprint would never match
+    raise _Uncacheable
+
+
+class _Fields:
+    """
+    Serializer fields, equal to other `_Fields` with the same fingerprint, as an `lru_cache` key.
+    """
+
+    def __init__(self, fields, fingerprint):
+        self.fields = fields
+        self.fingerprint = fingerprint
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other):
+        return self.fingerprint == other.fingerprint
+
+
+@lru_cache(maxsize=SERIALIZER_CLASS_CACHE_SIZE)
+def _create_serializer_class(name, fields):
+    return type(name, (serializers.Serializer, ), fields.fields)
+
+
 def create_serializer_class(name, fields):
-    return type(name, (serializers.Serializer, ), fields)
+    """
+    Builds a `Serializer` class with `fields`, or returns the one built for the same name and fields before,
+    so the fields aren't collected again on every call.
+
+    Fields are compared by class and arguments. Fields with arguments that aren't stable between calls
+    (e.g. a queryset) get a new class every time.
+    """
+    try:
+        fingerprint = _fingerprint(fields)
+    except _Uncacheable:
+        return type(name, (serializers.Serializer, ), fields)
+
+    return _create_serializer_class(name, _Fields(fields, fingerprint))
 
 
 def inline_serializer(*, fields, data=None, **kwargs):
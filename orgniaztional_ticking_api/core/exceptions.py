@@ -4,3 +4,15 @@ class ApplicationError(Exception):
 
         self.message = message
         self.extra = extra or {}
+
+
+class ServiceUnavailableError(ApplicationError):
+    """
+    A dependency is overloaded or down, the request can be retried later.
+    """
+
+
+class ConflictError(ApplicationError):
+    """
+    The request conflicts with the current state, e.g. a unique value is already taken.
+    """
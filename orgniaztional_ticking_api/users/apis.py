@@ -3,50 +3,54 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import serializers
 
-from django.core.validators import MinLengthValidator
-from .validators import number_validator, special_char_validator, letter_validator
+from django.contrib.auth.password_validation import validate_password
 from orgniaztional_ticking_api.users.models import BaseUser , Profile
-from orgniaztional_ticking_api.api.mixins import ApiAuthMixin
+from orgniaztional_ticking_api.api.mixins import ApiAuthMixin, ApiTokenUserAuthMixin
+from orgniaztional_ticking_api.api.permissions import IsAdmin
+from orgniaztional_ticking_api.api.serializers import ReadOnlyModelSerializer
+from orgniaztional_ticking_api.users.caches import profile_cache
 from orgniaztional_ticking_api.users.selectors import get_profile
-from orgniaztional_ticking_api.users.services import register 
-from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from orgniaztional_ticking_api.users.services import register, register_bulk
+from orgniaztional_ticking_api.authentication.tokens import RefreshToken
 
 from drf_spectacular.utils import extend_schema
 
 
-class ProfileApi(ApiAuthMixin, APIView):
+class ProfileApi(ApiTokenUserAuthMixin, APIView):
+    # A cache miss runs 2 (`is_active` check and the profile), a hit none, see `users.tests.test_apis`
+    query_budget = 3
+    read_only = True
 
-    class OutPutSerializer(serializers.ModelSerializer):
+    class OutPutSerializer(ReadOnlyModelSerializer):
         class Meta:
             model = Profile 
             fields = ("bio", "posts_count", "subscriber_count", "subscription_count")
 
     @extend_schema(responses=OutPutSerializer)
     def get(self, request):
-        query = get_profile(user=request.user)
-        return Response(self.OutPutSerializer(query, context={"request":request}).data)
+        data = profile_cache.get(
+                request.user.pk,
+                lambda: self.OutPutSerializer(get_profile(user=request.user), context={"request":request}).data
+                )
+        return Response(data)
 
 
 class RegisterApi(APIView):
+    # 6 on SQLite (BEGIN, email check, savepoint, two inserts, release), 5 on Postgres, see `users.tests.test_apis`
+    query_budget = 7
 
 
     class InputRegisterSerializer(serializers.Serializer):
         email = serializers.EmailField(max_length=255)
         bio = serializers.CharField(max_length=1000, required=False)
-        password = serializers.CharField(
-                validators=[
-                        number_validator,
-                        letter_validator,
-                        special_char_validator,
-                        MinLengthValidator(limit_value=10)
-                    ]
-                )
+        password = serializers.CharField()
         confirm_password = serializers.CharField(max_length=255)
-        
-        def validate_email(self, email):
-            if BaseUser.objects.filter(email=email).exists():
-                raise serializers.ValidationError("email Already Taken")
-            return email
+
+        def validate_password(self, password):
+            # `AUTH_PASSWORD_VALIDATORS`, every violation is reported at once.
+            # An unsaved user, for the similarity check against the email
+            validate_password(password, user=BaseUser(email=self.initial_data.get("email", "")))
+            return password
 
         def validate(self, data):
             if not data.get("password") or not data.get("confirm_password"):
@@ -81,16 +85,64 @@ class RegisterApi(APIView):
     def post(self, request):
         serializer = self.InputRegisterSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        try:
-            user = register(
-                    email=serializer.validated_data.get("email"),
-                    password=serializer.validated_data.get("password"),
-                    bio=serializer.validated_data.get("bio"),
-                    )
-        except Exception as ex:
-            return Response(
-                    f"Database Error {ex}",
-                    status=status.HTTP_400_BAD_REQUEST
-                    )
+
+        # A taken email raises `ConflictError`, a 409
+        user = register(
+                email=serializer.validated_data.get("email"),
+                password=serializer.validated_data.get("password"),
+                bio=serializer.validated_data.get("bio"),
+                )
+
         return Response(self.OutPutRegisterSerializer(user, context={"request":request}).data)
 
+
+class RegisterBulkApi(ApiAuthMixin, APIView):
+    permission_classes = (IsAdmin, )
+
+    # Emails are checked for the whole batch at once in `register_bulk`
+    InputRegisterSerializer = RegisterApi.InputRegisterSerializer
+
+
+    class InputSerializer(serializers.Serializer):
+        users = serializers.ListField(
+                child=serializers.DictField(),
+                allow_empty=False,
+                max_length=5000,
+                )
+
+
+    class OutPutSerializer(serializers.Serializer):
+        created = serializers.ListField(child=serializers.EmailField())
+        errors = serializers.ListField(child=serializers.DictField())
+
+
+    @extend_schema(request=InputSerializer, responses=OutPutSerializer)
+    def post(self, request):
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        rows = []
+        errors = {}
+
+        for index, data in enumerate(serializer.validated_data.get("users")):
+            row_serializer = self.InputRegisterSerializer(data=data)
+
+            if row_serializer.is_valid():
+                rows.append((index, row_serializer.validated_data))
+            else:
+                errors[index] = row_serializer.errors
+
+        users, register_errors = register_bulk(users=[data for _, data in rows])
+
+        for row_index, message in register_errors.items():
+            errors[rows[row_index][0]] = {"email": [message]}
+
+        data = {
+                "created": [user.email for user in users],
+                "errors": [{"index": index, "errors": errors[index]} for index in sorted(errors)],
+                }
+
+        return Response(
+                self.OutPutSerializer(data).data,
+                status=status.HTTP_201_CREATED if users else status.HTTP_400_BAD_REQUEST
+                )
@@ -0,0 +1,24 @@
+from django.http import JsonResponse
+
+from asgiref.sync import sync_to_async
+
+from orgniaztional_ticking_api.api.async_views import async_api_view, authenticate
+from orgniaztional_ticking_api.users.apis import ProfileApi
+from orgniaztional_ticking_api.users.caches import profile_cache
+from orgniaztional_ticking_api.users.selectors import get_profile
+
+
+def _get_profile_data(user):
+    return profile_cache.get(
+            user.pk,
+            lambda: ProfileApi.OutPutSerializer(get_profile(user=user)).data
+            )
+
+
+@async_api_view(methods=["GET"], read_only=True)
+async def profile_api(request, data):
+    """
+    Async `ProfileApi`.
+    """
+    user = await authenticate(request)
+    return JsonResponse(await sync_to_async(_get_profile_data)(user))
@@ -0,0 +1,5 @@
+from orgniaztional_ticking_api.common.cache import ReadThroughCache
+
+# Serialized `ProfileApi` responses, keyed by user id.
+# Bump the version when `ProfileApi.OutPutSerializer` changes.
+profile_cache = ReadThroughCache(namespace="users.profile", version=1)
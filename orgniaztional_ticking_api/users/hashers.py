@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+def get_profile_params(profile):
+    return settings.PASSWORD_HASHER_PROFILES[profile]["PARAMS"]
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    `PBKDF2PasswordHasher` with the iteration count of the `pbkdf2` hasher profile.
+
+    Keeps the `pbkdf2_sha256` algorithm name, so existing hashes still verify, and the ones made with
+    another iteration count get re-hashed on the next successful login (see `BaseUser.check_password`).
+    """
+    profile = "pbkdf2"
+
+    @property
+    def iterations(self):
+        return get_profile_params(self.profile)["iterations"]
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    `Argon2PasswordHasher` with the time / memory cost and parallelism of the `argon2` hasher profile.
+    """
+    profile = "argon2"
+
+    @property
+    def time_cost(self):
+        return get_profile_params(self.profile)["time_cost"]
+
+    @property
+    def memory_cost(self):
+        return get_profile_params(self.profile)["memory_cost"]
+
+    @property
+    def parallelism(self):
+        return get_profile_params(self.profile)["parallelism"]
@@ -0,0 +1,252 @@
+import asyncio
+import math
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from threading import BoundedSemaphore
+from time import perf_counter
+from typing import Any, Callable, List, Sequence
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.utils.module_loading import import_string
+
+from prometheus_client import Counter, Histogram
+
+from orgniaztional_ticking_api.core.exceptions import ServiceUnavailableError
+
+HASHING_LATENCY = Histogram(
+    "password_hashing_seconds",
+    "Time from submitting a password hashing call to its result, queueing included.",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+HASHING_REJECTED = Counter(
+    "password_hashing_rejected_total",
+    "Password hashing calls rejected because the hashing executor was saturated or timed out.",
+    ["operation"],
+)
+
+
+def _init_worker(settings_module: str) -> None:
+    # No-op when the worker was forked from an already set up process
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+def make_passwords(passwords: Sequence[str]) -> List[str]:
+    return [make_password(password) for password in passwords]
+
+
+class HashingExecutor:
+    """
+    Runs password hashing away from the request workers, with bounded concurrency.
+
+    At most `max_concurrency` calls run at a time and `max_pending` more may wait for a slot.
+    Anything beyond that, or a call not done within `timeout` seconds, raises `ServiceUnavailableError`
+    right away, so login storms turn into fast 503s instead of piled up, timing out requests.
+    """
+
+    def __init__(self, *, max_concurrency: int, max_pending: int, timeout: float):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._slots = BoundedSemaphore(max_concurrency + max_pending)
+
+    def _submit(self, func: Callable, *args: Any, timeout: float) -> Future:
+        raise NotImplementedError
+
+    def submit(self, func: Callable, *args: Any, timeout: float | None = None) -> Future:
+        operation = func.__name__
+
+        if not self._slots.acquire(blocking=False):
+            HASHING_REJECTED.labels(operation).inc()
+            raise ServiceUnavailableError("Too many concurrent password checks, try again later.")
+
+        start = perf_counter()
+
+        def done(future):
+            self._slots.release()
+            HASHING_LATENCY.labels(operation).observe(perf_counter() - start)
+
+        try:
+            future = self._submit(func, *args, timeout=timeout or self.timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(done)
+
+        return future
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        return self.wait(self.submit(func, *args), func)
+
+    def wait(self, future: Future, func: Callable, timeout: float | None = None) -> Any:
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except TimeoutError:
+            future.cancel()
+            HASHING_REJECTED.labels(func.__name__).inc()
+            raise ServiceUnavailableError("Password check timed out, try again later.")
+
+    async def arun(self, func: Callable, *args: Any) -> Any:
+        future = self.submit(func, *args)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            HASHING_REJECTED.labels(func.__name__).inc()
+            raise ServiceUnavailableError("Password check timed out, try again later.")
+
+
+class InlineHashingExecutor(HashingExecutor):
+    """
+    Hashes in the calling thread, only the concurrency limit applies. Meant for tests.
+    """
+
+    def _submit(self, func, *args, timeout):
+        future = Future()
+
+        try:
+            future.set_result(func(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+
+        return future
+
+
+class ThreadPoolHashingExecutor(HashingExecutor):
+    """
+    PBKDF2 (hashlib) and argon2-cffi release the GIL, so a thread pool is enough to use several cores.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="password-hashing")
+
+    def _submit(self, func, *args, timeout):
+        return self._executor.submit(func, *args)
+
+
+class ProcessPoolHashingExecutor(HashingExecutor):
+    """
+    For hashers that hold the GIL.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_concurrency,
+            initializer=_init_worker,
+            initargs=(os.environ["DJANGO_SETTINGS_MODULE"], )
+        )
+
+    def _submit(self, func, *args, timeout):
+        return self._executor.submit(func, *args)
+
+
+class CeleryHashingExecutor(HashingExecutor):
+    """
+    Sends hashing to the `PASSWORD_HASHING_CELERY_QUEUE` queue, so it can run on dedicated machines:
+
+        celery -A config worker -Q hashing
+
+    Raw passwords go through the broker, so only use this with a private, TLS protected broker.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Only waits on results, the hashing itself happens on the Celery workers
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="password-hashing")
+
+    def _submit(self, func, *args, timeout):
+        from .tasks import password_hashing_run
+
+        result = password_hashing_run.apply_async(
+            args=(func.__name__, *args),
+            queue=settings.PASSWORD_HASHING_CELERY_QUEUE,
+            expires=timeout
+        )
+
+        return self._executor.submit(result.get, timeout=timeout, propagate=True)
+
+
+_executor = None
+
+
+def get_executor() -> HashingExecutor:
+    global _executor
+
+    if _executor is None:
+        executor_class = import_string(settings.PASSWORD_HASHING_BACKEND)
+        _executor = executor_class(
+            max_concurrency=settings.PASSWORD_HASHING_MAX_WORKERS,
+            max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+            timeout=settings.PASSWORD_HASHING_TIMEOUT
+        )
+
+    return _executor
+
+
+def password_needs_rehash(encoded: str) -> bool:
+    """
+    Whether `encoded` was made with another hasher or other parameters than the preferred (first) one.
+    """
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+
+    preferred = get_hasher("default")
+
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def hash_password(password: str | None) -> str:
+    return get_executor().run(make_password, password)
+
+
+def hash_passwords(passwords: Sequence[str]) -> List[str]:
+    """
+    Hashes many passwords through the hashing executor, split in as many chunks as it runs at a time.
+    Each chunk takes one executor slot, so a bulk call is bounded like any other and raises
+    `ServiceUnavailableError` when the executor is saturated. Keeps the order of `passwords`.
+    """
+    if not passwords:
+        return []
+
+    executor = get_executor()
+    size = math.ceil(len(passwords) / executor.max_concurrency)
+    chunks = [passwords[start:start + size] for start in range(0, len(passwords), size)]
+    futures = []
+
+    try:
+        for chunk in chunks:
+            # The timeout is per password, a chunk hashes many
+            futures.append(executor.submit(make_passwords, list(chunk), timeout=executor.timeout * len(chunk)))
+    except ServiceUnavailableError:
+        for future in futures:
+            future.cancel()
+
+        raise
+
+    return [
+        hashed
+        for future, chunk in zip(futures, chunks)
+        for hashed in executor.wait(future, make_passwords, timeout=executor.timeout * len(chunk))
+    ]
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """
+    `check_password` through the hashing executor. Doesn't upgrade outdated hashes.
+    """
+    return get_executor().run(check_password, password, encoded)
+
+
+async def ahash_password(password: str | None) -> str:
+    return await get_executor().arun(make_password, password)
+
+
+async def averify_password(password: str, encoded: str) -> bool:
+    return await get_executor().arun(check_password, password, encoded)
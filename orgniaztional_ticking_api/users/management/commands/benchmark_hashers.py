@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+
+PBKDF2_ITERATIONS = (100_000, 200_000, 320_000, 480_000, 600_000, 870_000, 1_200_000)
+ARGON2_TIME_COSTS = (1, 2, 3, 4)
+ARGON2_MEMORY_COSTS = (19_456, 47_104, 65_536, 102_400)  # KiB
+
+PASSWORD = "correct horse battery staple"
+
+
+class Command(BaseCommand):
+    help = (
+        "Times password verification for each hasher profile and candidate parameters on this machine, "
+        "and recommends the strongest parameters whose p99 fits the target login latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target-p99-ms", type=float, default=250)
+        parser.add_argument("--samples", type=int, default=50)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.PASSWORD_HASHING_MAX_WORKERS,
+            help="Verifications running at the same time, to account for login bursts.",
+        )
+        parser.add_argument("--skip-argon2", action="store_true")
+
+    def handle(self, *args, target_p99_ms, samples, concurrency, skip_argon2, **options):
+        self.samples = samples
+        self.concurrency = concurrency
+
+        candidates = [
+            ("pbkdf2", {"iterations": iterations}, self.pbkdf2_hasher(iterations))
+            for iterations in PBKDF2_ITERATIONS
+        ]
+
+        if not skip_argon2:
+            parallelism = settings.PASSWORD_HASHER_PROFILES["argon2"]["PARAMS"]["parallelism"]
+            candidates += [
+                (
+                    "argon2",
+                    {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism},
+                    self.argon2_hasher(time_cost, memory_cost, parallelism),
+                )
+                for time_cost, memory_cost in product(ARGON2_TIME_COSTS, ARGON2_MEMORY_COSTS)
+            ]
+
+        best = {}
+
+        for profile, params, hasher in candidates:
+            p50, p99 = self.measure(hasher)
+
+            self.stdout.write(f"{profile:<7} {self.format_params(params):<50} p50={p50:8.1f}ms p99={p99:8.1f}ms")
+
+            if p99 <= target_p99_ms and (profile not in best or self.cost(params) > self.cost(best[profile])):
+                best[profile] = params
+
+        self.stdout.write("")
+
+        for profile in ("pbkdf2", "argon2"):
+            if profile not in best:
+                if profile == "pbkdf2" or not skip_argon2:
+                    self.stdout.write(self.style.WARNING(f"{profile}: nothing fits {target_p99_ms}ms p99"))
+                continue
+
+            env = " ".join(
+                f"PASSWORD_{profile.upper()}_{name.upper()}={value}"
+                for name, value in best[profile].items()
+            )
+            self.stdout.write(self.style.SUCCESS(f"{profile}: PASSWORD_HASHER_PROFILE={profile} {env}"))
+
+    def pbkdf2_hasher(self, iterations):
+        hasher = PBKDF2PasswordHasher()
+        hasher.iterations = iterations
+        return hasher
+
+    def argon2_hasher(self, time_cost, memory_cost, parallelism):
+        hasher = Argon2PasswordHasher()
+        hasher.time_cost = time_cost
+        hasher.memory_cost = memory_cost
+        hasher.parallelism = parallelism
+        return hasher
+
+    def cost(self, params):
+        if "iterations" in params:
+            return params["iterations"]
+
+        return params["time_cost"] * params["memory_cost"]
+
+    def format_params(self, params):
+        return " ".join(f"{name}={value}" for name, value in params.items())
+
+    def measure(self, hasher):
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+
+        def verify(_):
+            start = perf_counter()
+            hasher.verify(PASSWORD, encoded)
+            return (perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            timings = sorted(executor.map(verify, range(self.samples)))
+
+        p50 = timings[len(timings) // 2]
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+
+        return p50, p99
@@ -0,0 +1,91 @@
+import re
+from timeit import Timer
+
+from django.contrib.auth import password_validation
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.core.validators import MinLengthValidator
+
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.users.validators import PasswordPolicy
+
+PASSWORDS = {
+    "valid": "Tr0ub4dor&3-horse",
+    "common": "password123",
+    "short": "abc",
+    "similar": "jane.doe@example.com1!",
+}
+
+
+def legacy_number_validator(password):
+    if re.compile("[0-9]").search(password) is None:
+        raise ValidationError("password must include number")
+
+
+def legacy_letter_validator(password):
+    if re.compile("[a-zA-Z]").search(password) is None:
+        raise ValidationError("password must include letter")
+
+
+def legacy_special_char_validator(password):
+    if re.compile("[@_!#$%^&*()<>?/\\|}{~:]").search(password) is None:
+        raise ValidationError("password must include special char")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the previous password checks (three regex validators, MinLengthValidator and Django's four "
+        "validators) with the single pass PasswordPolicy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=20_000)
+
+    def handle(self, *args, number, **options):
+        user = BaseUser(email="jane.doe@example.com")
+
+        field_validators = [
+            legacy_number_validator,
+            legacy_letter_validator,
+            legacy_special_char_validator,
+            MinLengthValidator(limit_value=10),
+        ]
+        django_validators = [
+            password_validation.UserAttributeSimilarityValidator(),
+            password_validation.MinimumLengthValidator(),
+            password_validation.CommonPasswordValidator(),
+            password_validation.NumericPasswordValidator(),
+        ]
+        policy = PasswordPolicy()
+
+        def legacy(password):
+            errors = []
+
+            for validator in field_validators:
+                try:
+                    validator(password)
+                except ValidationError as error:
+                    errors.append(error)
+
+            try:
+                password_validation.validate_password(password, user, password_validators=django_validators)
+            except ValidationError as error:
+                errors.extend(error.error_list)
+
+            return errors
+
+        def single_pass(password):
+            return policy.get_violations(password, user)
+
+        load = Timer(password_validation.CommonPasswordValidator).timeit(10) / 10
+        self.stdout.write(f"Loading the common password list: {load * 1000:.1f}ms per validator instance\n")
+
+        for label, password in PASSWORDS.items():
+            legacy_time = Timer(lambda: legacy(password)).timeit(number) / number
+            policy_time = Timer(lambda: single_pass(password)).timeit(number) / number
+
+            self.stdout.write(
+                f"{label:>8}: legacy {legacy_time * 1e6:7.2f}us ({len(legacy(password))} errors), "
+                f"policy {policy_time * 1e6:7.2f}us ({len(single_pass(password))} errors), "
+                f"{legacy_time / policy_time:.1f}x"
+            )
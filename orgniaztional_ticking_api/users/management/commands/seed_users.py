@@ -0,0 +1,206 @@
+import io
+import multiprocessing
+import os
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from orgniaztional_ticking_api.users.models import BaseUser, Profile
+from orgniaztional_ticking_api.utils.tests.base import faker
+from orgniaztional_ticking_api.utils.tests.factories import DEFAULT_PASSWORD, get_password_hash
+
+BIO_POOL_SIZE = 1000
+
+
+def get_rows(model, rows):
+    """
+    Column values of `rows` (attname -> value dicts) in `model`'s column order, with field defaults for the rest.
+    """
+    fields = model._meta.concrete_fields
+    defaults = {field.attname: field.get_default() for field in fields}
+
+    for row in rows:
+        yield [row[field.attname] if field.attname in row else defaults[field.attname] for field in fields]
+
+
+def copy_value(value):
+    if value is None:
+        return r"\N"
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    return str(value).replace("\\", "\\\\").replace("\t", " ").replace("\n", " ")
+
+
+def insert_copy(model, rows):
+    buffer = io.StringIO()
+
+    for values in get_rows(model, rows):
+        buffer.write("\t".join(copy_value(value) for value in values))
+        buffer.write("\n")
+
+    buffer.seek(0)
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in model._meta.concrete_fields)
+
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+
+def insert_bulk(model, rows):
+    # `executemany` without model instances, they'd cost more than the insert
+    fields = model._meta.concrete_fields
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+
+    # The generated values are all plain types the driver takes as they are, except datetimes
+    adapt_datetime = connection.ops.adapt_datetimefield_value
+    params = [
+        [adapt_datetime(value) if isinstance(value, datetime) else value for value in values]
+        for values in get_rows(model, rows)
+    ]
+
+    with connection.cursor() as cursor:
+        cursor.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", params)
+
+
+class Seeder:
+    """
+    Inserts users with ids `[start, stop)` and their profiles. Ids are set explicitly,
+    so profiles can be inserted without reading the users back.
+    """
+
+    def __init__(self, *, method, batch_size, password_hash, bios, email_domain, now, last_pk):
+        self.insert = insert_copy if method == "copy" else insert_bulk
+        self.batch_size = batch_size
+        self.password_hash = password_hash
+        self.bios = bios
+        self.email_domain = email_domain
+        self.now = now
+        self.last_pk = last_pk
+
+    def __call__(self, ids):
+        start, stop, profile_offset = ids
+
+        for batch_start in range(start, stop, self.batch_size):
+            batch = range(batch_start, min(batch_start + self.batch_size, stop))
+
+            with transaction.atomic():
+                self.insert(BaseUser, (self.user_row(pk) for pk in batch))
+                self.insert(Profile, (self.profile_row(pk, profile_offset) for pk in batch))
+
+        return len(range(start, stop))
+
+    def user_row(self, pk):
+        # One row per second up to now, so `created_at` orders like the ids
+        created_at = self.now - timedelta(seconds=self.last_pk - pk)
+
+        return {
+            "id": pk,
+            "email": f"seed-{pk}@{self.email_domain}",
+            "password": self.password_hash,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "is_active": True,
+            "is_admin": False,
+            "is_superuser": False,
+            "last_login": None,
+        }
+
+    def profile_row(self, pk, profile_offset):
+        return {
+            "id": pk + profile_offset,
+            "user_id": pk,
+            "bio": self.bios[pk % len(self.bios)],
+        }
+
+
+def _close_connections():
+    # Forked workers must not share the parent's database connections
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates users with profiles, fast: one shared password hash, Postgres COPY (or bulk_create) "
+        "and parallel workers. Don't run it while the API is taking registrations, ids are set explicitly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, required=True)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--workers", type=int, help="Defaults to the CPU count on Postgres, 1 elsewhere")
+        parser.add_argument("--method", choices=["auto", "copy", "bulk"], default="auto")
+        parser.add_argument("--password", default=DEFAULT_PASSWORD)
+        parser.add_argument("--email-domain", default="seed.example.com")
+
+    def handle(self, *args, users, batch_size, workers, method, password, email_domain, **options):
+        is_postgres = connection.vendor == "postgresql"
+
+        if method == "auto":
+            method = "copy" if is_postgres else "bulk"
+
+        if method == "copy" and not is_postgres:
+            raise CommandError("COPY needs Postgres, use --method bulk.")
+
+        if workers is None:
+            workers = os.cpu_count() if is_postgres else 1
+
+        start = perf_counter()
+
+        first_pk = (BaseUser.objects.aggregate(value=Max("pk"))["value"] or 0) + 1
+        last_profile_pk = Profile.objects.aggregate(value=Max("pk"))["value"] or 0
+        # Profile ids follow the user ids, shifted past the existing profiles
+        profile_offset = max(last_profile_pk - first_pk + 1, 0)
+
+        seeder = Seeder(
+            method=method,
+            batch_size=batch_size,
+            password_hash=get_password_hash(password),
+            bios=[faker.sentence(nb_words=8) for _ in range(BIO_POOL_SIZE)],
+            email_domain=email_domain,
+            now=timezone.now(),
+            last_pk=first_pk + users - 1,
+        )
+
+        # Contiguous id ranges, one per worker
+        step = -(-users // workers)
+        ranges = [
+            (range_start, min(range_start + step, first_pk + users), profile_offset)
+            for range_start in range(first_pk, first_pk + users, step)
+        ]
+
+        if workers == 1:
+            created = sum(seeder(ids) for ids in ranges)
+        else:
+            _close_connections()
+
+            with multiprocessing.get_context("fork").Pool(workers, initializer=_close_connections) as pool:
+                created = sum(pool.map(seeder, ranges))
+
+        self.reset_sequences()
+
+        elapsed = perf_counter() - start
+        self.stdout.write(
+            f"Created {created} users with profiles in {elapsed:.1f}s "
+            f"({created / elapsed:,.0f} rows/s, {method}, {workers} workers)"
+        )
+
+    def reset_sequences(self):
+        # Explicit ids don't move Postgres sequences, the next registration would collide
+        statements = connection.ops.sequence_reset_sql(no_style(), [BaseUser, Profile])
+
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -5,6 +5,8 @@ from django.contrib.auth.models import AbstractBaseUser
 from django.contrib.auth.models import BaseUserManager as BUM
 from django.contrib.auth.models import PermissionsMixin
 
+from .hashing import hash_password, password_needs_rehash, verify_password
+
 
 
 class BaseUserManager(BUM):
@@ -19,7 +21,8 @@ class BaseUserManager(BUM):
         else:
             user.set_unusable_password()
 
-        user.full_clean()
+        # The unique index checks the email, `validate_unique` would only add a `SELECT` that races anyway
+        user.full_clean(validate_unique=False)
         user.save(using=self._db)
 
         return user
@@ -56,6 +59,21 @@ class BaseUser(BaseModel, AbstractBaseUser, PermissionsMixin):
     def is_staff(self):
         return self.is_admin
 
+    def set_password(self, raw_password):
+        # Same as `AbstractBaseUser.set_password`, through the bounded hashing executor
+        self.password = hash_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        is_correct = verify_password(raw_password, self.password)
+
+        if is_correct and password_needs_rehash(self.password):
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=["password"])
+
+        return is_correct
+
 
 class Profile(models.Model):
     user = models.OneToOneField(BaseUser, on_delete=models.CASCADE)
@@ -1,4 +1,11 @@
+from orgniaztional_ticking_api.common.db import replica
+
 from .models import Profile, BaseUser
 
+@replica
 def get_profile(user:BaseUser) -> Profile:
-    return Profile.objects.get(user=user)
+    # `user_id` lookup, so a `TokenUser` works without loading the `BaseUser`
+    return Profile.objects.get(user_id=user.pk)
+
+def get_user_by_email(*, email:str) -> BaseUser | None:
+    return BaseUser.objects.filter(email=BaseUser.objects.normalize_email(email.lower())).first()
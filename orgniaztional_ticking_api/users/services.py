@@ -1,6 +1,36 @@
-from django.db import transaction 
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction 
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils.module_loading import import_string
+
+from redis.exceptions import RedisError, ResponseError, WatchError
+
+from orgniaztional_ticking_api.common.bloom import RedisBloomFilter
+from orgniaztional_ticking_api.core.exceptions import ConflictError
+
+from .caches import profile_cache
+from .hashing import hash_passwords
 from .models import BaseUser, Profile
 
+PROFILE_COUNTER_FIELDS = ("posts_count", "subscriber_count", "subscription_count")
+
+PROFILE_COUNTERS_PENDING_KEY = "users:profile_counters:pending"
+PROFILE_COUNTERS_FLUSHING_KEY = "users:profile_counters:flushing"
+PROFILE_COUNTERS_FLUSH_LOCK_KEY = "users:profile_counters:flush_lock"
+
+# Registered emails. A miss means the email is free (or was registered while the filter was rebuilt, then
+# the unique index still catches it), a hit still has to be confirmed in the database.
+email_bloom = RedisBloomFilter(
+    "users:emails:bloom",
+    capacity=settings.USERS_EMAIL_BLOOM_CAPACITY,
+    error_rate=settings.USERS_EMAIL_BLOOM_ERROR_RATE,
+)
+
 
 def create_profile(*, user:BaseUser, bio:str | None) -> Profile:
     return Profile.objects.create(user=user, bio=bio)
@@ -9,10 +39,317 @@ def create_user(*, email:str, password:str) -> BaseUser:
     return BaseUser.objects.create_user(email=email, password=password)
 
 
-@transaction.atomic
+def email_maybe_taken(*, email:str) -> bool:
+    """
+    False only if `email` is certainly not registered, see `email_bloom`.
+    """
+    if not settings.USERS_EMAIL_BLOOM_ENABLED:
+        return True
+
+    try:
+        return email in email_bloom
+    except RedisError:
+        return True
+
+
+def emails_register(*, emails:Iterable[str]) -> None:
+    """
+    Adds registered emails to `email_bloom`.
+    """
+    if not settings.USERS_EMAIL_BLOOM_ENABLED:
+        return
+
+    try:
+        email_bloom.add_many(emails)
+    except RedisError:
+        # Only makes the next duplicate check go to the unique index
+        pass
+
+
+def email_bloom_rebuild() -> int:
+    if not settings.USERS_EMAIL_BLOOM_ENABLED:
+        return 0
+
+    emails = BaseUser.objects.order_by().values_list("email", flat=True).iterator(chunk_size=5000)
+
+    return email_bloom.rebuild(emails)
+
+
 def register(*, bio:str|None, email:str, password:str) -> BaseUser:
+    """
+    Raises `ConflictError` if the email is taken.
+
+    The unique index on `BaseUser.email` is what rejects duplicates, concurrent registrations included.
+    The email is only looked up first when `email_bloom` says it may be taken, so most duplicates are
+    rejected before their password is hashed.
+    """
+    email = BaseUser.objects.normalize_email(email.lower())
 
-    user = create_user(email=email, password=password)
-    create_profile(user=user, bio=bio)
+    if email_maybe_taken(email=email) and BaseUser.objects.filter(email=email).exists():
+        raise ConflictError("email Already Taken", extra={"email": email})
+
+    try:
+        # A savepoint, so the request's transaction can go on after an `IntegrityError`
+        with transaction.atomic():
+            user = create_user(email=email, password=password)
+            create_profile(user=user, bio=bio)
+    except IntegrityError:
+        if BaseUser.objects.filter(email=email).exists():
+            raise ConflictError("email Already Taken", extra={"email": email})
+
+        raise
+
+    transaction.on_commit(lambda: emails_register(emails=[email]))
 
     return user
+
+
+def register_bulk(*, users:Sequence[Dict[str, Any]], batch_size:int = 1000) -> Tuple[List[BaseUser], Dict[int, str]]:
+    """
+    Registers many users at once. `users` items have the `register` arguments (`email`, `password`, `bio`)
+    and are expected to be validated already.
+
+    Email uniqueness is checked with a single `IN` query, passwords are hashed in chunks by the hashing executor
+    and both users and profiles are inserted with `bulk_create` in one transaction.
+
+    Return value: Tuple with the following elements:
+        1. The created users
+        2. A dict of `users` index -> error message, for the rows that were skipped
+    """
+    errors: Dict[int, str] = {}
+    rows: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    for index, data in enumerate(users):
+        email = BaseUser.objects.normalize_email(data["email"].lower())
+
+        if email in rows:
+            errors[index] = "email is duplicated in the request"
+            continue
+
+        rows[email] = (index, data)
+
+    taken = BaseUser.objects.filter(email__in=rows.keys()).values_list("email", flat=True)
+
+    for email in taken:
+        index, _ = rows.pop(email)
+        errors[index] = "email Already Taken"
+
+    passwords = hash_passwords([data["password"] for _, data in rows.values()])
+
+    new_users = [
+        BaseUser(email=email, password=password)
+        for email, password in zip(rows.keys(), passwords)
+    ]
+
+    try:
+        with transaction.atomic():
+            new_users = BaseUser.objects.bulk_create(new_users, batch_size=batch_size)
+            Profile.objects.bulk_create(
+                [
+                    Profile(user=user, bio=data.get("bio"))
+                    for user, (_, data) in zip(new_users, rows.values())
+                ],
+                batch_size=batch_size
+            )
+    except IntegrityError:
+        # Some of the emails were registered since they were checked
+        raise ConflictError("emails were registered concurrently, retry the request")
+
+    transaction.on_commit(lambda: emails_register(emails=[user.email for user in new_users]))
+
+    return new_users, errors
+
+
+def _get_redis():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def _profile_counters_apply(*, deltas:Dict[int, Dict[str, int]]) -> None:
+    """
+    Applies `user_id -> {field: delta}` with `F()` expressions, so concurrent writers can't lose increments.
+    Users with the same deltas share one `UPDATE`.
+    """
+    users_by_deltas = defaultdict(list)
+
+    for user_id, fields in deltas.items():
+        fields = {field: delta for field, delta in fields.items() if delta}
+
+        if fields:
+            users_by_deltas[tuple(sorted(fields.items()))].append(user_id)
+
+    with transaction.atomic():
+        for fields, user_ids in users_by_deltas.items():
+            Profile.objects.filter(user_id__in=user_ids).update(**{
+                # The counters are unsigned
+                field: Greatest(F(field) + delta, 0)
+                for field, delta in fields
+            })
+
+        # `update` doesn't send `post_save`
+        changed = [user_id for user_ids in users_by_deltas.values() for user_id in user_ids]
+        transaction.on_commit(lambda: [profile_cache.invalidate(user_id) for user_id in changed])
+
+
+def profile_counter_increment(*, user_id:int, field:str, amount:int = 1) -> None:
+    """
+    Increments (or decrements, with a negative `amount`) a `Profile` counter.
+
+    With `PROFILE_COUNTERS_BUFFERED` the increment is only added to a Redis hash and written to Postgres
+    by `profile_counters_flush`, so hot profiles don't turn into row lock contention.
+    """
+    if field not in PROFILE_COUNTER_FIELDS:
+        raise ValueError(f"{field} is not a Profile counter")
+
+    if not settings.PROFILE_COUNTERS_BUFFERED:
+        _profile_counters_apply(deltas={user_id: {field: amount}})
+        return
+
+    _get_redis().hincrby(PROFILE_COUNTERS_PENDING_KEY, f"{user_id}:{field}", amount)
+
+
+def profile_counters_flush() -> int:
+    """
+    Writes the increments buffered by `profile_counter_increment` to Postgres.
+
+    The pending hash is renamed before it's read, so increments that come in meanwhile go to a new hash.
+    Batches left behind by a failed flush are retried first. Returns the number of profiles updated.
+
+    Only one flush runs at a time (`PROFILE_COUNTERS_FLUSH_LOCK_TIMEOUT`), and each batch is read and deleted
+    in one transaction before it's applied, so a batch can't be applied twice. If applying fails the batch is
+    added back to the pending hash. A worker dying in between loses the batch, `profile_counters_reconcile`
+    repairs the counters that have a source.
+    """
+    redis = _get_redis()
+    token = uuid.uuid4().hex
+
+    if not redis.set(PROFILE_COUNTERS_FLUSH_LOCK_KEY, token, nx=True, ex=settings.PROFILE_COUNTERS_FLUSH_LOCK_TIMEOUT):
+        # Another flush is running
+        return 0
+
+    try:
+        try:
+            redis.rename(PROFILE_COUNTERS_PENDING_KEY, f"{PROFILE_COUNTERS_FLUSHING_KEY}:{uuid.uuid4().hex}")
+        except ResponseError:
+            # Nothing pending
+            pass
+
+        flushed = 0
+
+        for key in list(redis.scan_iter(match=f"{PROFILE_COUNTERS_FLUSHING_KEY}:*")):
+            batch = _profile_counters_claim(redis=redis, key=key)
+
+            if not batch:
+                continue
+
+            deltas: Dict[int, Dict[str, int]] = defaultdict(dict)
+
+            for name, delta in batch.items():
+                user_id, field = name.decode().split(":")
+                deltas[int(user_id)][field] = int(delta)
+
+            try:
+                _profile_counters_apply(deltas=deltas)
+            except Exception:
+                _profile_counters_requeue(redis=redis, batch=batch)
+                raise
+
+            flushed += len(deltas)
+
+        return flushed
+    finally:
+        _lock_release(redis=redis, key=PROFILE_COUNTERS_FLUSH_LOCK_KEY, token=token)
+
+
+def _profile_counters_claim(*, redis, key) -> Dict[bytes, bytes]:
+    # `MULTI`: no other client can read the batch between the two commands
+    with redis.pipeline(transaction=True) as pipeline:
+        pipeline.hgetall(key)
+        pipeline.delete(key)
+        batch, _ = pipeline.execute()
+
+    return batch
+
+
+def _profile_counters_requeue(*, redis, batch:Dict[bytes, bytes]) -> None:
+    with redis.pipeline(transaction=False) as pipeline:
+        for name, delta in batch.items():
+            pipeline.hincrby(PROFILE_COUNTERS_PENDING_KEY, name, int(delta))
+
+        pipeline.execute()
+
+
+def _lock_release(*, redis, key:str, token:str) -> None:
+    # Only if it's still ours, it may have expired and been taken by another worker
+    with redis.pipeline() as pipeline:
+        try:
+            pipeline.watch(key)
+
+            if pipeline.get(key) == token.encode():
+                pipeline.multi()
+                pipeline.delete(key)
+                pipeline.execute()
+        except WatchError:
+            pass
+
+
+def profile_counters_reconcile(*, batch_size:int = 1000) -> int:
+    """
+    Recomputes the counters that have a source in `PROFILE_COUNTER_SOURCES` and fixes the rows that drifted.
+    Returns the number of profiles updated.
+    """
+    sources = {
+        field: import_string(path)
+        for field, path in settings.PROFILE_COUNTER_SOURCES.items()
+    }
+
+    if not sources:
+        return 0
+
+    if settings.PROFILE_COUNTERS_BUFFERED:
+        profile_counters_flush()
+
+    true_values: Dict[str, Dict[int, int]] = {
+        field: dict(source())
+        for field, source in sources.items()
+    }
+
+    fields = list(sources)
+    updated = 0
+    profiles = Profile.objects.only("id", "user_id", *fields).order_by("id")
+    batch: List[Profile] = []
+
+    for profile in profiles.iterator(chunk_size=batch_size):
+        changed = False
+
+        for field in fields:
+            value = true_values[field].get(profile.user_id, 0)
+
+            if getattr(profile, field) != value:
+                setattr(profile, field, value)
+                changed = True
+
+        if changed:
+            batch.append(profile)
+
+        if len(batch) >= batch_size:
+            updated += _profile_counters_save(profiles=batch, fields=fields)
+            batch = []
+
+    if batch:
+        updated += _profile_counters_save(profiles=batch, fields=fields)
+
+    return updated
+
+
+def _profile_counters_save(*, profiles:Iterable[Profile], fields:List[str]) -> int:
+    profiles = list(profiles)
+
+    with transaction.atomic():
+        Profile.objects.bulk_update(profiles, fields)
+
+        user_ids = [profile.user_id for profile in profiles]
+        transaction.on_commit(lambda: [profile_cache.invalidate(user_id) for user_id in user_ids])
+
+    return len(profiles)
@@ -0,0 +1,22 @@
+from typing import List
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from orgniaztional_ticking_api.common.services import post_bulk_update
+
+from .caches import profile_cache
+from .models import Profile
+
+
+@receiver([post_save, post_delete], sender=Profile)
+def profile_cache_invalidate(*, instance: Profile, **kwargs) -> None:
+    # Invalidate after commit, otherwise a concurrent reader could cache the pre-commit row again
+    transaction.on_commit(lambda: profile_cache.invalidate(instance.user_id))
+
+
+@receiver(post_bulk_update, sender=Profile)
+def profile_cache_bulk_invalidate(*, instances: List[Profile], **kwargs) -> None:
+    user_ids = [instance.user_id for instance in instances]
+    transaction.on_commit(lambda: [profile_cache.invalidate(user_id) for user_id in user_ids])
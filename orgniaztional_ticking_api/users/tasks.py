@@ -0,0 +1,41 @@
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+from . import services
+from .hashing import make_passwords
+
+_PASSWORD_HASHING_OPERATIONS = {
+    "make_password": make_password,
+    "make_passwords": make_passwords,
+    "check_password": check_password,
+}
+
+
+@shared_task(ignore_result=False)
+def password_hashing_run(operation, *args):
+    """
+    Runs `users.hashing.CeleryHashingExecutor` calls.
+    """
+    return _PASSWORD_HASHING_OPERATIONS[operation](*args)
+
+
+@shared_task
+def profile_counters_flush():
+    return services.profile_counters_flush()
+
+
+@shared_task(
+    soft_time_limit=settings.CELERY_MAINTENANCE_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.CELERY_MAINTENANCE_TASK_TIME_LIMIT,
+)
+def profile_counters_reconcile():
+    return services.profile_counters_reconcile()
+
+
+@shared_task(
+    soft_time_limit=settings.CELERY_MAINTENANCE_TASK_SOFT_TIME_LIMIT,
+    time_limit=settings.CELERY_MAINTENANCE_TASK_TIME_LIMIT,
+)
+def email_bloom_rebuild():
+    return services.email_bloom_rebuild()
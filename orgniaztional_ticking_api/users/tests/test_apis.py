@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from orgniaztional_ticking_api.authentication.backends import _user_active_cache
+from orgniaztional_ticking_api.authentication.tokens import RefreshToken
+from orgniaztional_ticking_api.users.apis import ProfileApi, RegisterApi
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.utils.tests.factories import ProfileFactory
+
+PASSWORD = "Tr0ub4dor&3-horse"
+
+
+class QueryBudgetTests(TransactionTestCase):
+    """
+    `QUERY_BUDGET_RAISE` is on in the test settings, so a view going over its `query_budget` fails here.
+    The exact counts are pinned as well, budgets are revisited when they change.
+
+    Not a `TestCase`, its transaction would add savepoints to the counts.
+    """
+
+    def setUp(self):
+        cache.clear()
+        _user_active_cache.clear()
+
+        self.client = APIClient()
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_profile_cache_miss_and_hit(self):
+        profile = ProfileFactory()
+        self.authenticate(profile.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("api:users:profile"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["bio"], profile.bio)
+        self.assertLessEqual(2, ProfileApi.query_budget)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("api:users:profile"))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_profile_rejects_deactivated_user(self):
+        profile = ProfileFactory()
+        self.authenticate(profile.user)
+
+        BaseUser.objects.filter(pk=profile.user.pk).update(is_active=False)
+
+        response = self.client.get(reverse("api:users:profile"))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_register(self):
+        data = {"email": "jane.doe@example.com", "password": PASSWORD, "confirm_password": PASSWORD, "bio": "Hi"}
+
+        with self.assertNumQueries(6):
+            response = self.client.post(reverse("api:users:register"), data, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(6, RegisterApi.query_budget)
+        self.assertTrue(BaseUser.objects.filter(email="jane.doe@example.com", profile__bio="Hi").exists())
+
+
+class RegisterApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_register_taken_email(self):
+        ProfileFactory(user__email="jane.doe@example.com")
+        data = {"email": "Jane.Doe@example.com", "password": PASSWORD, "confirm_password": PASSWORD}
+
+        response = self.client.post(reverse("api:users:register"), data, format="json")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(BaseUser.objects.filter(email="jane.doe@example.com").count(), 1)
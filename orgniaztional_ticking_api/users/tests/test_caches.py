@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from orgniaztional_ticking_api.common.services import model_bulk_update
+from orgniaztional_ticking_api.users.caches import profile_cache
+from orgniaztional_ticking_api.users.models import Profile
+from orgniaztional_ticking_api.utils.tests.factories import ProfileFactory
+
+
+class ProfileCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.profile = ProfileFactory(bio="Before")
+
+    def get_cached_bio(self):
+        return profile_cache.get(self.profile.user_id, lambda: Profile.objects.get(pk=self.profile.pk).bio)
+
+    def test_save_invalidates_after_commit(self):
+        self.assertEqual(self.get_cached_bio(), "Before")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.bio = "After"
+            self.profile.save()
+
+            # Not before the commit, a concurrent reader could cache the old row again
+            self.assertEqual(self.get_cached_bio(), "Before")
+
+        self.assertEqual(self.get_cached_bio(), "After")
+
+    def test_bulk_update_invalidates_after_commit(self):
+        other = ProfileFactory(bio="Other")
+        other_bio = profile_cache.get(other.user_id, lambda: Profile.objects.get(pk=other.pk).bio)
+
+        self.assertEqual(self.get_cached_bio(), "Before")
+        self.assertEqual(other_bio, "Other")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            model_bulk_update(
+                instances=[self.profile, other],
+                fields=["bio"],
+                data=[{"bio": "After"}, {"bio": "Other"}]
+            )
+
+        self.assertEqual(self.get_cached_bio(), "After")
+        # Unchanged instances keep their cached value
+        self.assertEqual(profile_cache.get(other.user_id, lambda: "reloaded"), "Other")
@@ -0,0 +1,165 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from redis.exceptions import RedisError
+
+from orgniaztional_ticking_api.common.bloom import RedisBloomFilter
+from orgniaztional_ticking_api.core.exceptions import ConflictError
+from orgniaztional_ticking_api.users import services
+from orgniaztional_ticking_api.users.models import BaseUser, Profile
+from orgniaztional_ticking_api.users.services import (
+    PROFILE_COUNTERS_PENDING_KEY,
+    email_bloom_rebuild,
+    email_maybe_taken,
+    profile_counter_increment,
+    profile_counters_flush,
+    profile_counters_reconcile,
+    register,
+    register_bulk,
+)
+from orgniaztional_ticking_api.utils.tests.factories import BaseUserFactory, ProfileFactory
+from orgniaztional_ticking_api.utils.tests.redis import FakeRedisMixin
+
+
+def posts_count_source():
+    return [(profile.user_id, 7) for profile in Profile.objects.all()]
+
+
+@override_settings(PROFILE_COUNTERS_BUFFERED=True)
+class ProfileCountersTests(FakeRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.profile = ProfileFactory(posts_count=0, subscriber_count=5)
+        self.other = ProfileFactory(posts_count=0)
+
+    def test_increment_is_buffered_until_flush(self):
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count")
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count", amount=2)
+        profile_counter_increment(user_id=self.profile.user_id, field="subscriber_count", amount=-1)
+        profile_counter_increment(user_id=self.other.user_id, field="posts_count")
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.posts_count, 0)
+
+        self.assertEqual(profile_counters_flush(), 2)
+
+        self.profile.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.profile.posts_count, self.profile.subscriber_count), (3, 4))
+        self.assertEqual(self.other.posts_count, 1)
+
+    def test_each_increment_is_applied_once(self):
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count")
+
+        profile_counters_flush()
+        self.assertEqual(profile_counters_flush(), 0)
+
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count")
+        profile_counters_flush()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.posts_count, 2)
+        self.assertEqual(list(self.redis.scan_iter(match="users:profile_counters:*")), [])
+
+    def test_counters_do_not_go_below_zero(self):
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count", amount=-3)
+        profile_counters_flush()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.posts_count, 0)
+
+    def test_failed_flush_requeues_the_batch(self):
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count", amount=2)
+
+        with mock.patch.object(services, "_profile_counters_apply", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                profile_counters_flush()
+
+        self.assertEqual(self.redis.hget(PROFILE_COUNTERS_PENDING_KEY, f"{self.profile.user_id}:posts_count"), b"2")
+
+        profile_counters_flush()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.posts_count, 2)
+
+    def test_unknown_field_is_rejected(self):
+        with self.assertRaises(ValueError):
+            profile_counter_increment(user_id=self.profile.user_id, field="bio")
+
+    @override_settings(PROFILE_COUNTER_SOURCES={
+        "posts_count": "orgniaztional_ticking_api.users.tests.test_services.posts_count_source",
+    })
+    def test_reconcile_fixes_drift(self):
+        Profile.objects.filter(pk=self.other.pk).update(posts_count=7)
+        profile_counter_increment(user_id=self.profile.user_id, field="posts_count", amount=2)
+
+        # Pending increments are flushed first, only `profile` drifted
+        self.assertEqual(profile_counters_reconcile(), 1)
+
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.posts_count, self.profile.subscriber_count), (7, 5))
+        self.assertEqual(self.redis.exists(PROFILE_COUNTERS_PENDING_KEY), 0)
+
+
+@override_settings(USERS_EMAIL_BLOOM_ENABLED=True)
+class RegisterTests(FakeRedisMixin, TestCase):
+    def register(self, email):
+        with self.captureOnCommitCallbacks(execute=True):
+            return register(email=email, password="Tr0ub4dor&3-horse", bio=None)
+
+    def test_registered_emails_are_added_to_the_filter(self):
+        self.assertFalse(email_maybe_taken(email="jane@example.com"))
+
+        user = self.register("Jane@Example.com")
+
+        self.assertEqual(user.email, "jane@example.com")
+        self.assertTrue(Profile.objects.filter(user=user).exists())
+        self.assertTrue(email_maybe_taken(email="jane@example.com"))
+
+    def test_duplicate_email(self):
+        self.register("jane@example.com")
+
+        with self.assertRaises(ConflictError):
+            self.register("JANE@example.com")
+
+        self.assertEqual(BaseUser.objects.filter(email="jane@example.com").count(), 1)
+
+    def test_duplicate_missing_from_the_filter_is_caught_by_the_unique_index(self):
+        # Registered while the filter was rebuilt, or while Redis was down
+        BaseUserFactory(email="jane@example.com")
+        self.assertFalse(email_maybe_taken(email="jane@example.com"))
+
+        with self.assertRaises(ConflictError):
+            self.register("jane@example.com")
+
+    def test_filter_miss_skips_the_lookup(self):
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(4):
+            # Savepoint, the user, the profile, release
+            register(email="jane@example.com", password="Tr0ub4dor&3-horse", bio=None)
+
+        with override_settings(USERS_EMAIL_BLOOM_ENABLED=False), self.assertNumQueries(5):
+            register(email="john@example.com", password="Tr0ub4dor&3-horse", bio=None)
+
+    def test_redis_down_falls_back_to_the_lookup(self):
+        with mock.patch.object(RedisBloomFilter, "__contains__", side_effect=RedisError):
+            self.assertTrue(email_maybe_taken(email="jane@example.com"))
+
+    def test_rebuild(self):
+        BaseUserFactory(email="jane@example.com")
+
+        self.assertEqual(email_bloom_rebuild(), 1)
+        self.assertTrue(email_maybe_taken(email="jane@example.com"))
+
+    def test_register_bulk_reports_duplicates(self):
+        BaseUserFactory(email="taken@example.com")
+
+        users, errors = register_bulk(users=[
+            {"email": "jane@example.com", "password": "Tr0ub4dor&3-horse"},
+            {"email": "Taken@example.com", "password": "Tr0ub4dor&3-horse"},
+            {"email": "JANE@example.com", "password": "Tr0ub4dor&3-horse"},
+        ])
+
+        self.assertEqual([user.email for user in users], ["jane@example.com"])
+        self.assertEqual(errors, {1: "email Already Taken", 2: "email is duplicated in the request"})
@@ -0,0 +1,73 @@
+import tempfile
+
+from django.contrib.auth.password_validation import UserAttributeSimilarityValidator
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from orgniaztional_ticking_api.users.models import BaseUser
+from orgniaztional_ticking_api.users.validators import PasswordPolicy, load_common_passwords
+
+
+class PasswordPolicyTests(SimpleTestCase):
+    def setUp(self):
+        self.policy = PasswordPolicy()
+        self.user = BaseUser(email="jane.doe@example.com")
+
+    def get_codes(self, password, user=None):
+        return [violation.code for violation in self.policy.get_violations(password, user)]
+
+    def test_valid_password(self):
+        self.assertEqual(self.get_codes("Tr0ub4dor&3-horse", self.user), [])
+        self.policy.validate("Tr0ub4dor&3-horse", self.user)
+
+    def test_every_violation_is_reported(self):
+        self.assertEqual(self.get_codes("password"), [
+            "password_too_short",
+            "password_must_include_number",
+            "password_must_include_special_char",
+            "password_too_common",
+        ])
+
+        with self.assertRaises(ValidationError) as context:
+            self.policy.validate("")
+
+        self.assertEqual(len(context.exception.error_list), 4)
+
+    def test_common_password_is_case_insensitive(self):
+        self.assertIn("password_too_common", self.get_codes("PASSWORD"))
+
+    def test_similar_to_user_attribute(self):
+        self.assertEqual(self.get_codes("jane.doe@example.com1", self.user), ["password_too_similar"])
+        self.assertEqual(self.get_codes("jane.doe@example.com1"), [])
+
+        violation = self.policy.get_violations("Example!2345", self.user)[0]
+        self.assertEqual(violation.params, {"verbose_name": "email address"})
+
+    def test_similarity_matches_django(self):
+        django_validator = UserAttributeSimilarityValidator(user_attributes=["email"])
+
+        for password in ["jane.doe!1", "Example!2345", "example-com9", "d0e&jane", "Tr0ub4dor&3-horse", "x!1"]:
+            with self.subTest(password=password):
+                try:
+                    django_validator.validate(password, self.user)
+                    similar = False
+                except ValidationError:
+                    similar = True
+
+                self.assertEqual(self.policy.get_similar_attribute(password, self.user) is not None, similar)
+
+    def test_custom_password_list(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as f:
+            f.write("c0rrect-horse!\n")
+            f.flush()
+
+            policy = PasswordPolicy(password_list_path=f.name)
+
+            self.assertEqual(
+                [violation.code for violation in policy.get_violations("C0rrect-Horse!")],
+                ["password_too_common"],
+            )
+
+    def test_common_passwords_are_loaded_once(self):
+        self.assertIs(load_common_passwords(), load_common_passwords())
+        self.assertIn("password", load_common_passwords())
@@ -1,8 +1,11 @@
 from django.urls import path
-from .apis import ProfileApi, RegisterApi
+from .apis import ProfileApi, RegisterApi, RegisterBulkApi
+from .async_apis import profile_api
 
 
 urlpatterns = [
     path('register/', RegisterApi.as_view(),name="register"),
+    path('register/bulk/', RegisterBulkApi.as_view(),name="register-bulk"),
     path('profile/', ProfileApi.as_view(),name="profile"),
+    path('profile/async/', profile_api,name="profile-async"),
 ]
@@ -1,29 +1,161 @@
 from django.utils.translation import gettext_lazy as _
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.contrib.auth.password_validation import CommonPasswordValidator, exceeds_maximum_length_ratio
+from django.utils.functional import cached_property
 
+import gzip
 import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
 
+ATTRIBUTE_SEPARATOR_PATTERN = re.compile(r'\W+')
 
-def number_validator(password):
-    regex = re.compile('[0-9]')
-    if regex.search(password) == None:
-        raise ValidationError(
-                _("password must include number"),
-                code="password_must_include_number"
-                )
-
-def letter_validator(password):
-    regex = re.compile('[a-zA-Z]')
-    if regex.search(password) == None:
-        raise ValidationError(
-                _("password must include letter"),
-                code="password_must_include_letter"
-                )
-
-def special_char_validator(password):
-    regex = re.compile('[@_!#$%^&*()<>?/\|}{~:]')
-    if regex.search(password) == None:
-        raise ValidationError(
+NUMBERS = frozenset('0123456789')
+LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+SPECIAL_CHARS = frozenset('@_!#$%^&*()<>?/|}{~:')
+
+
+@lru_cache(maxsize=None)
+def load_common_passwords(path: str | None = None) -> frozenset:
+    """
+    The list `CommonPasswordValidator` uses, read and decompressed once per process.
+    """
+    if path:
+        path = Path(path)
+    else:
+        path = CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH
+
+        # A `cached_property` on Django 4.0, an instance would read and decompress the list to get it
+        if isinstance(path, cached_property):
+            path = path.func(None)
+
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return frozenset(line.strip() for line in f)
+    except OSError:
+        with open(path) as f:
+            return frozenset(line.strip() for line in f)
+
+
+class PasswordPolicy:
+    """
+    The whole password policy in one validator, for `AUTH_PASSWORD_VALIDATORS`:
+    minimum length, at least one number, letter and special char, not a common password
+    and not too similar to the user's attributes.
+
+    Character classes are found in a single pass over the password, and every violation
+    is reported at once instead of stopping at the first one.
+    """
+
+    def __init__(self, min_length=10, user_attributes=("email",), max_similarity=0.7, password_list_path=None):
+        self.min_length = min_length
+        self.user_attributes = user_attributes
+        self.max_similarity = max_similarity
+        self.password_list_path = password_list_path
+
+    def get_violations(self, password, user=None):
+        violations = []
+
+        if len(password) < self.min_length:
+            violations.append(ValidationError(
+                _("password must be at least %(min_length)d characters long"),
+                code="password_too_short",
+                params={"min_length": self.min_length},
+            ))
+
+        has_number = has_letter = has_special_char = False
+
+        for char in password:
+            if char in NUMBERS:
+                has_number = True
+            elif char in LETTERS:
+                has_letter = True
+            elif char in SPECIAL_CHARS:
+                has_special_char = True
+            else:
+                continue
+
+            if has_number and has_letter and has_special_char:
+                break
+
+        if not has_number:
+            violations.append(ValidationError(_("password must include number"), code="password_must_include_number"))
+
+        if not has_letter:
+            violations.append(ValidationError(_("password must include letter"), code="password_must_include_letter"))
+
+        if not has_special_char:
+            violations.append(ValidationError(
                 _("password must include special char"),
-                code="password_must_include_special_char"
-                )
+                code="password_must_include_special_char",
+            ))
+
+        if password.lower().strip() in load_common_passwords(self.password_list_path):
+            violations.append(ValidationError(_("password is too common"), code="password_too_common"))
+
+        similar_to = self.get_similar_attribute(password, user)
+
+        if similar_to is not None:
+            violations.append(ValidationError(
+                _("password is too similar to the %(verbose_name)s"),
+                code="password_too_similar",
+                params={"verbose_name": similar_to},
+            ))
+
+        return violations
+
+    def get_similar_attribute(self, password, user):
+        """
+        Same check as `UserAttributeSimilarityValidator`, returns the verbose name of the first attribute
+        the password is too similar to.
+        """
+        if user is None:
+            return None
+
+        password = password.lower()
+        password_chars = None
+
+        for attribute_name in self.user_attributes:
+            value = getattr(user, attribute_name, None)
+
+            if not value or not isinstance(value, str):
+                continue
+
+            value = value.lower()
+
+            for part in ATTRIBUTE_SEPARATOR_PATTERN.split(value) + [value]:
+                if exceeds_maximum_length_ratio(password, self.max_similarity, part):
+                    continue
+
+                # `SequenceMatcher.quick_ratio`, without building a matcher for every part
+                if password_chars is None:
+                    password_chars = dict(Counter(password))
+
+                available = password_chars.copy()
+                matches = 0
+
+                for char in part:
+                    if available.get(char, 0) > 0:
+                        available[char] -= 1
+                        matches += 1
+
+                if 2 * matches / (len(password) + len(part)) >= self.max_similarity:
+                    try:
+                        return str(user._meta.get_field(attribute_name).verbose_name)
+                    except FieldDoesNotExist:
+                        return attribute_name
+
+        return None
+
+    def validate(self, password, user=None):
+        violations = self.get_violations(password, user)
+
+        if violations:
+            raise ValidationError(violations)
+
+    def get_help_text(self):
+        return _(
+            "Your password must be at least %(min_length)d characters long, include a number, a letter and "
+            "a special char, can't be a commonly used password or too similar to your personal information."
+        ) % {"min_length": self.min_length}
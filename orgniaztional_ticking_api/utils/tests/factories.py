@@ -0,0 +1,55 @@
+from functools import lru_cache
+
+import factory
+from django.contrib.auth.hashers import make_password
+
+from orgniaztional_ticking_api.users.models import BaseUser, Profile
+
+from .base import faker
+
+DEFAULT_PASSWORD = "Factory-password-1!"
+
+
+@lru_cache(maxsize=None)
+def get_password_hash(password: str = DEFAULT_PASSWORD) -> str:
+    """
+    Hashing is the slow part of creating users, every factory user shares one hash.
+    """
+    return make_password(password)
+
+
+class BaseUserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = BaseUser
+        django_get_or_create = ("email",)
+
+    email = factory.Sequence(lambda n: f"user-{n}@example.com")
+    password = factory.LazyFunction(get_password_hash)
+    is_active = True
+    is_admin = False
+
+
+class ProfileFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Profile
+
+    user = factory.SubFactory(BaseUserFactory)
+    bio = factory.LazyFunction(lambda: faker.sentence(nb_words=8))
+
+
+def create_users_bulk(*, count: int, batch_size: int = 5000, user_factory=BaseUserFactory, **kwargs) -> int:
+    """
+    Creates `count` users with profiles, `batch_size` at a time, with `bulk_create`.
+    `kwargs` are passed to `user_factory`.
+    """
+    created = 0
+
+    while created < count:
+        users = user_factory.build_batch(min(batch_size, count - created), **kwargs)
+        users = BaseUser.objects.bulk_create(users, batch_size=batch_size)
+
+        Profile.objects.bulk_create([ProfileFactory.build(user=user) for user in users], batch_size=batch_size)
+
+        created += len(users)
+
+    return created
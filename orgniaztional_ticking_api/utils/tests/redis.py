@@ -0,0 +1,20 @@
+from unittest import mock
+
+import fakeredis
+
+
+class FakeRedisMixin:
+    """
+    Replaces `django_redis.get_redis_connection` with an in-memory Redis, emptied before each test.
+    The code under test has to import `get_redis_connection` when it's called, not at import time.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.redis = fakeredis.FakeStrictRedis()
+        self.redis.flushall()
+
+        patcher = mock.patch("django_redis.get_redis_connection", lambda *args, **kwargs: self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
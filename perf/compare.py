@@ -0,0 +1,64 @@
+"""
+Compares two `perf/locustfile.py` result files, exits with 1 when an endpoint got slower or lost throughput
+by more than `--threshold` percent.
+
+    python perf/compare.py perf/results/<base>.json perf/results/<head>.json
+"""
+import argparse
+import json
+import sys
+
+# metric -> True when higher is better
+METRICS = {"p50_ms": False, "p95_ms": False, "p99_ms": False, "rps": True}
+
+
+def change(before, after):
+    if not before:
+        return 0.0
+
+    return (after - before) / before * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10, help="Percent")
+    args = parser.parse_args()
+
+    with open(args.base) as file:
+        base = json.load(file)
+
+    with open(args.head) as file:
+        head = json.load(file)
+
+    print(f"{base['commit']} -> {head['commit']}, {head['seeded_users']} users")
+
+    regressions = []
+
+    for name, after in sorted(head["endpoints"].items()):
+        before = base["endpoints"].get(name)
+
+        if before is None:
+            continue
+
+        columns = []
+
+        for metric, higher_is_better in METRICS.items():
+            delta = change(before[metric], after[metric])
+            worse = -delta if higher_is_better else delta
+
+            if worse > args.threshold:
+                regressions.append(f"{name} {metric}")
+
+            columns.append(f"{metric} {before[metric]} -> {after[metric]} ({delta:+.1f}%)")
+
+        print(f"{name:>12}: " + ", ".join(columns))
+
+    if regressions:
+        print("Regressions: " + ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Load test for register, JWT login / refresh / verify and profile, run by `perf/run.sh`.
+
+Needs the users created by `perf/seed.py`, `PERF_USERS` says how many there are.
+When the run ends, per endpoint stats are written as JSON to `PERF_RESULTS`, see `perf/compare.py`.
+"""
+import json
+import os
+import random
+import subprocess
+import uuid
+from datetime import datetime, timezone
+
+from locust import HttpUser, between, events, task
+
+PERF_USERS = int(os.environ.get("PERF_USERS", 10000))
+PERF_PASSWORD = os.environ.get("PERF_PASSWORD", "Perf-password-1!")
+PERF_RESULTS = os.environ.get("PERF_RESULTS")
+EMAIL_DOMAIN = "perf.example.com"
+
+
+class ApiUser(HttpUser):
+    wait_time = between(0, 0.05)
+
+    def on_start(self):
+        self.email = f"perf-{random.randrange(PERF_USERS)}@{EMAIL_DOMAIN}"
+        self.login()
+
+    def login(self):
+        with self.client.post(
+            "/api/auth/jwt/login/",
+            json={"email": self.email, "password": PERF_PASSWORD},
+            name="login",
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f"login failed with {response.status_code}")
+                self.access = self.refresh = ""
+                return
+
+            tokens = response.json()
+            self.access, self.refresh = tokens["access"], tokens["refresh"]
+
+    @task(10)
+    def profile(self):
+        self.client.get("/api/users/profile/", headers={"Authorization": f"Bearer {self.access}"}, name="profile")
+
+    @task(4)
+    def verify(self):
+        self.client.post("/api/auth/jwt/verify/", json={"token": self.access}, name="verify")
+
+    @task(2)
+    def refresh_token(self):
+        response = self.client.post("/api/auth/jwt/refresh/", json={"refresh": self.refresh}, name="refresh")
+
+        if response.status_code == 200:
+            # Refresh tokens are rotated, the one just used is revoked
+            tokens = response.json()
+            self.access, self.refresh = tokens["access"], tokens["refresh"]
+        elif response.status_code == 401:
+            self.login()
+
+    @task(1)
+    def login_again(self):
+        self.login()
+
+    @task(1)
+    def register(self):
+        # New users go to their own domain, `perf/seed.py` keeps its numbering
+        email = f"{uuid.uuid4().hex}@register.{EMAIL_DOMAIN}"
+
+        self.client.post(
+            "/api/users/register/",
+            json={"email": email, "password": PERF_PASSWORD, "confirm_password": PERF_PASSWORD, "bio": "perf"},
+            name="register",
+        )
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@events.quitting.add_listener
+def write_results(environment, **kwargs):
+    if not PERF_RESULTS:
+        return
+
+    endpoints = {}
+
+    for entry in environment.stats.entries.values():
+        endpoints[entry.name] = {
+            "method": entry.method,
+            "requests": entry.num_requests,
+            "failures": entry.num_failures,
+            "rps": round(entry.total_rps, 2),
+            "p50_ms": entry.get_response_time_percentile(0.5),
+            "p95_ms": entry.get_response_time_percentile(0.95),
+            "p99_ms": entry.get_response_time_percentile(0.99),
+            "avg_ms": round(entry.avg_response_time, 2),
+        }
+
+    results = {
+        "commit": get_commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "seeded_users": PERF_USERS,
+        "clients": environment.parsed_options.num_users if environment.parsed_options else None,
+        "endpoints": endpoints,
+    }
+
+    with open(PERF_RESULTS, "w") as file:
+        json.dump(results, file, indent=2)
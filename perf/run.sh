@@ -0,0 +1,37 @@
+#!/bin/bash
+
+# Seeds the database and load tests register, JWT login / refresh / verify and profile
+# with Locust, against gunicorn and the local Postgres (DATABASE_URL).
+#
+#   ./perf/run.sh 10000      # or 100000, 1000000
+#
+# Results go to perf/results/<commit>-<users>.json, compare two runs with perf/compare.py.
+
+set -e
+
+SEEDED_USERS="${1:-10000}"
+CLIENTS="${CLIENTS:-50}"
+SPAWN_RATE="${SPAWN_RATE:-10}"
+DURATION="${DURATION:-60s}"
+WORKERS="${WORKERS:-4}"
+PORT="${PORT:-8010}"
+
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-config.django.local}"
+export PERF_USERS="$SEEDED_USERS"
+
+mkdir -p perf/results
+export PERF_RESULTS="perf/results/$(git rev-parse --short HEAD)-$SEEDED_USERS.json"
+
+python manage.py migrate --noinput
+python perf/seed.py --users "$SEEDED_USERS"
+
+gunicorn config.wsgi:application -w "$WORKERS" -b "127.0.0.1:$PORT" --log-level warning &
+GUNICORN_PID=$!
+trap 'kill $GUNICORN_PID' EXIT
+
+./wait-for-it.sh "127.0.0.1:$PORT" -t 30
+
+locust -f perf/locustfile.py --headless --host "http://127.0.0.1:$PORT" \
+  --users "$CLIENTS" --spawn-rate "$SPAWN_RATE" --run-time "$DURATION" --only-summary
+
+echo "Results: $PERF_RESULTS"
@@ -0,0 +1,60 @@
+"""
+Tops up the database to `--users` load test users, `perf-<n>@perf.example.com` for n in [0, --users).
+All of them have the password `PERF_PASSWORD`.
+
+    python perf/seed.py --users 100000
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.local")
+
+import django  # noqa: E402
+
+django.setup()
+
+import factory  # noqa: E402
+
+from orgniaztional_ticking_api.users.models import BaseUser  # noqa: E402
+from orgniaztional_ticking_api.utils.tests.factories import (  # noqa: E402
+    BaseUserFactory,
+    create_users_bulk,
+    get_password_hash,
+)
+
+EMAIL_DOMAIN = "perf.example.com"
+PERF_PASSWORD = os.environ.get("PERF_PASSWORD", "Perf-password-1!")
+
+
+class PerfUserFactory(BaseUserFactory):
+    email = factory.Sequence(lambda n: f"perf-{n}@{EMAIL_DOMAIN}")
+    password = factory.LazyFunction(lambda: get_password_hash(PERF_PASSWORD))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, required=True)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    existing = BaseUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").count()
+
+    if existing >= args.users:
+        print(f"{existing} perf users already there")
+        return
+
+    start = time.perf_counter()
+
+    # Subclasses share the sequence of their root factory
+    BaseUserFactory.reset_sequence(existing)
+    created = create_users_bulk(count=args.users - existing, batch_size=args.batch_size, user_factory=PerfUserFactory)
+
+    print(f"Created {created} perf users in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
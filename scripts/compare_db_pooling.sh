@@ -0,0 +1,59 @@
+#!/bin/bash
+
+# Runs the same load against gunicorn with a new database connection per request (DATABASE_CONN_MAX_AGE=0)
+# and with persistent connections. Needs a migrated database and an existing user:
+#
+#   ./scripts/compare_db_pooling.sh user@example.com 'password'
+#
+# Only endpoints that query the database on every request are used: login (loads the user) and register
+# (inserts). Cached endpoints like the profile don't open a connection on a hit.
+# Results are printed as one JSON line per run and appended to perf/results/db-pooling-<commit>.jsonl.
+
+set -e
+
+EMAIL="$1"
+PASSWORD="$2"
+WORKERS="${WORKERS:-4}"
+CONCURRENCY="${CONCURRENCY:-64}"
+DURATION="${DURATION:-30}"
+CONN_MAX_AGE="${CONN_MAX_AGE:-600}"
+UNPOOLED_PORT=8003
+POOLED_PORT=8004
+
+if [[ -z "$EMAIL" || -z "$PASSWORD" ]]
+then
+  echo "Call `basename $0` with an existing user's email and password."
+  exit 1
+fi
+
+DATABASE_CONN_MAX_AGE=0 gunicorn config.wsgi:application -w "$WORKERS" -b "127.0.0.1:$UNPOOLED_PORT" --log-level warning &
+UNPOOLED_PID=$!
+DATABASE_CONN_MAX_AGE="$CONN_MAX_AGE" gunicorn config.wsgi:application -w "$WORKERS" -b "127.0.0.1:$POOLED_PORT" --log-level warning &
+POOLED_PID=$!
+trap 'kill $UNPOOLED_PID $POOLED_PID' EXIT
+
+./wait-for-it.sh "127.0.0.1:$UNPOOLED_PORT" -t 30
+./wait-for-it.sh "127.0.0.1:$POOLED_PORT" -t 30
+
+CREDENTIALS="{\"email\": \"$EMAIL\", \"password\": \"$PASSWORD\"}"
+
+mkdir -p perf/results
+RESULTS="perf/results/db-pooling-$(git rev-parse --short HEAD).jsonl"
+
+run() {
+  python scripts/loadtest.py --concurrency "$CONCURRENCY" --duration "$DURATION" "$@" | tee -a "$RESULTS"
+}
+
+for PORT in $UNPOOLED_PORT $POOLED_PORT
+do
+  if [[ "$PORT" == "$UNPOOLED_PORT" ]]; then MODE="unpooled"; else MODE="pooled"; fi
+
+  run --label "$MODE login" --method POST --data "$CREDENTIALS" "http://127.0.0.1:$PORT/api/auth/jwt/login/"
+
+  # Every request registers a new user, `{n}` is replaced with a unique number by loadtest.py
+  run --label "$MODE register" --method POST \
+    --data "{\"email\": \"$MODE-{n}@loadtest.example.com\", \"password\": \"$PASSWORD\", \"confirm_password\": \"$PASSWORD\"}" \
+    "http://127.0.0.1:$PORT/api/users/register/"
+done
+
+echo "Results: $RESULTS"
@@ -0,0 +1,50 @@
+#!/bin/bash
+
+# Runs the same load against sync gunicorn workers and ASGI (uvicorn) workers on this machine.
+# Needs a migrated database and an existing user:
+#
+#   ./scripts/compare_wsgi_asgi.sh user@example.com 'password'
+#
+# Results are printed as one JSON line per run.
+
+set -e
+
+EMAIL="$1"
+PASSWORD="$2"
+WORKERS="${WORKERS:-4}"
+CONCURRENCY="${CONCURRENCY:-64}"
+DURATION="${DURATION:-30}"
+WSGI_PORT=8001
+ASGI_PORT=8002
+
+if [[ -z "$EMAIL" || -z "$PASSWORD" ]]
+then
+  echo "Call `basename $0` with an existing user's email and password."
+  exit 1
+fi
+
+gunicorn config.wsgi:application -w "$WORKERS" -b "127.0.0.1:$WSGI_PORT" --log-level warning &
+WSGI_PID=$!
+gunicorn config.asgi:application -w "$WORKERS" -k uvicorn.workers.UvicornWorker -b "127.0.0.1:$ASGI_PORT" --log-level warning &
+ASGI_PID=$!
+trap 'kill $WSGI_PID $ASGI_PID' EXIT
+
+./wait-for-it.sh "127.0.0.1:$WSGI_PORT" -t 30
+./wait-for-it.sh "127.0.0.1:$ASGI_PORT" -t 30
+
+CREDENTIALS="{\"email\": \"$EMAIL\", \"password\": \"$PASSWORD\"}"
+TOKEN=$(curl -s -X POST -H "Content-Type: application/json" -d "$CREDENTIALS" \
+  "http://127.0.0.1:$WSGI_PORT/api/auth/jwt/login/" | python -c "import json, sys; print(json.load(sys.stdin)['access'])")
+
+run() {
+  python scripts/loadtest.py --concurrency "$CONCURRENCY" --duration "$DURATION" "$@"
+}
+
+run --label "wsgi profile" -H "Authorization: Bearer $TOKEN" "http://127.0.0.1:$WSGI_PORT/api/users/profile/"
+run --label "asgi profile" -H "Authorization: Bearer $TOKEN" "http://127.0.0.1:$ASGI_PORT/api/users/profile/async/"
+
+run --label "wsgi verify" --method POST --data "{\"token\": \"$TOKEN\"}" "http://127.0.0.1:$WSGI_PORT/api/auth/jwt/verify/"
+run --label "asgi verify" --method POST --data "{\"token\": \"$TOKEN\"}" "http://127.0.0.1:$ASGI_PORT/api/auth/jwt/async/verify/"
+
+run --label "wsgi login" --method POST --data "$CREDENTIALS" "http://127.0.0.1:$WSGI_PORT/api/auth/jwt/login/"
+run --label "asgi login" --method POST --data "$CREDENTIALS" "http://127.0.0.1:$ASGI_PORT/api/auth/jwt/async/login/"
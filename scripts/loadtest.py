@@ -0,0 +1,129 @@
+"""
+Minimal closed-loop HTTP load generator, stdlib only.
+
+Every client keeps one keep-alive connection and sends requests back to back for `--duration` seconds.
+Prints a JSON summary (requests per second and latency percentiles in milliseconds).
+`{n}` in `--data` is replaced with a number that is unique per request, e.g. to register new users.
+
+    python scripts/loadtest.py http://localhost:8000/api/users/profile/ \
+        --header "Authorization: Bearer <token>" --concurrency 32 --duration 30
+"""
+import argparse
+import http.client
+import itertools
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(values, q):
+    if not values:
+        return None
+
+    index = min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))
+    return round(values[index] * 1000, 2)
+
+
+def client(url, method, body, headers, deadline, latencies, errors, counter):
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(parts.netloc, timeout=30)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+    while time.monotonic() < deadline:
+        request_body = body
+
+        if body is not None and "{n}" in body:
+            request_body = body.replace("{n}", str(next(counter)))
+
+        start = time.perf_counter()
+
+        try:
+            connection.request(method, path, body=request_body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(None)
+            connection.close()
+            continue
+
+        latencies.append(time.perf_counter() - start)
+
+        if response.status >= 400:
+            errors.append(response.status)
+
+    connection.close()
+
+
+def run(*, url, method="GET", body=None, headers=None, concurrency=16, duration=10):
+    headers = dict(headers or {})
+
+    if body is not None:
+        headers.setdefault("Content-Type", "application/json")
+
+    latencies = []
+    errors = []
+    deadline = time.monotonic() + duration
+    counter = itertools.count()
+
+    threads = [
+        threading.Thread(target=client, args=(url, method, body, headers, deadline, latencies, errors, counter))
+        for _ in range(concurrency)
+    ]
+
+    started = time.monotonic()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.monotonic() - started
+    latencies.sort()
+
+    return {
+        "url": url,
+        "method": method,
+        "concurrency": concurrency,
+        "duration": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--data", help="JSON request body")
+    parser.add_argument("-H", "--header", action="append", default=[], help='"Name: value", can be repeated')
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--label", help="Added to the output, to tell runs apart")
+    args = parser.parse_args()
+
+    headers = dict(header.split(": ", 1) for header in args.header)
+
+    result = run(
+        url=args.url,
+        method=args.method,
+        body=args.data,
+        headers=headers,
+        concurrency=args.concurrency,
+        duration=args.duration,
+    )
+
+    if args.label:
+        result["label"] = args.label
+
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()